@@ -1,7 +1,8 @@
 """ECTOR - extract eCommerce products and a budget from free text using NLP."""
 
-from ector.api import extract, extract_sync
+from ector.api import aextract_many, extract, extract_many, extract_sync
+from ector.preload import warmup
 
 __version__ = "0.1.2"
 
-__all__ = ["extract", "extract_sync", "__version__"]
+__all__ = ["extract", "extract_sync", "extract_many", "aextract_many", "warmup", "__version__"]
@@ -2,9 +2,22 @@
 
 Thin coordinator that wires together the focused modules (money, products,
 budget, triggers, languages, models, text_utils). The heavy lifting is
-synchronous (``extract_sync``); the historical ``extract`` coroutine simply wraps
-it so existing ``asyncio.run(extract(...))`` callers keep working (SMELL-001,
-D-06-1).
+synchronous (``extract_sync``); the historical ``extract`` coroutine runs it on
+a bounded worker pool (:mod:`ector.executor`) so existing
+``asyncio.run(extract(...))`` callers keep working (SMELL-001, D-06-1) and async
+services are not blocked for the duration of a parse.
+
+Each sentence is classified into a span-free record (signals + unpriced
+products); ``_assemble`` then reconciles prices across sentences. Records can be
+memoized per clause (``ECTOR_CLAUSE_CACHE_SIZE``) so requests that recombine
+already-seen clauses only parse the new ones. With ``mode="tiered"`` records are
+first built from the tokenizer alone (:mod:`ector.shallow`) and the full parse
+only runs when that tier reports an ambiguity; ``mode="rules"`` always answers
+from that tier, on a blank spaCy tokenizer, and needs no installed model. Bulk
+callers use ``extract_many`` / ``aextract_many``, which share the same rule
+layer but parse inputs in batches through spaCy's ``nlp.pipe``. Every parse goes through
+``_parse``, which serves docs from the optional on-disk doc cache
+(:mod:`ector.doc_cache`) when one is configured.
 
 Result schema (normative, see docs/features/06-public-api.md)::
 
@@ -19,17 +32,26 @@ Result schema (normative, see docs/features/06-public-api.md)::
 
 from __future__ import annotations
 
+import asyncio
 import copy
 import os
 import re
-from functools import lru_cache
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from itertools import islice
 
+from ector import instrument
 from ector.attributes import detect_attributes, detect_brand, detect_condition
 from ector.budget import build_budget, is_budget
+from ector.cache import LRUCache, estimate_size
+from ector.cascade import CascadeStats, low_confidence
 from ector.constraints import parse_constraint
+from ector.doc_cache import get_doc_cache
+from ector.executor import get_executor
+from ector.fields import ALL_FIELDS, PRODUCT_FIELDS, parse_fields, wants_products
 from ector.intent import classify_intent
-from ector.languages import get_language
-from ector.models import get_model
+from ector.languages import LanguageConfig, get_language
+from ector.models import checkout_model, get_blank_model
 from ector.money import is_currency_only, normalize_currency, parse_price
 from ector.normalize import normalize_vocabulary
 from ector.products import (
@@ -40,13 +62,22 @@ from ector.products import (
     find_preposition_price,
     product_spec_text,
 )
-from ector.text_utils import clean_phrase, normalize_text
+from ector.profiles import DEFAULT_PROFILE, resolve_profile
+from ector.results import CachedResult, check_mode, render
+from ector.shallow import TierStats, ambiguity, annotate
+from ector.span_model import sentence_spans, span_phrase, span_quantity
+from ector.text_utils import clean_phrase, normalize_text, split_clauses
 from ector.triggers import contains_trigger
 from ector.types import ExtractResult, Product
 
 _WORD_RE = re.compile(r"[^\W\d_]+", re.UNICODE)
 _DEFAULT_EXTRACT_CACHE_SIZE = 2048
+_DEFAULT_EXTRACT_CACHE_BYTES = 64 * 1024 * 1024
 _DEFAULT_EXTRACT_CACHE_TEXT_LIMIT = 1400
+_EMPTY_RESULT: ExtractResult = {"products": [], "intent": "browse"}
+EXTRACT_MODES = ("full", "tiered", "rules")
+# Texts per ``nlp.pipe`` call in bulk extraction (also the default of ector.parallel).
+DEFAULT_BATCH_SIZE = 256
 
 
 def _env_int(name: str, default: int) -> int:
@@ -61,11 +92,43 @@ def _env_int(name: str, default: int) -> int:
     return max(0, value)
 
 
-_EXTRACT_CACHE_SIZE = _env_int("ECTOR_EXTRACT_CACHE_SIZE", _DEFAULT_EXTRACT_CACHE_SIZE)
+def _env_float(name: str, default: float) -> float:
+    """Read a non-negative float env var, with a safe fallback."""
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        return default
+    return max(0.0, value)
+
+
+def _cached_result_size(key: tuple, entry: CachedResult) -> int:
+    # The lazily rendered frozen/JSON views are not counted.
+    return estimate_size(key[0]) + estimate_size(entry.value)
+
+
+# Whole-request results for short inputs, keyed by
+# (normalized text, language, mode, field set).
+_EXTRACT_CACHE = LRUCache(
+    _env_int("ECTOR_EXTRACT_CACHE_SIZE", _DEFAULT_EXTRACT_CACHE_SIZE),
+    maxbytes=_env_int("ECTOR_EXTRACT_CACHE_BYTES", _DEFAULT_EXTRACT_CACHE_BYTES),
+    ttl=_env_float("ECTOR_EXTRACT_CACHE_TTL", 0.0),
+    sizeof=_cached_result_size,
+)
 _EXTRACT_CACHE_TEXT_LIMIT = _env_int(
     "ECTOR_EXTRACT_CACHE_TEXT_LIMIT",
     _DEFAULT_EXTRACT_CACHE_TEXT_LIMIT,
 )
+# Clause-level memo of sentence records, keyed by (clause text, language). Off
+# by default: clauses are then parsed in isolation rather than in the context of
+# the whole request, which can shift a few borderline parses.
+_CLAUSE_CACHE = LRUCache(_env_int("ECTOR_CLAUSE_CACHE_SIZE", 0))
+_TIER_STATS = TierStats()
+# Enough of a product to tell whether a sentence has one, without the enrichment.
+_NAME_ONLY = frozenset({"product"})
+_CASCADE_STATS = CascadeStats()
 
 
 def _normalize_lang(raw_lang: str | None) -> str:
@@ -75,106 +138,481 @@ def _normalize_lang(raw_lang: str | None) -> str:
     return str(raw_lang).strip().lower()
 
 
-@lru_cache(maxsize=_EXTRACT_CACHE_SIZE)
-def _extract_cached(normalized_text: str, lang_code: str) -> ExtractResult:
-    """Cached extraction path for short repeated inputs."""
-    return _extract_from_normalized(normalized_text, lang_code)
+def _check_extract_mode(mode: str) -> str:
+    if mode not in EXTRACT_MODES:
+        raise ValueError(f"mode must be one of {EXTRACT_MODES}, got {mode!r}")
+    return mode
+
+
+def _extract_cached(
+    normalized_text: str,
+    lang_code: str,
+    mode: str = "full",
+    fields: frozenset[str] = ALL_FIELDS,
+    profile: str = "accurate",
+) -> CachedResult:
+    """Cached extraction path for short repeated inputs.
+
+    Keyed by field set, profile and the language's cascade models too, so
+    :func:`ector.languages.configure_cascade` never serves a stale answer.
+    ``mode="rules"`` loads no pipeline, so its entries share one profile.
+    """
+    if mode == "rules":
+        profile = DEFAULT_PROFILE
+    key = (normalized_text, lang_code, mode, fields, profile, get_language(lang_code).cascade_models)
+    entry = _EXTRACT_CACHE.get(key)
+    if entry is not None:
+        instrument.count("extract_cache_hit")
+        return entry
+    instrument.count("extract_cache_miss")
+    if mode == "tiered":
+        entry = CachedResult(_extract_tiered(normalized_text, lang_code, fields, profile))
+    elif mode == "rules":
+        entry = CachedResult(_extract_rules(normalized_text, lang_code, fields))
+    else:
+        entry = CachedResult(
+            _extract_from_normalized(normalized_text, lang_code, fields, profile)
+        )
+    _EXTRACT_CACHE.put(key, entry)
+    return entry
+
+
+def extract_cache_info() -> dict:
+    """Counters, entry count and estimated bytes of the whole-request cache.
+
+    Keys: ``hits``, ``misses``, ``hit_ratio``, ``evictions``, ``expirations``,
+    ``size``, ``maxsize``, ``bytes``, ``maxbytes``, ``ttl``.
+    """
+    return _EXTRACT_CACHE.info()
+
+
+def resize_extract_cache(
+    maxsize: int | None = None,
+    *,
+    maxbytes: int | None = None,
+    ttl: float | None = None,
+) -> None:
+    """Change the whole-request cache bounds at runtime (``None`` keeps one).
+
+    ``maxsize=0`` disables the cache; ``maxbytes=0`` / ``ttl=0`` remove the
+    byte bound / expiry.
+    """
+    _EXTRACT_CACHE.resize(maxsize, maxbytes=maxbytes, ttl=ttl)
+    if _EXTRACT_CACHE.maxsize == 0:
+        _EXTRACT_CACHE.clear()
+
+
+def clear_extract_cache() -> None:
+    """Drop every cached result and reset the counters."""
+    _EXTRACT_CACHE.clear()
+
+
+def clause_cache_info() -> dict[str, int]:
+    """Hit/miss/eviction counters and size of the clause-level cache."""
+    return _CLAUSE_CACHE.info()
 
 
-def _extract_from_normalized(normalized_text: str, lang_code: str) -> ExtractResult:
+def resize_clause_cache(maxsize: int) -> None:
+    """Enable (``maxsize > 0``), resize or disable (``0``) the clause cache."""
+    _CLAUSE_CACHE.resize(maxsize)
+    if maxsize <= 0:
+        _CLAUSE_CACHE.clear()
+    # Whole-text results computed under the other setting must not leak through.
+    _EXTRACT_CACHE.clear()
+
+
+def _extract_from_normalized(
+    normalized_text: str,
+    lang_code: str,
+    fields: frozenset[str] = ALL_FIELDS,
+    profile: str | None = None,
+) -> ExtractResult:
     """Run the full extraction pipeline on already-normalized text."""
     config = get_language(lang_code)
-    nlp = get_model(config.model_name)
-    records = []
-
-    for sent in nlp(normalized_text).sents:
-        text = sent.text.strip()
-        if text:
-            records.append(_classify_sentence(sent, config))
-
-    # Price-tail reconciliation: a clause that has a price but no product and is
-    # Reconciliation across comma/sentence splits. A "price tail" is a clause
-    # that carries a price but no product, trigger, or budget keyword (e.g.
-    # "..., 304 cad max", or just "20 £" split off from "je n'ai que").
-    for i, rec in enumerate(records):
-        is_price_tail = (
-            rec["price"] is not None
-            and not rec["product_tokens"]
-            and not rec["has_trigger"]
-            and not rec["is_budget"]
+    records = _text_records([normalized_text], config, fields, profile)[0]
+    return _assemble(records, normalized_text, config, fields)
+
+
+def _text_records(
+    normalized_texts: list[str],
+    config: LanguageConfig,
+    fields: frozenset[str] = ALL_FIELDS,
+    profile: str | None = None,
+    batch_size: int | None = None,
+) -> list[list[dict]]:
+    """Sentence records of each text from the full pipeline.
+
+    Served from the clause cache when it is enabled, else parsed together.
+    Low-confidence texts then go through the language's model cascade.
+    """
+    if _CLAUSE_CACHE.maxsize > 0:
+        record_lists = _clause_records(normalized_texts, config, fields, profile)
+    else:
+        docs = _parse(normalized_texts, config, profile, batch_size)
+        record_lists = [_doc_records(doc, config, fields) for doc in docs]
+    if config.cascade_models:
+        record_lists = _cascade(normalized_texts, record_lists, config, fields, profile, batch_size)
+    return record_lists
+
+
+def _cascade(
+    normalized_texts: list[str],
+    record_lists: list[list[dict]],
+    config: LanguageConfig,
+    fields: frozenset[str] = ALL_FIELDS,
+    profile: str | None = None,
+    batch_size: int | None = None,
+) -> list[list[dict]]:
+    """Re-parse low-confidence texts with ``config.cascade_models``, in order.
+
+    A text stops at the first model whose records raise no
+    :func:`~ector.cascade.low_confidence` signal; the last model's records are
+    kept otherwise. Cascaded parses bypass the clause cache.
+    """
+    record_lists = list(record_lists)
+    todo = []
+    for i, records in enumerate(record_lists):
+        reason = low_confidence(records)
+        _CASCADE_STATS.record_check(reason)
+        if reason is not None:
+            todo.append(i)
+    instrument.count("cascade", len(todo))
+    for model_name in config.cascade_models:
+        if not todo:
+            break
+        start = time.perf_counter()
+        docs = _parse([normalized_texts[i] for i in todo], config, profile, batch_size, model_name)
+        unresolved = []
+        for i, doc in zip(todo, docs, strict=True):
+            record_lists[i] = _doc_records(doc, config, fields)
+            if low_confidence(record_lists[i]) is not None:
+                unresolved.append(i)
+        _CASCADE_STATS.record_stage(
+            model_name, len(todo), len(todo) - len(unresolved), time.perf_counter() - start
         )
-        if not is_price_tail or i == 0:
-            continue
-        prev = records[i - 1]
-        # (a) previous clause is a budget keyword without a price -> form budget
-        if prev["is_budget"] and prev["price"] is None:
-            prev["price"] = rec["price"]
-            prev["currency"] = rec["currency"]
-            rec["consumed"] = True
-        # (b) previous clause has products/trigger but no price -> lend price
-        elif prev["price"] is None and (prev["product_tokens"] or prev["has_trigger"]):
-            prev["price"] = rec["price"]
-            prev["currency"] = rec["currency"]
-            rec["consumed"] = True
+        todo = unresolved
+    return record_lists
 
-    products: list[Product] = []
-    budget = None
 
-    for idx, rec in enumerate(records):
-        if rec.get("consumed"):
-            continue
+def cascade_stats() -> dict:
+    """Cascade rate, reasons, per-model resolutions and the time spent re-parsing."""
+    return _CASCADE_STATS.snapshot()
+
+
+def reset_cascade_stats() -> None:
+    _CASCADE_STATS.reset()
+
+
+def _parse(
+    normalized_texts: list[str],
+    config: LanguageConfig,
+    profile: str | None = None,
+    batch_size: int | None = None,
+    model_name: str | None = None,
+) -> list:
+    """Parse ``normalized_texts`` with the language's pipeline, in order.
+
+    ``model_name`` overrides ``config.model_name`` (cascade re-parses).
+
+    With a doc cache configured, texts already parsed by this model, version
+    and profile are read from it and only the rest reach spaCy (one text via
+    ``nlp(...)``, several via ``nlp.pipe``); fresh docs are added to it.
+    """
+    profile = resolve_profile(profile)
+    doc_cache = get_doc_cache()
+    with checkout_model(model_name or config.model_name, profile) as nlp:
+        docs = [None] * len(normalized_texts)
+        if doc_cache is not None:
+            for i, text in enumerate(normalized_texts):
+                docs[i] = doc_cache.get(nlp, profile, text)
+            instrument.count("doc_cache_hit", sum(doc is not None for doc in docs))
+        missing = [i for i, doc in enumerate(docs) if doc is None]
+        if doc_cache is not None:
+            instrument.count("doc_cache_miss", len(missing))
+        if missing:
+            with instrument.stage("spacy"):
+                if len(missing) == 1:
+                    parsed = [nlp(normalized_texts[missing[0]])]
+                else:
+                    parsed = list(
+                        nlp.pipe((normalized_texts[i] for i in missing), batch_size=batch_size)
+                    )
+            for i, doc in zip(missing, parsed, strict=True):
+                docs[i] = doc
+                if doc_cache is not None:
+                    doc_cache.put(nlp, profile, doc)
+    return docs
+
+
+def tier_stats() -> dict:
+    """Fast-path/escalation counters and estimated time saved by ``mode="tiered"``.
+
+    Cache hits are not counted: they skip both tiers.
+    """
+    return _TIER_STATS.snapshot()
+
+
+def reset_tier_stats() -> None:
+    _TIER_STATS.reset()
+
 
-        # Budget sentence with a price -> record budget, skip products.
-        if rec["is_budget"]:
-            # Prefer a reconciled price (from a split-off tail clause); else
-            # parse the budget text directly, and if that fails, parse the budget
-            # text joined with the next clause (spaCy sometimes splits an amount
-            # and its currency, e.g. "budget de 9" + "usd").
-            if rec["price"] is not None:
-                new_budget = build_budget(rec["price"], rec["currency"])
+def _shallow_records(
+    normalized_text: str,
+    config: LanguageConfig,
+    fields: frozenset[str] = ALL_FIELDS,
+    escalate: bool = True,
+) -> tuple[list[dict] | None, str | None]:
+    """Tokenizer-only sentence records, or ``(None, reason)`` to escalate.
+
+    Clauses come from :func:`split_clauses` instead of the parser's sentence
+    boundaries and are tokenized by the blank pipeline, so this tier neither
+    loads nor borrows the full model. The records have the same shape as
+    :func:`_classify_sentence`'s, with the fallback products standing in for
+    the dependency-based ones. With ``escalate=False`` (``mode="rules"``) the
+    records are returned whatever the ambiguity checks say.
+    """
+    clauses = split_clauses(normalized_text)
+    tokenizer = get_blank_model(config.code).tokenizer
+    with instrument.stage("tokenize"):
+        docs = [tokenizer(clause) for clause in clauses]
+    records: list[dict] = []
+    for clause, doc in zip(clauses, docs, strict=True):
+        doc = annotate(doc, config)
+        reason = ambiguity(doc, config) if escalate else None
+        if reason is not None:
+            return None, reason
+        text = clause.strip()
+        price, currency = parse_price(text, lang=config.code)
+        # Always built (enrichment follows ``fields``): whether the clause has
+        # a product decides escalation even when ``fields`` leave products out.
+        products = _build_products_for_sentence(doc, [], config, fields)
+        has_trigger = contains_trigger(text, config)
+        budget_clause = is_budget(text, config)
+        if escalate and has_trigger and not products:
+            return None, "trigger_without_product"
+        if escalate and budget_clause and products:
+            return None, "budget_with_product"
+        records.append({
+            "text": text,
+            "price": price,
+            "currency": currency,
+            "has_trigger": has_trigger,
+            "has_product_tokens": bool(products),
+            "has_products": bool(products),
+            "is_budget": budget_clause,
+            "products": products if wants_products(fields) else [],
+        })
+    return records, None
+
+
+def _extract_tiered(
+    normalized_text: str,
+    lang_code: str,
+    fields: frozenset[str] = ALL_FIELDS,
+    profile: str | None = None,
+) -> ExtractResult:
+    """Answer from the tokenizer-only tier, escalating to the full pipeline."""
+    config = get_language(lang_code)
+    start = time.perf_counter()
+    records, reason = _shallow_records(normalized_text, config, fields)
+    if records is not None:
+        result = _assemble(records, normalized_text, config, fields)
+        _TIER_STATS.record_fast(time.perf_counter() - start)
+        return result
+    shallow_done = time.perf_counter()
+    result = _extract_from_normalized(normalized_text, lang_code, fields, profile)
+    _TIER_STATS.record_escalation(
+        reason, shallow_done - start, time.perf_counter() - shallow_done
+    )
+    return result
+
+
+def _extract_rules(
+    normalized_text: str,
+    lang_code: str,
+    fields: frozenset[str] = ALL_FIELDS,
+) -> ExtractResult:
+    """Answer from the tokenizer-only tier without a statistical model."""
+    config = get_language(lang_code)
+    records, _ = _shallow_records(normalized_text, config, fields, escalate=False)
+    return _assemble(records, normalized_text, config, fields)
+
+
+def _doc_records(doc, config: LanguageConfig, fields: frozenset[str] = ALL_FIELDS) -> list[dict]:
+    """Classify every non-empty sentence of a parsed ``doc``."""
+    return [
+        _classify_sentence(sent, config, fields) for sent in doc.sents if sent.text.strip()
+    ]
+
+
+def _clause_records(
+    normalized_texts: list[str],
+    config: LanguageConfig,
+    fields: frozenset[str] = ALL_FIELDS,
+    profile: str | None = None,
+) -> list[list[dict]]:
+    """Sentence records for each text, served from the clause cache.
+
+    Each text is split into clauses (:func:`split_clauses`); only clauses not yet
+    cached for this language are parsed, together in one ``nlp.pipe`` call. The
+    records of a clause do not depend on the surrounding text, so chat-style
+    traffic that recombines the same clauses is mostly served from memory.
+    Returned records are shallow copies, safe for :func:`_assemble` to mutate.
+    """
+    profile = resolve_profile(profile)
+    clause_lists = [split_clauses(text) for text in normalized_texts]
+    found: dict[str, tuple[dict, ...]] = {}
+    missing: list[str] = []
+    for clauses in clause_lists:
+        for clause in clauses:
+            if clause in found:
+                continue
+            cached = _CLAUSE_CACHE.get((clause, config.code, config.cascade_models, fields, profile))
+            if cached is None:
+                missing.append(clause)
+                found[clause] = ()
             else:
-                new_budget = _budget_from_text(rec["text"], config.code)
-                if new_budget is None and idx + 1 < len(records):
-                    joined = rec["text"] + " " + records[idx + 1]["text"]
-                    new_budget = _budget_from_text(joined, config.code)
-                    if new_budget is not None and not records[idx + 1]["product_tokens"]:
-                        records[idx + 1]["consumed"] = True
-            if new_budget is not None:
-                budget = new_budget
-                # A budget sentence may still mention a product ("budget 200 for
-                # a laptop"); only skip if it has no product signal.
-                if not rec["product_tokens"]:
-                    fb = _build_products_for_sentence(rec, config, None, None)
-                    if not fb:
-                        continue
-
-        # Build products for this sentence (dependency + token fallback). The
-        # fallback runs even without an explicit trigger so content-only clauses
-        # (e.g. a comma-split tail like "d'un batterie et google") are captured.
-        sentence_products = _build_products_for_sentence(
-            rec, config, rec["price"], rec["currency"]
-        )
-        if not rec["is_budget"]:
-            products.extend(sentence_products)
-        elif rec["product_tokens"]:
-            # budget sentence that also names a product
-            products.extend(sentence_products)
-
-    result: ExtractResult = {"products": products}
-    if budget is not None:
+                found[clause] = cached
+    instrument.count("clause_cache_hit", len(found) - len(missing))
+    instrument.count("clause_cache_miss", len(missing))
+
+    if missing:
+        docs = _parse(missing, config, profile)
+        for clause, doc in zip(missing, docs, strict=True):
+            records = tuple(_doc_records(doc, config, fields))
+            _CLAUSE_CACHE.put((clause, config.code, config.cascade_models, fields, profile), records)
+            found[clause] = records
+
+    return [
+        [dict(rec) for clause in clauses for rec in found[clause]]
+        for clauses in clause_lists
+    ]
+
+
+def _assemble(
+    records: list[dict],
+    normalized_text: str,
+    config: LanguageConfig,
+    fields: frozenset[str] = ALL_FIELDS,
+) -> ExtractResult:
+    """Reconcile sentence records into the final result (limited to ``fields``)."""
+    products: list[Product] = []
+    budget = None
+    for kind, value in _assembled_items(records, config):
+        if kind == "product":
+            products.append(value)
+        else:
+            budget = value
+
+    result: ExtractResult = {
+        "products": [_project_product(product, fields) for product in products]
+        if "product" in fields
+        else []
+    }
+    if budget is not None and "budget" in fields:
         result["budget"] = budget
 
     # Price constraint (max/min/around/between) parsed from the corrected text.
-    constraint = parse_constraint(normalized_text)
-    if constraint is not None:
-        result["price_constraint"] = constraint
+    if "price_constraint" in fields:
+        with instrument.stage("parse_constraint"):
+            constraint = parse_constraint(normalized_text)
+        if constraint is not None:
+            result["price_constraint"] = constraint
 
     # Coarse intent classification.
-    result["intent"] = classify_intent(normalized_text, has_products=bool(products))
+    if "intent" in fields:
+        with instrument.stage("classify_intent"):
+            result["intent"] = classify_intent(normalized_text, has_products=bool(products))
 
     return result
 
 
+def _project_product(product: Product, fields: frozenset[str]) -> Product:
+    """``product`` limited to the selected product ``fields``."""
+    if PRODUCT_FIELDS <= fields:
+        return product
+    return {key: value for key, value in product.items() if key in fields}
+
+
+def _assembled_items(records: Iterable[dict], config: LanguageConfig) -> Iterator[tuple[str, object]]:
+    """Reconcile a stream of sentence records into ``("product" | "budget", value)``.
+
+    Needs only one record of lookahead: a record is final once its successor
+    has been checked for a price tail, so long documents can be assembled
+    incrementally (:mod:`ector.stream`) with the same result as a single pass.
+    """
+    prev = None
+    for rec in records:
+        if prev is not None:
+            _lend_price_tail(prev, rec)
+            yield from _record_items(prev, rec, config)
+        prev = rec
+    if prev is not None:
+        yield from _record_items(prev, None, config)
+
+
+def _lend_price_tail(prev: dict, rec: dict) -> None:
+    """Price-tail reconciliation across comma/sentence splits.
+
+    A "price tail" is a clause that carries a price but no product, trigger, or
+    budget keyword (e.g. "..., 304 cad max", or just "20 £" split off from "je
+    n'ai que"); it lends its price to the previous clause.
+    """
+    is_price_tail = (
+        rec["price"] is not None
+        and not rec["has_product_tokens"]
+        and not rec["has_trigger"]
+        and not rec["is_budget"]
+    )
+    if not is_price_tail:
+        return
+    # (a) previous clause is a budget keyword without a price -> form budget
+    if prev["is_budget"] and prev["price"] is None:
+        prev["price"] = rec["price"]
+        prev["currency"] = rec["currency"]
+        rec["consumed"] = True
+    # (b) previous clause has products/trigger but no price -> lend price
+    elif prev["price"] is None and (prev["has_product_tokens"] or prev["has_trigger"]):
+        prev["price"] = rec["price"]
+        prev["currency"] = rec["currency"]
+        rec["consumed"] = True
+
+
+def _record_items(rec: dict, nxt: dict | None, config: LanguageConfig) -> Iterator[tuple[str, object]]:
+    """Budget and priced products contributed by one reconciled record."""
+    if rec.get("consumed"):
+        return
+
+    # Budget sentence with a price -> record budget, skip products.
+    if rec["is_budget"]:
+        # Prefer a reconciled price (from a split-off tail clause); else
+        # parse the budget text directly, and if that fails, parse the budget
+        # text joined with the next clause (spaCy sometimes splits an amount
+        # and its currency, e.g. "budget de 9" + "usd").
+        if rec["price"] is not None:
+            new_budget = build_budget(rec["price"], rec["currency"])
+        else:
+            new_budget = _budget_from_text(rec["text"], config.code)
+            if new_budget is None and nxt is not None:
+                joined = rec["text"] + " " + nxt["text"]
+                new_budget = _budget_from_text(joined, config.code)
+                if new_budget is not None and not nxt["has_product_tokens"]:
+                    nxt["consumed"] = True
+        if new_budget is not None:
+            yield "budget", new_budget
+            # A budget sentence may still mention a product ("budget 200 for
+            # a laptop"); only skip if it has no product signal.
+            if not rec["has_product_tokens"] and not rec["products"]:
+                return
+
+    # Products for this sentence (dependency + token fallback, built once in
+    # _classify_sentence) priced with the sentence's, possibly reconciled,
+    # price. A budget sentence contributes them only if it also names a product.
+    if not rec["is_budget"] or rec["has_product_tokens"]:
+        for product in rec["products"]:
+            yield "product", _priced(product, rec["price"], rec["currency"])
+
+
 def _make_product(
     name: str,
     price: float | None,
@@ -183,6 +621,7 @@ def _make_product(
     lang: str = "en",
     condition: str | None = None,
     attr_source: str | None = None,
+    fields: frozenset[str] = ALL_FIELDS,
 ) -> Product | None:
     """Build a product entry, or ``None`` if the name is empty/currency-only.
 
@@ -194,6 +633,7 @@ def _make_product(
     sentence-level ``condition`` may be supplied; ``attr_source`` (e.g. the
     product's parse subtree text) is used for attribute detection in addition to
     the name, so specs like "4k HD" attached via prepositions are captured.
+    Detectors for fields outside ``fields`` are not run.
     """
     if not name or is_currency_only(name) or "budget" in name.lower():
         return None
@@ -205,18 +645,34 @@ def _make_product(
     if quantity is not None:
         product["quantity"] = quantity
 
-    brand = detect_brand(name)
+    with instrument.stage("enrich"):
+        brand = detect_brand(name) if "brand" in fields else None
+        attributes = detect_attributes(attr_source or name, lang) if "attributes" in fields else None
+        cond = None
+        if "condition" in fields:
+            cond = detect_condition(attr_source or name, lang) or condition
     if brand is not None:
         product["brand"] = brand
-    attributes = detect_attributes(attr_source or name, lang)
     if attributes:
         product["attributes"] = attributes
-    cond = detect_condition(attr_source or name, lang) or condition
     if cond is not None:
         product["condition"] = cond
     return product
 
 
+def _priced(product: Product, price: float | None, currency: str | None) -> Product:
+    """Copy an unpriced product, inserting price/currency as ``_make_product`` would."""
+    entry: Product = {"product": product["product"]}
+    if price is not None and price > 0:
+        entry["price"] = price
+    if currency is not None:
+        entry["currency"] = currency
+    for key, value in product.items():
+        if key != "product":
+            entry[key] = list(value) if isinstance(value, list) else value
+    return entry
+
+
 def _head_word(name: str) -> str:
     """Return a normalized head word (last token) of a product name for dedupe."""
     tokens = name.lower().split()
@@ -260,80 +716,375 @@ def _fuzzy_currency_in(text: str):
     return None
 
 
-def _classify_sentence(sent, config):
-    """Build a record describing one sentence's signals."""
+def _classify_sentence(sent, config, fields: frozenset[str] = ALL_FIELDS):
+    """Build a record describing one sentence's signals.
+
+    The record holds no spaCy objects: its products are built here, unpriced,
+    and priced later by :func:`_assemble` (prices may be reconciled across
+    sentences). That keeps records cacheable per clause.
+    """
     sentence_text = sent.text.strip()
     price, currency = _sentence_price(sentence_text, sent, config)
+    with instrument.stage("find_main_product_tokens"):
+        spans = sentence_spans(sent)
+        if spans is None:
+            product_tokens = find_main_product_tokens(sent, config)
+        else:
+            product_tokens = [span[-1] for span in spans]
+    signals: dict[str, bool] = {}
+    if wants_products(fields):
+        products = _build_products_for_sentence(
+            sent, product_tokens, config, fields, signals, spans
+        )
+        has_products = bool(products)
+    else:
+        products = []
+        # Only the cascade's confidence check reads this, whatever ``fields`` selects.
+        has_products = bool(config.cascade_models) and bool(
+            _build_products_for_sentence(sent, product_tokens, config, _NAME_ONLY, None, spans)
+        )
     return {
-        "span": sent,
         "text": sentence_text,
         "price": price,
         "currency": currency,
         "has_trigger": contains_trigger(sentence_text, config),
-        "product_tokens": find_main_product_tokens(sent, config),
+        "has_product_tokens": bool(product_tokens),
+        "has_products": has_products,
         "is_budget": is_budget(sentence_text, config),
+        "products": products,
+        "fallback_disagrees": signals.get("fallback_disagrees", False),
     }
 
 
-def _build_products_for_sentence(rec, config, price, currency) -> list[Product]:
-    """Build product entries for one sentence record using the given price."""
+def _build_products_for_sentence(
+    sent, product_tokens, config, fields: frozenset[str] = ALL_FIELDS, signals=None, spans=None
+) -> list[Product]:
+    """Build unpriced product entries for one sentence (see :func:`_priced`).
+
+    ``spans`` are the span model's product spans (:mod:`ector.span_model`),
+    aligned with ``product_tokens``; the phrases then come from them rather
+    than from the dependency subtrees. When a ``signals`` dict is given, ``signals["fallback_disagrees"]`` records
+    whether the parse-based and fallback product heads differ (a cascade
+    signal, :mod:`ector.cascade`).
+    """
     out: list[Product] = []
-    product_tokens = rec["product_tokens"]
     lang = config.code
     # Sentence-level condition (e.g. "refurbished", "d'occasion") applies to
     # products in this clause when their own name does not carry one.
-    sent_condition = detect_condition(rec["text"], lang)
+    sent_condition = None
+    if "condition" in fields:
+        with instrument.stage("enrich"):
+            sent_condition = detect_condition(sent.text.strip(), lang)
 
+    with instrument.stage("extract_products_fallback"):
+        fallback = extract_products_fallback(sent, config)
     if not product_tokens:
-        for item in extract_products_fallback(rec["span"], config):
+        for item in fallback:
             name = clean_phrase(item["name"], config.fillers)
-            entry = _make_product(name, price, currency, item["quantity"], lang, sent_condition)
+            entry = _make_product(
+                name, None, None, item["quantity"], lang, sent_condition, fields=fields
+            )
             if entry is not None:
                 out.append(entry)
         return out
 
     captured_heads: set[str] = set()
-    for token in product_tokens:
-        raw_phrase = collect_product_phrase(token, product_tokens)
+    for index, token in enumerate(product_tokens):
+        if spans is None:
+            raw_phrase = collect_product_phrase(token, product_tokens)
+            quantity = detect_quantity(token)
+            spec = product_spec_text(token, product_tokens)
+        else:
+            raw_phrase = span_phrase(spans[index])
+            quantity = span_quantity(spans[index])
+            spec = spans[index].text
         name = clean_phrase(raw_phrase, config.fillers)
-        quantity = detect_quantity(token)
-        spec = product_spec_text(token, product_tokens)
-        entry = _make_product(name, price, currency, quantity, lang, sent_condition, spec)
+        entry = _make_product(name, None, None, quantity, lang, sent_condition, spec, fields)
         if entry is not None:
             out.append(entry)
             captured_heads.add(_head_word(entry["product"]))
+    if signals is not None:
+        fallback_names = (clean_phrase(item["name"], config.fillers) for item in fallback)
+        fallback_heads = {_head_word(name) for name in fallback_names if name}
+        signals["fallback_disagrees"] = fallback_heads != captured_heads
 
-    for item in extract_products_fallback(rec["span"], config):
+    for item in fallback:
         name = clean_phrase(item["name"], config.fillers)
         if not name or _head_word(name) in captured_heads:
             continue
-        entry = _make_product(name, price, currency, item["quantity"], lang, sent_condition)
+        entry = _make_product(
+            name, None, None, item["quantity"], lang, sent_condition, fields=fields
+        )
         if entry is not None:
             out.append(entry)
             captured_heads.add(_head_word(name))
     return out
 
 
-def extract_sync(text: str, lang: str = "en") -> ExtractResult:
-    """Synchronously extract products and an optional budget from ``text``."""
+def _prepare(text: str, config: LanguageConfig) -> str:
+    """Apply vocabulary correction + clause normalization ahead of parsing."""
+    with instrument.stage("normalize_vocabulary"):
+        corrected = normalize_vocabulary(text, config.code)
+    with instrument.stage("normalize_text"):
+        return normalize_text(corrected)
+
+
+def extract_sync(
+    text: str,
+    lang: str = "en",
+    *,
+    mode: str = "full",
+    result_mode: str = "dict",
+    fields: Iterable[str] | None = None,
+    profile: str | None = None,
+) -> ExtractResult:
+    """Synchronously extract products and an optional budget from ``text``.
+
+    ``mode="tiered"`` tries the tokenizer-only tier first (:mod:`ector.shallow`)
+    and runs the tagger/parser only when its ambiguity check fires; see
+    :func:`tier_stats`. ``mode="rules"`` only ever uses that tier, on spaCy's
+    blank tokenizer: no model is loaded (or needs to be installed), at some
+    cost in quality (``scripts/measure.py --mode rules``). The default
+    ``"full"`` always parses.
+
+    Per-stage timings are collected when :mod:`ector.instrument` is enabled.
+
+    ``result_mode`` selects the returned representation (see
+    :mod:`ector.results`): ``"dict"`` (default, mutable), ``"frozen"`` (read-only
+    mappings/tuples shared with the cache, no copy on a hit) or ``"json"``
+    (compact UTF-8 JSON bytes, serialized once per cache entry).
+
+    ``fields`` (e.g. ``{"products.product", "budget"}``, see
+    :mod:`ector.fields`) limits the result to those fields and skips the work
+    behind the others; ``None`` computes everything.
+
+    ``profile`` picks the spaCy pipeline (``"accurate"``, ``"fast"``,
+    ``"minimal"``; see :mod:`ector.profiles`); ``None`` uses ``ECTOR_PROFILE``.
+    """
+    _check_extract_mode(mode)
+    check_mode(result_mode)
+    selected = parse_fields(fields)
+    profile = resolve_profile(profile)
     # Fast path: empty/whitespace input needs no model work.
     if not text or not text.strip():
-        return {"products": [], "intent": "browse"}
-    norm_lang = _normalize_lang(lang)
-    config = get_language(norm_lang)
-    corrected = normalize_vocabulary(text, config.code)
-    normalized = normalize_text(corrected)
+        return render(_empty_result(selected), result_mode)
+    config = get_language(_normalize_lang(lang))
+    with instrument.call(config.code, len(text)):
+        normalized = _prepare(text, config)
+
+        if _EXTRACT_CACHE.maxsize > 0 and len(normalized) <= _EXTRACT_CACHE_TEXT_LIMIT:
+            entry = _extract_cached(normalized, config.code, mode, selected, profile)
+            return entry.get(result_mode)
+
+        if mode == "tiered":
+            result = _extract_tiered(normalized, config.code, selected, profile)
+        elif mode == "rules":
+            result = _extract_rules(normalized, config.code, selected)
+        else:
+            result = _extract_from_normalized(normalized, config.code, selected, profile)
+        return render(result, result_mode)
+
+
+def _empty_result(fields: frozenset[str]) -> ExtractResult:
+    result = copy.deepcopy(_EMPTY_RESULT)
+    if "intent" not in fields:
+        del result["intent"]
+    return result
+
+
+def _shallow_pass(
+    pending: list[tuple[int, str]],
+    results: list,
+    config: LanguageConfig,
+    fields: frozenset[str] = ALL_FIELDS,
+) -> list[tuple[int, str, str, float]]:
+    """Fill ``results`` for texts the tokenizer-only tier answers.
+
+    Returns the escalated ``(index, normalized, reason, shallow_seconds)``.
+    """
+    escalated = []
+    for i, normalized in pending:
+        start = time.perf_counter()
+        records, reason = _shallow_records(normalized, config, fields)
+        if records is None:
+            escalated.append((i, normalized, reason, time.perf_counter() - start))
+            continue
+        results[i] = _assemble(records, normalized, config, fields)
+        _TIER_STATS.record_fast(time.perf_counter() - start)
+    return escalated
+
+
+def _extract_batch(
+    texts: list[str],
+    config: LanguageConfig,
+    batch_size: int,
+    result_mode: str = "dict",
+    mode: str = "full",
+    fields: frozenset[str] = ALL_FIELDS,
+    profile: str | None = None,
+) -> list[ExtractResult]:
+    """Extract one batch, parsing every non-empty text in a single ``nlp.pipe``.
+
+    In ``"tiered"`` mode only the texts the tokenizer-only tier escalates are
+    parsed; in ``"rules"`` mode nothing is.
+    """
+    results: list[ExtractResult | None] = [None] * len(texts)
+    pending: list[tuple[int, str]] = []
+    for i, text in enumerate(texts):
+        if not text or not text.strip():
+            results[i] = _empty_result(fields)
+        else:
+            pending.append((i, _prepare(text, config)))
+
+    if mode == "rules":
+        for i, normalized in pending:
+            results[i] = _extract_rules(normalized, config.code, fields)
+        pending = []
+
+    escalated = []
+    if mode == "tiered" and pending:
+        escalated = _shallow_pass(pending, results, config, fields)
+        pending = [(i, normalized) for i, normalized, _, _ in escalated]
+
+    start = time.perf_counter()
+    if pending:
+        record_lists = _text_records(
+            [normalized for _, normalized in pending], config, fields, profile, batch_size
+        )
+        for (i, normalized), records in zip(pending, record_lists, strict=True):
+            results[i] = _assemble(records, normalized, config, fields)
+    if escalated:
+        # The batch is parsed together; attribute its time evenly.
+        full_seconds = (time.perf_counter() - start) / len(escalated)
+        for _, _, reason, shallow_seconds in escalated:
+            _TIER_STATS.record_escalation(reason, shallow_seconds, full_seconds)
+    if result_mode != "dict":
+        results = [render(result, result_mode) for result in results]
+    return results
 
-    if _EXTRACT_CACHE_SIZE > 0 and len(normalized) <= _EXTRACT_CACHE_TEXT_LIMIT:
-        return copy.deepcopy(_extract_cached(normalized, config.code))
 
-    return _extract_from_normalized(normalized, config.code)
+def batched(texts: Iterable[str], size: int) -> Iterator[list[str]]:
+    """Consecutive lists of ``size`` items from ``texts`` (the last may be shorter), lazily."""
+    iterator = iter(texts)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def extract_many(
+    texts: Iterable[str],
+    lang: str = "en",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    *,
+    mode: str = "full",
+    result_mode: str = "dict",
+    fields: Iterable[str] | None = None,
+    profile: str | None = None,
+) -> Iterator[ExtractResult]:
+    """Extract many texts of one language, yielding one result per input in order.
+
+    Inputs are consumed lazily in chunks of ``batch_size`` and parsed with spaCy's
+    ``nlp.pipe``, which amortizes per-call overhead across the batch. Each result
+    is identical to what :func:`extract_sync` returns for the same text (in the
+    same ``mode``, ``result_mode``, ``fields`` and ``profile``); the extraction
+    cache is bypassed, since bulk inputs rarely repeat.
+
+    Example:
+        >>> for result in extract_many(["I need a phone", "a laptop for 300 usd"]):  # doctest: +SKIP
+        ...     print(result["products"])
+    """
+    # Checked here, not in the generator, so bad arguments raise at the call.
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1")
+    _check_extract_mode(mode)
+    check_mode(result_mode)
+    selected = parse_fields(fields)
+    profile = resolve_profile(profile)
+    config = get_language(_normalize_lang(lang))
+    return _extract_many(texts, config, batch_size, mode, result_mode, selected, profile)
+
+
+def _extract_many(
+    texts: Iterable[str],
+    config: LanguageConfig,
+    batch_size: int,
+    mode: str,
+    result_mode: str,
+    selected: frozenset[str],
+    profile: str,
+) -> Iterator[ExtractResult]:
+    for batch in batched(texts, batch_size):
+        yield from _extract_batch(
+            batch, config, batch_size, result_mode, mode, selected, profile
+        )
+
+
+async def _abatched(
+    texts: Iterable[str] | AsyncIterable[str], size: int
+) -> AsyncIterator[list[str]]:
+    if not isinstance(texts, AsyncIterable):
+        for batch in batched(texts, size):
+            yield batch
+        return
+    batch: list[str] = []
+    async for text in texts:
+        batch.append(text)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def aextract_many(
+    texts: Iterable[str] | AsyncIterable[str],
+    lang: str = "en",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    *,
+    mode: str = "full",
+    result_mode: str = "dict",
+    fields: Iterable[str] | None = None,
+    profile: str | None = None,
+) -> AsyncIterator[ExtractResult]:
+    """Async-iterator variant of :func:`extract_many`.
+
+    Accepts a sync or async iterable of texts. Each batch is parsed in a worker
+    thread so the event loop stays responsive between batches.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1")
+    _check_extract_mode(mode)
+    check_mode(result_mode)
+    selected = parse_fields(fields)
+    profile = resolve_profile(profile)
+    config = get_language(_normalize_lang(lang))
+    return _aextract_many(texts, config, batch_size, mode, result_mode, selected, profile)
+
+
+async def _aextract_many(
+    texts: Iterable[str] | AsyncIterable[str],
+    config: LanguageConfig,
+    batch_size: int,
+    mode: str,
+    result_mode: str,
+    selected: frozenset[str],
+    profile: str,
+) -> AsyncIterator[ExtractResult]:
+    async for batch in _abatched(texts, batch_size):
+        results = await asyncio.to_thread(
+            _extract_batch, batch, config, batch_size, result_mode, mode, selected, profile
+        )
+        for result in results:
+            yield result
 
 
 async def extract(text: str, lang: str = "en") -> ExtractResult:
     """Asynchronously extract products and an optional budget from ``text``.
 
-    Backwards-compatible coroutine wrapper around :func:`extract_sync` so existing
-    ``asyncio.run(extract(...))`` usage keeps working. No real I/O is awaited.
+    Runs :func:`extract_sync` on the default :class:`~ector.executor.ExtractExecutor`
+    (thread pool unless configured otherwise), so the event loop keeps serving
+    other tasks during the parse. Concurrency is bounded; cancelling the awaiting
+    task drops the call if it has not started yet. See
+    :func:`ector.executor.configure_executor` and
+    :func:`ector.executor.executor_stats`.
     """
-    return extract_sync(text, lang)
+    return await get_executor().run(extract_sync, text, lang)
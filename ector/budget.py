@@ -10,8 +10,9 @@ See ``docs/features/02-budget-detection.md``.
 from __future__ import annotations
 
 import re
+from functools import cache
 
-from ector.fuzzy import bounded_levenshtein
+from ector.fuzzy import distances
 from ector.languages import LanguageConfig
 from ector.types import Budget
 
@@ -25,16 +26,22 @@ _BUDGET_ANCHORS_FR = ("budget", "seulement", "depasser", "maximum", "plafond")
 _WORD_RE = re.compile(r"[^\W\d_]+", re.UNICODE)
 
 
+@cache
+def _anchor_groups(anchors: tuple[str, ...]) -> tuple[tuple[int, tuple[str, ...]], ...]:
+    # Anchors by allowed typos (1 up to six letters, else 2), one batch each.
+    groups: dict[int, list[str]] = {}
+    for anchor in anchors:
+        groups.setdefault(1 if len(anchor) <= 6 else 2, []).append(anchor)
+    return tuple((md, tuple(group)) for md, group in groups.items())
+
+
 def _fuzzy_has_anchor(text: str, anchors: tuple[str, ...]) -> bool:
     """True if any token in ``text`` is, or is a close typo of, an anchor word."""
     for token in _WORD_RE.findall(text.lower()):
         if len(token) < 3:
             continue
-        for anchor in anchors:
-            md = 1 if len(anchor) <= 6 else 2
-            if abs(len(token) - len(anchor)) > md:
-                continue
-            if bounded_levenshtein(token, anchor, md) <= md:
+        for md, group in _anchor_groups(anchors):
+            if any(d <= md for d in distances(token, group, md)):
                 return True
     return False
 
@@ -0,0 +1,155 @@
+"""Small thread-safe caches used by the extraction pipeline.
+
+:class:`LRUCache` is a bounded mapping with least-recently-used eviction and
+hit/miss/eviction counters. Unlike ``functools.lru_cache`` it can be filled
+explicitly (batch callers insert many entries after one ``nlp.pipe``), resized
+and inspected at runtime. Besides an entry count it can bound the estimated
+byte size of its entries and expire them after a time-to-live.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Mapping
+from typing import Any
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate deep size in bytes of a tree of dicts, sequences and scalars.
+
+    Shared objects are counted once per reference, so this over- rather than
+    under-estimates.
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, Mapping):
+        for key, item in value.items():
+            size += estimate_size(key) + estimate_size(item)
+    elif isinstance(value, list | tuple | set | frozenset):
+        for item in value:
+            size += estimate_size(item)
+    return size
+
+
+def _entry_size(key: Hashable, value: Any) -> int:
+    return estimate_size(key) + estimate_size(value)
+
+
+class LRUCache:
+    """Bounded, thread-safe LRU mapping. ``maxsize=0`` disables caching.
+
+    ``maxbytes`` (``0``: unbounded) also caps the total of ``sizeof(key, value)``
+    measured at insertion, :func:`estimate_size` of both by default; a single
+    entry larger than the cap is not stored. ``ttl`` (seconds, ``0``: never)
+    expires entries that long after insertion; an expired entry counts as a miss.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        maxbytes: int = 0,
+        ttl: float = 0.0,
+        sizeof: Callable[[Hashable, Any], int] = _entry_size,
+    ):
+        self.maxsize = max(0, maxsize)
+        self.maxbytes = max(0, maxbytes)
+        self.ttl = max(0.0, ttl)
+        self._sizeof = sizeof
+        # key -> (value, estimated bytes, insertion time)
+        self._data: OrderedDict[Hashable, tuple[Any, int, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value (marking it recently used) or ``default``."""
+        with self._lock:
+            try:
+                value, nbytes, stored = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            if self.ttl and time.monotonic() - stored > self.ttl:
+                del self._data[key]
+                self.bytes -= nbytes
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Insert ``value``, evicting the least recently used entries if full."""
+        if self.maxsize <= 0:
+            return
+        nbytes = self._sizeof(key, value)
+        with self._lock:
+            if self.maxbytes and nbytes > self.maxbytes:
+                return
+            old = self._data.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]
+            self._data[key] = (value, nbytes, time.monotonic())
+            self.bytes += nbytes
+            self._evict()
+
+    def _evict(self) -> None:
+        while self._data and (
+            len(self._data) > self.maxsize
+            or (self.maxbytes and self.bytes > self.maxbytes)
+        ):
+            _, (_, nbytes, _) = self._data.popitem(last=False)
+            self.bytes -= nbytes
+            self.evictions += 1
+
+    def resize(
+        self,
+        maxsize: int | None = None,
+        *,
+        maxbytes: int | None = None,
+        ttl: float | None = None,
+    ) -> None:
+        """Change the bounds (``None`` keeps one), evicting at once if they shrink."""
+        with self._lock:
+            if maxsize is not None:
+                self.maxsize = max(0, maxsize)
+            if maxbytes is not None:
+                self.maxbytes = max(0, maxbytes)
+            if ttl is not None:
+                self.ttl = max(0.0, ttl)
+            self._evict()
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self.bytes = 0
+            self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def info(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "bytes": self.bytes,
+                "maxbytes": self.maxbytes,
+                "ttl": self.ttl,
+            }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
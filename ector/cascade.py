@@ -0,0 +1,88 @@
+"""Model cascade: re-parse low-confidence requests with larger models.
+
+A language can list larger pipelines after its default one
+(:attr:`ector.languages.LanguageConfig.cascade_models`, e.g. ``en_core_web_md``
+then ``en_core_web_lg``; set with ``ECTOR_CASCADE_MODELS_EN`` or
+:func:`ector.languages.configure_cascade`). Every request is parsed by the
+default model first. :func:`low_confidence` then checks its sentence records
+for a cheap signal that the parse may be wrong, and only those requests are
+parsed again by the next model, until one is confident or the list is
+exhausted (the last answer is kept).
+
+Signals, in the order they are checked:
+
+- ``"trigger_without_product"``: the request asks for something (a trigger
+  such as "I want") but no product was found;
+- ``"fallback_disagrees"``: in some sentence the parse-based product heads and
+  the parse-independent fallback extractor's heads differ (only checked when
+  the requested ``fields`` include products).
+
+:class:`CascadeStats` counts how many requests cascaded (by reason), how many
+each model resolved and the time spent in the re-parses (the latency cost).
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from typing import Any
+
+CONFIDENCE_SIGNALS = ("trigger_without_product", "fallback_disagrees")
+
+
+def low_confidence(records: list[dict]) -> str | None:
+    """The first signal raised by a request's sentence records, else ``None``.
+
+    Products are judged on ``has_products``, set before the ``fields``
+    projection, so a selection without products does not read as a miss.
+    """
+    if any(rec["has_trigger"] for rec in records) and not any(rec["has_products"] for rec in records):
+        return "trigger_without_product"
+    if any(rec.get("fallback_disagrees") for rec in records):
+        return "fallback_disagrees"
+    return None
+
+
+class CascadeStats:
+    """Thread-safe counters for the model cascade."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checked = 0
+            self.cascaded = 0
+            self.reasons: Counter[str] = Counter()
+            self.models: dict[str, dict[str, float]] = {}
+
+    def record_check(self, reason: str | None) -> None:
+        with self._lock:
+            self.checked += 1
+            if reason is not None:
+                self.cascaded += 1
+                self.reasons[reason] += 1
+
+    def record_stage(self, model_name: str, parsed: int, resolved: int, seconds: float) -> None:
+        with self._lock:
+            stage = self.models.setdefault(
+                model_name, {"parsed": 0, "resolved": 0, "seconds": 0.0}
+            )
+            stage["parsed"] += parsed
+            stage["resolved"] += resolved
+            stage["seconds"] += seconds
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            seconds = sum(stage["seconds"] for stage in self.models.values())
+            return {
+                "checked": self.checked,
+                "cascaded": self.cascaded,
+                "cascade_rate": self.cascaded / self.checked if self.checked else 0.0,
+                "reasons": dict(self.reasons),
+                "models": {name: dict(stage) for name, stage in self.models.items()},
+                "cascade_seconds": seconds,
+                "mean_cost_per_cascaded": seconds / self.cascaded if self.cascaded else None,
+                "mean_cost_per_request": seconds / self.checked if self.checked else None,
+            }
@@ -5,7 +5,10 @@ Usage examples::
     ector "I want a laptop for 150 usd"
     ector --lang fr "je veux un iPhone, budget 300 dollars"
     ector --file input.txt
+    ector --mode rules "a phone for 30 usd"    # no spaCy model needed
+    ector --stream --file rfq-thread.txt
     echo "I need a phone" | ector
+    ector snapshot build --output ector.snapshot --lang en
 
 See ``docs/features/07-cli.md``.
 """
@@ -16,9 +19,13 @@ import argparse
 import json
 import sys
 
-from ector import __version__
-from ector.api import extract_sync
+from ector import __version__, instrument
+from ector.api import EXTRACT_MODES, extract_sync
+from ector.fields import parse_fields
 from ector.languages import supported_languages
+from ector.profiles import PROFILES
+from ector.snapshot import build_snapshot
+from ector.stream import extract_stream
 
 
 def _read_input(args: argparse.Namespace) -> str:
@@ -60,24 +67,148 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_false",
         help="Emit compact single-line JSON.",
     )
+    parser.add_argument(
+        "--fields",
+        help="Comma-separated fields to compute, e.g. 'products.product,budget' "
+        "(default: all). Work behind other fields is skipped.",
+    )
+    parser.add_argument(
+        "--mode",
+        default="full",
+        choices=EXTRACT_MODES,
+        help="Extraction mode (default: full). 'rules' needs no spaCy model: "
+        "faster start and less memory, lower precision.",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=list(PROFILES),
+        help="spaCy pipeline profile (default: ECTOR_PROFILE or accurate); "
+        "see ector/profiles.py.",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Long-document mode: read the input incrementally and print one JSON "
+        "line per product, then a summary line (budget, constraint, intent).",
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Print per-stage timings of the extraction to STDERR.",
+    )
     parser.add_argument("--version", action="version", version=f"ector {__version__}")
     return parser
 
 
+def _print_timings(record: dict) -> None:
+    for name, stage in record["stages"].items():
+        print(
+            f"{name:<28}{stage['seconds'] * 1000:>10.3f} ms  x{stage['calls']}",
+            file=sys.stderr,
+        )
+    for name, value in sorted(record["counters"].items()):
+        print(f"{name:<28}{value:>10}", file=sys.stderr)
+    print(f"{'total':<28}{record['seconds'] * 1000:>10.3f} ms", file=sys.stderr)
+
+
+def _run_stream(args: argparse.Namespace, fields: frozenset[str] | None) -> int:
+    """Print products as NDJSON while the document is still being read."""
+    handle = None
+    if args.text:
+        source = args.text
+    elif args.file:
+        source = handle = open(args.file, encoding="utf-8")
+    else:
+        source = sys.stdin
+    try:
+        stream = extract_stream(
+            source, args.lang, mode=args.mode, fields=fields, profile=args.profile
+        )
+        for product in stream:
+            print(json.dumps(product, ensure_ascii=False), flush=True)
+        print(json.dumps(stream.summary(), ensure_ascii=False))
+    except OSError as exc:  # missing model, unreadable file, etc.
+        print(str(exc), file=sys.stderr)
+        return 2
+    finally:
+        if handle is not None:
+            handle.close()
+    return 0
+
+
+def build_snapshot_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="ector snapshot",
+        description="Manage pre-serialized pipeline snapshots (load with ECTOR_SNAPSHOT).",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="Serialize the configured pipelines to one file.")
+    build.add_argument("--output", required=True, help="Snapshot file to write.")
+    build.add_argument(
+        "--lang",
+        action="append",
+        choices=supported_languages(),
+        help="Language to include (repeatable; default: all).",
+    )
+    build.add_argument(
+        "--profile",
+        action="append",
+        choices=list(PROFILES),
+        help="Pipeline profile to include (repeatable; default: ECTOR_PROFILE or accurate).",
+    )
+    return parser
+
+
+def _run_snapshot(argv: list[str]) -> int:
+    args = build_snapshot_parser().parse_args(argv)
+    try:
+        manifest = build_snapshot(args.output, args.lang, args.profile)
+    except OSError as exc:  # missing model, unwritable path, etc.
+        print(str(exc), file=sys.stderr)
+        return 2
+    print(json.dumps(manifest, indent=2))
+    return 0
+
+
 def main(argv: list[str] | None = None) -> int:
     """CLI entry point. Returns a process exit code."""
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv[:1] == ["snapshot"]:
+        return _run_snapshot(argv[1:])
     parser = build_parser()
     args = parser.parse_args(argv)
 
+    try:
+        fields = parse_fields(args.fields) if args.fields else None
+    except ValueError as exc:
+        parser.error(str(exc))
+    if args.stream:
+        return _run_stream(args, fields)
+
     text = _read_input(args)
     if not text.strip():
         parser.error("no input provided (pass text, --file, or pipe via STDIN)")
 
+    records: list[dict] = []
+    was_enabled = instrument.enabled()
+    if args.timings:
+        instrument.enable()
+        instrument.add_hook(records.append)
     try:
-        result = extract_sync(text, args.lang)
+        result = extract_sync(
+            text, args.lang, mode=args.mode, fields=fields, profile=args.profile
+        )
     except OSError as exc:  # missing model, etc.
         print(str(exc), file=sys.stderr)
         return 2
+    finally:
+        if args.timings:
+            instrument.remove_hook(records.append)
+            if not was_enabled:
+                instrument.disable()
+    for record in records:
+        _print_timings(record)
 
     indent = 2 if args.pretty else None
     separators = None if args.pretty else (",", ":")
@@ -0,0 +1,57 @@
+"""Closed-class function words with their coarse part of speech.
+
+Used by the tokenizer-only extraction tier (:mod:`ector.shallow`), which runs no
+tagger: these words get a Universal POS tag from this table so the fallback
+extractor skips them exactly as it skips tagger-labelled function words. Every
+tag here is one the fallback treats as a stop POS.
+
+Open-class words (nouns, verbs, adjectives) are deliberately absent; a word
+that is neither here nor in another known vocabulary sends the request to the
+full parse.
+
+All canonical lowercase. English + French.
+"""
+
+from __future__ import annotations
+
+
+def _tag(pos: str, words: str) -> dict[str, str]:
+    return dict.fromkeys(words.split(), pos)
+
+
+FUNCTION_WORDS_EN: dict[str, str] = {
+    **_tag("DET", "a an the this that these those my your our his her their its "
+                  "some any each every no another either neither all both"),
+    **_tag("PRON", "i me you he him she it we us they them myself yourself "
+                   "something anything someone anybody one ones mine yours"),
+    **_tag("ADP", "for at of in on to with from by under over into without "
+                  "within between around near below above up off per via"),
+    **_tag("CCONJ", "and or but nor"),
+    **_tag("SCONJ", "if because when while though although since so"),
+    **_tag("AUX", "am is are was were be been being do does did have has had "
+                  "will would can could should shall may might must "
+                  "'m 're 's 've 'd 'll ca wo"),
+    **_tag("PART", "to not n't"),
+    **_tag("INTJ", "hi hello hey thanks thank please ok okay yes"),
+}
+
+FUNCTION_WORDS_FR: dict[str, str] = {
+    **_tag("DET", "un une le la les l' des du de d' ce cet cette ces mon ma mes "
+                  "ton ta tes son sa ses notre nos votre vos leur leurs "
+                  "quelque quelques aucun aucune chaque"),
+    **_tag("PRON", "je j' tu il elle on nous vous ils elles me m' te t' se s' "
+                   "moi toi lui y en qui qu' ça cela ceci c'"),
+    **_tag("ADP", "à au aux dans pour par sur sous avec sans entre chez vers "
+                  "jusqu'à"),
+    **_tag("CCONJ", "et ou mais donc ni"),
+    **_tag("SCONJ", "si quand comme que"),
+    **_tag("AUX", "ai as a avons avez ont suis es est sommes êtes sont être "
+                  "avoir été serait aurait pourrait peux peut pouvez"),
+    **_tag("PART", "ne n' pas"),
+    **_tag("INTJ", "bonjour salut merci svp oui"),
+}
+
+
+def function_words(lang: str) -> dict[str, str]:
+    """Function word -> UPOS tag for ``lang`` (English for any non-French code)."""
+    return FUNCTION_WORDS_FR if lang == "fr" else FUNCTION_WORDS_EN
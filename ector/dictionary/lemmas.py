@@ -0,0 +1,50 @@
+"""Inflected form -> lemma, for pipelines loaded without spaCy's lemmatizer.
+
+The extractor reads lemmas in a handful of places only: copulas
+(``be``/``être``), the prepositions that introduce a price or an ``of`` phrase,
+the price/cost nouns and verbs, and the non-product words of
+:data:`ector.products._NON_PRODUCT_LEMMAS`. The ``fast`` and ``minimal``
+pipeline profiles (:mod:`ector.profiles`) replace the lemmatizer with this
+table; any word not listed is its own (lowercased) lemma.
+
+All canonical lowercase. English + French.
+"""
+
+from __future__ import annotations
+
+
+def _lemma(lemma: str, forms: str) -> dict[str, str]:
+    return dict.fromkeys(forms.split(), lemma)
+
+
+LEMMAS_EN: dict[str, str] = {
+    **_lemma("be", "is are was were am 's 're 'm been being"),
+    **_lemma("need", "needs needed needing"),
+    **_lemma("want", "wants wanted wanting"),
+    **_lemma("wish", "wishes wished wishing"),
+    **_lemma("price", "prices priced"),
+    **_lemma("cost", "costs costing"),
+    **_lemma("order", "orders ordered ordering"),
+    **_lemma("quote", "quotes quoted"),
+    **_lemma("offer", "offers offered"),
+    **_lemma("deal", "deals"),
+}
+
+LEMMAS_FR: dict[str, str] = {
+    **_lemma("être", "est sont suis es sommes êtes était étaient étais sera "
+                     "seront serait été soit"),
+    **_lemma("coûter", "coûte coûtent coûtait coûterait coûtera coute coutent "
+                       "coutait couter"),
+    **_lemma("coût", "coûts cout couts"),
+    **_lemma("de", "du des d'"),
+    **_lemma("à", "au aux"),
+    **_lemma("besoin", "besoins"),
+    **_lemma("envie", "envies"),
+    **_lemma("tarif", "tarifs"),
+    **_lemma("commande", "commandes"),
+}
+
+
+def lemma_table(lang: str) -> dict[str, str]:
+    """Inflected form -> lemma for ``lang`` (English for any non-French code)."""
+    return LEMMAS_FR if lang == "fr" else LEMMAS_EN
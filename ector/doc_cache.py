@@ -0,0 +1,150 @@
+"""Optional on-disk cache of parsed docs, for replaying fixed corpora.
+
+Corpus runs (``scripts/measure.py``, the QA runners) parse the same texts on
+every run although usually only the rule layer changed. With
+``ECTOR_DOC_CACHE_DIR`` set (or :func:`configure_doc_cache`), every parse goes
+through a :class:`DocCache`: a doc already parsed by the same model, model
+version and pipeline profile is read back from disk and the spaCy call is
+skipped.
+
+Layout: one directory per ``<model>-<version>-<profile>`` holding spaCy
+``DocBin`` shards (``shard-<pid>-<n>.spacy``). A doc is keyed by its text (the
+normalized input). New docs are buffered and written as a shard every
+``shard_size`` docs and at interpreter exit (:meth:`DocCache.flush`). The
+first lookup in a namespace reads all its shards into memory, so this is
+meant for corpora, not for unbounded live traffic.
+"""
+
+from __future__ import annotations
+
+import atexit
+import itertools
+import logging
+import os
+import threading
+
+from spacy.language import Language
+from spacy.tokens import Doc, DocBin
+
+logger = logging.getLogger("ector.doc_cache")
+
+DOC_CACHE_ENV = "ECTOR_DOC_CACHE_DIR"
+_DEFAULT_SHARD_SIZE = 2000
+
+
+def _namespace(nlp: Language, profile: str) -> str:
+    meta = nlp.meta
+    name = f"{meta.get('lang', nlp.lang)}_{meta.get('name', 'pipeline')}"
+    namespace = f"{name}-{meta.get('version', '0')}-{profile}"
+    spans = meta.get("ector_span_model")
+    if spans:
+        namespace += f"-{spans['name']}-{spans['version']}"
+    return namespace
+
+
+class _Namespace:
+    __slots__ = ("path", "docs", "pending")
+
+    def __init__(self, path: str):
+        self.path = path
+        self.docs: dict[str, Doc] = {}
+        self.pending: list[Doc] = []
+
+
+class DocCache:
+    """Parsed docs on disk, keyed by text within a model/version/profile namespace."""
+
+    def __init__(self, directory: str, shard_size: int = _DEFAULT_SHARD_SIZE):
+        self.directory = directory
+        self.shard_size = max(1, shard_size)
+        self._namespaces: dict[str, _Namespace] = {}
+        self._lock = threading.Lock()
+        self._counter = itertools.count()
+        self.hits = 0
+        self.misses = 0
+
+    def _open(self, nlp: Language, profile: str) -> _Namespace:
+        # Caller holds ``_lock``.
+        key = _namespace(nlp, profile)
+        space = self._namespaces.get(key)
+        if space is None:
+            space = self._namespaces[key] = _Namespace(os.path.join(self.directory, key))
+            if os.path.isdir(space.path):
+                for name in sorted(os.listdir(space.path)):
+                    if name.endswith(".spacy"):
+                        doc_bin = DocBin().from_disk(os.path.join(space.path, name))
+                        for doc in doc_bin.get_docs(nlp.vocab):
+                            space.docs[doc.text] = doc
+        return space
+
+    def get(self, nlp: Language, profile: str, text: str) -> Doc | None:
+        with self._lock:
+            doc = self._open(nlp, profile).docs.get(text)
+            if doc is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return doc
+
+    def put(self, nlp: Language, profile: str, doc: Doc) -> None:
+        with self._lock:
+            space = self._open(nlp, profile)
+            if doc.text in space.docs:
+                return
+            space.docs[doc.text] = doc
+            space.pending.append(doc)
+            if len(space.pending) >= self.shard_size:
+                self._write(space)
+
+    def _write(self, space: _Namespace) -> None:
+        # Caller holds ``_lock``.
+        if not space.pending:
+            return
+        os.makedirs(space.path, exist_ok=True)
+        doc_bin = DocBin(docs=space.pending)
+        name = f"shard-{os.getpid()}-{next(self._counter):05d}.spacy"
+        doc_bin.to_disk(os.path.join(space.path, name))
+        logger.debug("Wrote %d docs to %s", len(space.pending), name)
+        space.pending = []
+
+    def flush(self) -> None:
+        """Write every buffered doc to a new shard."""
+        with self._lock:
+            for space in self._namespaces.values():
+                self._write(space)
+
+    def info(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "docs": sum(len(space.docs) for space in self._namespaces.values()),
+                "pending": sum(len(space.pending) for space in self._namespaces.values()),
+            }
+
+
+_doc_cache: DocCache | None = None
+
+
+def get_doc_cache() -> DocCache | None:
+    return _doc_cache
+
+
+def configure_doc_cache(directory: str | None, shard_size: int = _DEFAULT_SHARD_SIZE) -> None:
+    """Enable the doc cache in ``directory``, or disable it with ``None``.
+
+    The previous cache, if any, is flushed first.
+    """
+    global _doc_cache
+    if _doc_cache is not None:
+        _doc_cache.flush()
+    _doc_cache = DocCache(directory, shard_size) if directory else None
+
+
+def _flush_at_exit() -> None:
+    if _doc_cache is not None:
+        _doc_cache.flush()
+
+
+atexit.register(_flush_at_exit)
+configure_doc_cache(os.environ.get(DOC_CACHE_ENV) or None)
@@ -0,0 +1,222 @@
+"""Bounded executor that keeps the ``extract`` coroutine off the event loop.
+
+Extraction is CPU-bound (spaCy parse + rules). Running it inline inside a
+coroutine freezes the event loop for the whole parse, so :func:`ector.extract`
+hands the work to an :class:`ExtractExecutor` instead:
+
+- ``kind="thread"`` (default) runs calls in a ``ThreadPoolExecutor``; the loop
+  stays responsive while a parse is in flight.
+- ``kind="process"`` runs calls in a fork-based ``ProcessPoolExecutor`` for real
+  multi-core throughput (results must be picklable; they are plain dicts).
+
+``max_concurrency`` bounds how many calls may be in the executor at once; extra
+callers wait (cheaply, on the event loop) for a slot. A caller cancelled while
+waiting never reaches the executor; one cancelled after submission is dropped
+from the queue if it has not started yet. :meth:`ExtractExecutor.stats` reports
+the current queue depth.
+
+The default executor is configured from the environment and can be replaced at
+runtime with :func:`configure_executor`:
+
+- ``ECTOR_EXECUTOR``: ``thread`` (default) or ``process``;
+- ``ECTOR_EXECUTOR_WORKERS``: worker count (default: ``min(4, cpu_count)``);
+- ``ECTOR_MAX_CONCURRENCY``: in-flight bound (default: ``2 * workers``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import threading
+import weakref
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+EXECUTOR_KINDS = ("thread", "process")
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        return default
+
+
+class ExtractExecutor:
+    """Run blocking extraction calls on a worker pool with bounded concurrency.
+
+    :param kind: ``"thread"`` or ``"process"``.
+    :param max_workers: pool size (default: ``min(4, os.cpu_count())``).
+    :param max_concurrency: maximum calls submitted to the pool at once
+        (default: ``2 * max_workers``); further callers wait for a slot.
+    """
+
+    def __init__(
+        self,
+        kind: str = "thread",
+        max_workers: int | None = None,
+        max_concurrency: int | None = None,
+    ):
+        if kind not in EXECUTOR_KINDS:
+            raise ValueError(f"kind must be one of {EXECUTOR_KINDS}, got {kind!r}")
+        self.kind = kind
+        self.max_workers = max(1, max_workers or min(4, os.cpu_count() or 1))
+        self.max_concurrency = max(1, max_concurrency or 2 * self.max_workers)
+        self._pool: Executor | None = None
+        self._lock = threading.Lock()
+        self._waiting = 0
+        self._submitted = 0
+        self._running = 0
+        self._completed = 0
+        self._cancelled = 0
+        # asyncio primitives are bound to one event loop; keep one per loop.
+        self._semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+
+    def _executor(self) -> Executor:
+        with self._lock:
+            if self._pool is None:
+                if self.kind == "process":
+                    context = None
+                    if "fork" in multiprocessing.get_all_start_methods():
+                        context = multiprocessing.get_context("fork")
+                    self._pool = ProcessPoolExecutor(self.max_workers, mp_context=context)
+                else:
+                    self._pool = ThreadPoolExecutor(
+                        self.max_workers, thread_name_prefix="ector-extract"
+                    )
+            return self._pool
+
+    def _semaphore(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        sem = self._semaphores.get(loop)
+        if sem is None:
+            sem = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = sem
+        return sem
+
+    def _count(self, field: str, delta: int) -> None:
+        with self._lock:
+            setattr(self, field, getattr(self, field) + delta)
+
+    def _tracked(self, fn: Callable[..., T], *args: Any) -> T:
+        # Only used for threads; process workers cannot update our counters.
+        self._count("_running", 1)
+        try:
+            return fn(*args)
+        finally:
+            self._count("_running", -1)
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Await ``fn(*args)`` executed on the pool, respecting the concurrency bound."""
+        loop = asyncio.get_running_loop()
+        sem = self._semaphore(loop)
+        self._count("_waiting", 1)
+        try:
+            await sem.acquire()
+        finally:
+            self._count("_waiting", -1)
+
+        try:
+            if self.kind == "thread":
+                future = self._executor().submit(self._tracked, fn, *args)
+            else:
+                future = self._executor().submit(fn, *args)
+        except BaseException:
+            sem.release()
+            raise
+        self._count("_submitted", 1)
+
+        def _done(fut) -> None:
+            # Release the slot only once the work has really finished (or was
+            # dropped before starting), so cancelled callers cannot overfill
+            # the pool with still-running work.
+            with self._lock:
+                self._submitted -= 1
+                if fut.cancelled():
+                    self._cancelled += 1
+                else:
+                    self._completed += 1
+            try:
+                loop.call_soon_threadsafe(sem.release)
+            except RuntimeError:  # the caller's loop is already closed
+                pass
+
+        future.add_done_callback(_done)
+        # Cancelling the awaiting task cancels ``future`` if it has not started.
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> dict[str, Any]:
+        """Return queue-depth and throughput counters.
+
+        ``waiting``: callers blocked on the concurrency bound; ``in_flight``:
+        calls handed to the pool (queued or running); ``running``: calls
+        executing right now (thread executor only, else ``None``).
+        """
+        with self._lock:
+            return {
+                "kind": self.kind,
+                "max_workers": self.max_workers,
+                "max_concurrency": self.max_concurrency,
+                "waiting": self._waiting,
+                "in_flight": self._submitted,
+                "running": self._running if self.kind == "thread" else None,
+                "completed": self._completed,
+                "cancelled": self._cancelled,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut the worker pool down; it is recreated lazily on next use."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=not wait)
+
+
+_DEFAULT: ExtractExecutor | None = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def _from_env() -> ExtractExecutor:
+    kind = os.environ.get("ECTOR_EXECUTOR", "thread").strip().lower() or "thread"
+    if kind not in EXECUTOR_KINDS:
+        kind = "thread"
+    workers = _env_int("ECTOR_EXECUTOR_WORKERS", min(4, os.cpu_count() or 1))
+    concurrency = _env_int("ECTOR_MAX_CONCURRENCY", 2 * workers)
+    return ExtractExecutor(kind, workers, concurrency)
+
+
+def get_executor() -> ExtractExecutor:
+    """Return the process-wide executor used by :func:`ector.extract`."""
+    global _DEFAULT
+    with _DEFAULT_LOCK:
+        if _DEFAULT is None:
+            _DEFAULT = _from_env()
+        return _DEFAULT
+
+
+def configure_executor(
+    kind: str = "thread",
+    max_workers: int | None = None,
+    max_concurrency: int | None = None,
+) -> ExtractExecutor:
+    """Replace the default executor (the previous one is shut down)."""
+    global _DEFAULT
+    executor = ExtractExecutor(kind, max_workers, max_concurrency)
+    with _DEFAULT_LOCK:
+        previous, _DEFAULT = _DEFAULT, executor
+    if previous is not None:
+        previous.shutdown(wait=False)
+    return executor
+
+
+def executor_stats() -> dict[str, Any]:
+    """Queue-depth introspection for the default executor."""
+    return get_executor().stats()
@@ -0,0 +1,63 @@
+"""Field selection: compute only the parts of a result the caller asked for.
+
+``extract_sync(text, fields=...)`` takes any of:
+
+- ``"products"`` (every product field) or ``"products.<name>"`` for one of
+  ``product``, ``price``, ``currency``, ``quantity``, ``brand``, ``attributes``,
+  ``condition`` (``product``, the name, is always included);
+- ``"budget"``, ``"price_constraint"``, ``"intent"``.
+
+The bare product names (``"brand"``) are accepted too, so a parsed selection
+such as :data:`ALL_FIELDS` can be passed again.
+
+The work behind an unrequested field is skipped, not just its output:
+brand/attribute/condition detection, ``parse_constraint`` and
+``classify_intent``; when neither products nor intent are requested, products
+are not built at all. Unrequested keys are absent from the result, except
+``products`` which is always present (possibly empty).
+
+Example:
+    >>> sorted(parse_fields(["products.product", "budget"]))
+    ['budget', 'product']
+    >>> "brand" in parse_fields(["products"])
+    True
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+PRODUCT_FIELDS = frozenset({
+    "product", "price", "currency", "quantity", "brand", "attributes", "condition",
+})
+TOP_LEVEL_FIELDS = frozenset({"budget", "price_constraint", "intent"})
+ALL_FIELDS = PRODUCT_FIELDS | TOP_LEVEL_FIELDS
+
+
+def parse_fields(fields: Iterable[str] | None) -> frozenset[str]:
+    """Canonicalize a field selection (``None`` selects everything)."""
+    if fields is None:
+        return ALL_FIELDS
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    selected: set[str] = set()
+    for raw in fields:
+        name = raw.strip()
+        if not name:
+            continue
+        if name == "products":
+            selected |= PRODUCT_FIELDS
+        elif name.startswith("products.") and name[9:] in PRODUCT_FIELDS:
+            selected.update(("product", name[9:]))
+        elif name in PRODUCT_FIELDS:
+            selected.update(("product", name))
+        elif name in TOP_LEVEL_FIELDS:
+            selected.add(name)
+        else:
+            raise ValueError(f"unknown field {name!r}")
+    return frozenset(selected)
+
+
+def wants_products(fields: frozenset[str]) -> bool:
+    """Whether products must be built (requested, or needed for the intent)."""
+    return "product" in fields or "intent" in fields
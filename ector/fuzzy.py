@@ -3,18 +3,63 @@
 Used to map a misspelled functional token (currency word, trigger verb, budget
 word, known product/brand) to its canonical form. Designed for speed:
 
-- bounded Levenshtein with early exit (``max_distance``),
+- a bit-parallel bounded edit distance (``max_distance``), with a batch form
+  that scores many candidates against one word,
 - a candidate index bucketed by (first letter, length) so we only compare against
   plausible words,
-- an LRU cache on the public ``best_match`` call.
+- a bounded memo of past ``best_match`` answers (misses included) per index.
+
+:class:`FuzzyIndex` has four candidate backends with identical results:
+``"buckets"`` compares against every word of the plausible buckets;
+``"trie"`` walks the terms of each plausible length in sorted order as an
+implicit trie, sharing the edit-distance rows of common prefixes and skipping
+every term under a prefix already too far away; ``"symspell"`` precomputes the
+delete-variants of each term's prefix so that a lookup is a few dict probes
+and a handful of verifications, at the cost of a larger index; ``"numpy"``
+scores the same candidates as the buckets, a whole length at a time, with the
+bit-parallel kernel on NumPy arrays. Choose one per index or process-wide with
+``ECTOR_FUZZY_BACKEND``; otherwise vocabularies of :data:`NUMPY_MIN_TERMS`
+terms or more use ``"numpy"`` (when NumPy is installed) and smaller ones
+``"buckets"``. ``scripts/bench_fuzzy.py`` compares them by vocabulary size.
 
 See ``docs/features/08-typo-tolerance.md``.
 """
 
 from __future__ import annotations
 
-from collections.abc import Iterable
-from functools import lru_cache
+import os
+import weakref
+from bisect import bisect_left, insort
+from collections.abc import Iterable, Iterator
+from functools import cache
+from itertools import combinations, count
+from typing import Any
+
+from ector.cache import LRUCache
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy comes with spaCy
+    np = None
+
+FUZZY_BACKEND_ENV = "ECTOR_FUZZY_BACKEND"
+FUZZY_BACKENDS = ("buckets", "trie", "symspell", "numpy")
+FUZZY_CACHE_ENV = "ECTOR_FUZZY_CACHE_SIZE"
+# Past lookups remembered per index when neither it nor the env sets a size.
+DEFAULT_LOOKUP_CACHE_SIZE = 4096
+# Vocabulary size from which an index without a named backend uses "numpy".
+NUMPY_MIN_TERMS = 2000
+# Smaller candidate slices are scored in Python, as by the other backends.
+_NUMPY_MIN_ROWS = 64
+# Terms are indexed by the delete-variants of their first characters only; a
+# match within k edits still shares a variant with k deletes per side.
+SYMSPELL_PREFIX_LENGTH = 7
+# Marks a lookup the memo has no answer for (None is a cached miss).
+_NOT_CACHED = object()
+# Sorts after every continuation of a prefix (for skipping a trie subtree).
+_PREFIX_END = "\U0010ffff"
+# Longest word scored by the bit-parallel kernel; longer ones use the rows.
+_WORD_BITS = 64
 
 
 def bounded_levenshtein(a: str, b: str, max_distance: int) -> int:
@@ -22,8 +67,9 @@ def bounded_levenshtein(a: str, b: str, max_distance: int) -> int:
 
     Counts insertions, deletions, substitutions, and adjacent transpositions
     (e.g. "wnat" -> "want" is distance 1). Returns the true distance if it is
-    ``<= max_distance``; otherwise returns ``max_distance + 1`` (sentinel). Uses a
-    rolling three-row buffer with an early-exit when a whole row exceeds the bound.
+    ``<= max_distance``; otherwise returns ``max_distance + 1`` (sentinel).
+    Words of up to 64 characters are scored a column at a time with bit
+    vectors (:func:`distances`); longer ones with a rolling three-row buffer.
 
     Examples:
         >>> bounded_levenshtein("kitten", "sitting", 3)
@@ -42,7 +88,109 @@ def bounded_levenshtein(a: str, b: str, max_distance: int) -> int:
         return lb if lb <= max_distance else max_distance + 1
     if lb == 0:
         return la if la <= max_distance else max_distance + 1
+    if la > _WORD_BITS:
+        return _bounded_rows(a, b, max_distance)
+    return _bit_parallel(_match_masks(a), la, b, max_distance)
 
+
+def distances(word: str, candidates: Iterable[str], max_distance: int) -> list[int]:
+    """:func:`bounded_levenshtein` of ``word`` against each candidate, in order.
+
+    The per-character match masks of ``word`` are built once for the whole
+    batch, so scoring many candidates costs one column pass each.
+
+    Examples:
+        >>> distances("laptop", ["laptop", "labtop", "latpop", "tablet"], 1)
+        [0, 1, 1, 2]
+    """
+    m = len(word)
+    if m > _WORD_BITS:
+        return [bounded_levenshtein(word, cand, max_distance) for cand in candidates]
+    masks = _match_masks(word)
+    out = []
+    for cand in candidates:
+        n = len(cand)
+        if abs(m - n) > max_distance:
+            out.append(max_distance + 1)
+        elif m == 0 or n == 0:
+            out.append(m + n if m + n <= max_distance else max_distance + 1)
+        else:
+            out.append(_bit_parallel(masks, m, cand, max_distance))
+    return out
+
+
+def _match_masks(word: str) -> dict[str, int]:
+    # Bit i of masks[ch] is set where word[i] == ch.
+    masks: dict[str, int] = {}
+    bit = 1
+    for ch in word:
+        masks[ch] = masks.get(ch, 0) | bit
+        bit <<= 1
+    return masks
+
+
+def _bit_parallel(masks: dict[str, int], m: int, b: str, max_distance: int) -> int:
+    # Myers' bit-vector edit distance with Hyyrö's transposition term: VP/VN
+    # hold the +1/-1 vertical deltas of the current column of the DP matrix
+    # (bit i for row i + 1), and ``score`` follows its last row.
+    full = (1 << m) - 1
+    top = 1 << (m - 1)
+    vp, vn, d0, previous_pm, score = full, 0, 0, 0, m
+    get = masks.get
+    for ch in b:
+        pm = get(ch, 0)
+        transposed = (((~d0) & pm) << 1) & previous_pm
+        d0 = ((((pm & vp) + vp) ^ vp) | pm | vn | transposed) & full
+        hp = vn | (full ^ (d0 | vp))
+        hn = d0 & vp
+        if hp & top:
+            score += 1
+        elif hn & top:
+            score -= 1
+        hp = ((hp << 1) | 1) & full
+        vp = ((hn << 1) & full) | (full ^ (d0 | hp))
+        vn = hp & d0
+        previous_pm = pm
+    return score if score <= max_distance else max_distance + 1
+
+
+def _bit_parallel_matrix(
+    masks: list[tuple[int, int]], m: int, codes: np.ndarray, max_distance: int
+) -> np.ndarray:
+    # _bit_parallel for every column of ``codes`` (code points, one term of the
+    # same length per column) at once, on uint64 arrays; ``masks`` pairs each
+    # code point of the word with its match mask. Sentinel as bounded_levenshtein.
+    k = codes.shape[1]
+    full = np.uint64((1 << m) - 1)
+    top = np.uint64(1 << (m - 1))
+    one = np.uint64(1)
+    masks = [(np.uint32(code), np.uint64(mask)) for code, mask in masks]
+    vp = np.full(k, full, dtype=np.uint64)
+    vn = np.zeros(k, dtype=np.uint64)
+    d0 = np.zeros(k, dtype=np.uint64)
+    previous_pm = np.zeros(k, dtype=np.uint64)
+    score = np.full(k, m, dtype=np.int64)
+    for column in codes:
+        pm = np.zeros(k, dtype=np.uint64)
+        for code, mask in masks:
+            pm[column == code] |= mask
+        transposed = ((~d0 & pm) << one) & previous_pm
+        d0 = ((((pm & vp) + vp) ^ vp) | pm | vn | transposed) & full
+        hp = vn | (full ^ (d0 | vp))
+        hn = d0 & vp
+        score += (hp & top) != 0
+        score -= (hn & top) != 0
+        hp = ((hp << one) | one) & full
+        vp = ((hn << one) & full) | (full ^ (d0 | hp))
+        vn = hp & d0
+        previous_pm = pm
+    return np.minimum(score, max_distance + 1)
+
+
+def _bounded_rows(a: str, b: str, max_distance: int) -> int:
+    # The dynamic-programming rows, exiting early once a whole row is over the
+    # bound. Assumes non-empty words within ``max_distance`` in length.
+    la, lb = len(a), len(b)
     # rows: two_back (i-2), previous (i-1), current (i)
     previous = list(range(lb + 1))
     two_back = [0] * (lb + 1)
@@ -101,18 +249,168 @@ def threshold_for(word: str) -> int:
     return 3
 
 
+def default_backend(size: int = 0) -> str:
+    """The backend named by ``ECTOR_FUZZY_BACKEND``, else ``"numpy"`` for ``size``
+    terms or more than :data:`NUMPY_MIN_TERMS` (if NumPy is installed), else
+    ``"buckets"``."""
+    named = os.environ.get(FUZZY_BACKEND_ENV, "").strip().lower()
+    if named:
+        return named
+    return "numpy" if size >= NUMPY_MIN_TERMS and np is not None else "buckets"
+
+
+@cache
+def _delete_depth(length: int) -> int:
+    """Deletes to index for a term of ``length``: the largest default threshold
+    of a query that may be compared with it (see :meth:`FuzzyIndex.candidates`)."""
+    return max(
+        (
+            threshold_for("x" * n)
+            for n in range(max(1, length - 3), length + 4)
+            if abs(n - length) <= threshold_for("x" * n)
+        ),
+        default=0,
+    )
+
+
+def _deletes(word: str, depth: int) -> set[str]:
+    """``word`` and every string obtained from it by up to ``depth`` deletions."""
+    n = len(word)
+    out = {word}
+    for kept in range(max(0, n - depth), n):
+        out.update(map("".join, combinations(word, kept)))
+    return out
+
+
+def _trie_walk(
+    terms: list[str], word: str, max_distance: int, lo: int = 0, hi: int | None = None
+) -> Iterator[tuple[int, str]]:
+    """Yield ``(distance, term)`` for the terms of ``terms[lo:hi]`` (sorted, all
+    of one length) within ``max_distance`` of ``word``, as :func:`bounded_levenshtein`.
+
+    Consecutive terms share the DP rows of their common prefix. Only the band of
+    cells within ``max_distance`` of the diagonal is computed (the others are
+    capped at ``max_distance + 1``), and once no cell of a prefix's row can end
+    within ``max_distance`` (its value plus the difference of the remaining
+    lengths) the terms under that prefix are skipped with a bisection, as in a
+    trie.
+    """
+    n = len(word)
+    hi = len(terms) if hi is None else hi
+    if lo >= hi:
+        return
+    length = len(terms[lo])
+    cap = max_distance + 1
+    first = [j if j <= max_distance else cap for j in range(n + 1)]
+    rows = [first]  # rows[d]: distances after d characters of ``prefix``
+    prefix = ""
+    i = lo
+    while i < hi:
+        term = terms[i]
+        shared = 0
+        limit = min(len(prefix), len(term))
+        while shared < limit and prefix[shared] == term[shared]:
+            shared += 1
+        del rows[shared + 1:]
+        prefix = term
+        pruned = False
+        for depth in range(shared + 1, length + 1):
+            previous = rows[depth - 1]
+            c = term[depth - 1]
+            current = [cap] * (n + 1)
+            if depth <= max_distance:
+                current[0] = depth
+            best = current[0] + abs(length - depth - n)
+            for j in range(max(1, depth - max_distance), min(n, depth + max_distance) + 1):
+                wj = word[j - 1]
+                val = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (wj != c))
+                if depth > 1 and j > 1 and wj == term[depth - 2] and word[j - 2] == c:
+                    val = min(val, rows[depth - 2][j - 2] + 1)
+                if val > cap:
+                    val = cap
+                current[j] = val
+                # Lower bound of the final distance through this cell.
+                gap = (length - depth) - (n - j)
+                reach = val + (gap if gap >= 0 else -gap)
+                if reach < best:
+                    best = reach
+            rows.append(current)
+            if best > max_distance:
+                i = bisect_left(terms, term[:depth] + _PREFIX_END, i + 1, hi)
+                pruned = True
+                break
+        if pruned:
+            continue
+        if rows[-1][n] <= max_distance:
+            yield rows[-1][n], term
+        i += 1
+
+
 class FuzzyIndex:
     """An index of canonical terms supporting fast bounded fuzzy lookup.
 
     Buckets candidates by (first character, length) and probes neighbouring
     length buckets within the allowed distance. Exact matches short-circuit.
+    With ``backend="trie"`` or ``"symspell"`` the candidates come from a walk
+    of the sorted terms or a delete-variant table instead of the bucket scan
+    (same candidates within the distance, same results); ``"numpy"`` scores the
+    bucket candidates of each length in one vectorized pass. ``None`` selects
+    :func:`default_backend` for the size of the vocabulary once it is built.
+
+    Fuzzy lookups are memoized per index, misses included, in an LRU of
+    ``cache_size`` entries (``None``: ``ECTOR_FUZZY_CACHE_SIZE``, else
+    :data:`DEFAULT_LOOKUP_CACHE_SIZE`; ``0`` disables it). Exact matches skip it.
     """
 
-    def __init__(self, terms: Iterable[str]):
+    def __init__(
+        self,
+        terms: Iterable[str],
+        backend: str | None = None,
+        cache_size: int | None = None,
+    ):
+        sized = backend is None
+        backend = default_backend() if sized else backend
+        if backend not in FUZZY_BACKENDS:
+            raise ValueError(f"backend must be one of {FUZZY_BACKENDS}, got {backend!r}")
+        if backend == "numpy" and np is None:
+            raise ImportError("The 'numpy' fuzzy backend needs NumPy installed.")
+        self.backend = backend
+        if cache_size is None:
+            cache_size = int(os.environ.get(FUZZY_CACHE_ENV) or DEFAULT_LOOKUP_CACHE_SIZE)
+        # (word, max_distance, vocabulary size) -> answer: entries from before
+        # an add() are never hit again and age out.
+        self._lookups = LRUCache(cache_size)
         self._terms: set[str] = set()
         self._by_bucket: dict[tuple[str, int], list[str]] = {}
+        # Terms by length, for first-letter typos (sorted for the trie backend).
+        self._by_length: dict[int, list[str]] = {}
+        # Length -> (its terms ordered by first letter, their code points as a
+        # matrix with one column per term), for the numpy backend.
+        self._matrices: dict[int, tuple[list[str], np.ndarray]] = {}
+        self._built = False
+        # hash(delete-variant) -> the term, or a tuple once several share it
+        # (tuples of strings drop out of the cyclic GC's tracking, lists would
+        # not; lists are only used while building, where appending to a shared
+        # tuple would copy it for every term of a common stem). A hash
+        # collision only adds a candidate, which verification rejects. String
+        # hashes differ between processes: rebuild, don't pickle.
+        self._variants: dict[int, str | tuple[str, ...]] = {}
         for term in terms:
             self.add(term)
+        if sized and backend == "buckets":
+            # Same storage as "numpy", which only adds the matrices below.
+            self.backend = backend = default_backend(len(self._terms))
+        if backend == "trie":
+            for words in self._by_length.values():
+                words.sort()
+        if backend == "numpy":
+            for length in self._by_length:
+                self._matrix(length)
+        variants = self._variants
+        for key, entry in variants.items():
+            if isinstance(entry, list):
+                variants[key] = tuple(entry)
+        self._built = True
 
     def add(self, term: str) -> None:
         term = term.strip().lower()
@@ -121,6 +419,25 @@ class FuzzyIndex:
         self._terms.add(term)
         key = (term[0], len(term))
         self._by_bucket.setdefault(key, []).append(term)
+        same_length = self._by_length.setdefault(len(term), [])
+        if self._built and self.backend == "trie":
+            insort(same_length, term)
+        else:
+            same_length.append(term)
+        if self.backend == "symspell":
+            prefix = term[:SYMSPELL_PREFIX_LENGTH]
+            variants = self._variants
+            for variant in _deletes(prefix, _delete_depth(len(term))):
+                key = hash(variant)
+                entry = variants.get(key)
+                if entry is None:
+                    variants[key] = term
+                elif isinstance(entry, str):
+                    variants[key] = (entry, term) if self._built else [entry, term]
+                elif isinstance(entry, list):
+                    entry.append(term)
+                else:
+                    variants[key] = (*entry, term)
 
     def __contains__(self, term: str) -> bool:
         return term.strip().lower() in self._terms
@@ -129,8 +446,18 @@ class FuzzyIndex:
         return len(self._terms)
 
     def candidates(self, word: str, max_distance: int) -> list[str]:
-        """Return candidate canonical terms plausibly within ``max_distance``."""
+        """Return candidate canonical terms plausibly within ``max_distance``.
+
+        These are the terms with ``word``'s first letter and a length within
+        ``max_distance``, plus (for ``max_distance >= 1``) the terms of exactly
+        its length; the symspell backend returns only those that can be within
+        ``max_distance`` of it.
+        """
         word = word.lower()
+        if self.backend == "symspell" and self._variants_cover(len(word), max_distance):
+            return self._symspell_candidates(word, max_distance)
+        if self.backend == "trie":
+            return self._trie_candidates(word, max_distance)
         n = len(word)
         out: list[str] = []
         # First-letter bucket plus, for substitutions of the first letter, allow
@@ -143,13 +470,106 @@ class FuzzyIndex:
             for length in range(n - max_distance, n + max_distance + 1):
                 out.extend(self._by_bucket.get((fl, length), ()))
         # Also consider same-length words with a different first letter (covers a
-        # typo in the first character), bounded to keep it cheap.
-        if max_distance >= 1:
-            for (fl, length), words in self._by_bucket.items():
-                if length == n and fl != (word[0] if word else ""):
-                    out.extend(words)
+        # typo in the first character), from the length index.
+        if max_distance >= 1 and word:
+            first = word[0]
+            out.extend(t for t in self._by_length.get(n, ()) if t[0] != first)
         return out
 
+    def _trie_candidates(self, word: str, max_distance: int) -> list[str]:
+        if not word:
+            return []
+        n = len(word)
+        first = word[0]
+        out: list[str] = []
+        for length in range(max(1, n - max_distance), n + max_distance + 1):
+            terms = self._by_length.get(length)
+            if not terms:
+                continue
+            lo = bisect_left(terms, first)
+            hi = bisect_left(terms, first + _PREFIX_END, lo)
+            # Other lengths: only terms with the word's first letter.
+            spans = [(lo, hi)]
+            if length == n and max_distance >= 1:
+                spans = [(0, len(terms))]
+            for start, end in spans:
+                out.extend(term for _, term in _trie_walk(terms, word, max_distance, start, end))
+        return out
+
+    @staticmethod
+    def _variants_cover(n: int, max_distance: int) -> bool:
+        # Deeper lookups than the indexed deletes fall back to the bucket scan.
+        return all(
+            _delete_depth(length) >= max_distance
+            for length in range(max(1, n - max_distance), n + max_distance + 1)
+        )
+
+    def _symspell_candidates(self, word: str, max_distance: int) -> list[str]:
+        n = len(word)
+        first = word[:1]
+        seen: set[str] = set()
+        out: list[str] = []
+        for variant in _deletes(word[:SYMSPELL_PREFIX_LENGTH], max_distance):
+            entry = self._variants.get(hash(variant), ())
+            for term in (entry,) if isinstance(entry, str) else entry:
+                if term in seen:
+                    continue
+                seen.add(term)
+                # Keep to the bucket backend's candidates (see ``candidates``).
+                length = len(term)
+                if (term[0] == first and abs(length - n) <= max_distance) or (
+                    length == n and max_distance >= 1
+                ):
+                    out.append(term)
+        return out
+
+    def _matrix(self, length: int) -> tuple[list[str], np.ndarray]:
+        terms = self._by_length[length]
+        cached = self._matrices.get(length)
+        if cached is None or len(cached[0]) != len(terms):  # rebuilt after add()
+            ordered = sorted(terms, key=lambda term: term[0])
+            codes = np.frombuffer("".join(ordered).encode("utf-32-le"), dtype="<u4")
+            # Transposed (one column per term) so each character position is contiguous.
+            cached = (ordered, np.ascontiguousarray(codes.reshape(len(ordered), length).T))
+            self._matrices[length] = cached
+        return cached
+
+    def _numpy_scored(self, word: str, max_distance: int) -> list[tuple[str, int]]:
+        # (term, distance) for the bucket candidates within ``max_distance``.
+        n = len(word)
+        masks = [(ord(ch), mask) for ch, mask in _match_masks(word).items()]
+        first = ord(word[0])
+        out = []
+        for length in range(max(1, n - max_distance), n + max_distance + 1):
+            if length not in self._by_length:
+                continue
+            terms, codes = self._matrix(length)
+            lo, hi = 0, len(terms)
+            if length != n:  # other lengths: the word's first letter only
+                lo, hi = np.searchsorted(codes[0], [first, first + 1]).tolist()
+            if hi - lo < _NUMPY_MIN_ROWS:  # not worth the array set-up
+                few = terms[lo:hi]
+                out += zip(few, distances(word, few, max_distance), strict=True)
+                continue
+            scores = _bit_parallel_matrix(masks, n, codes[:, lo:hi], max_distance)
+            for row in np.flatnonzero(scores <= max_distance).tolist():
+                out.append((terms[lo + row], int(scores[row])))
+        return out
+
+    def cache_info(self) -> dict[str, Any]:
+        """Counters and bounds of the lookup memo (see :meth:`LRUCache.info`)."""
+        return self._lookups.info()
+
+    def resize_cache(self, maxsize: int) -> None:
+        """Resize (``maxsize > 0``) or disable (``0``) the lookup memo."""
+        self._lookups.resize(maxsize)
+        if maxsize <= 0:
+            self._lookups.clear()
+
+    def clear_cache(self) -> None:
+        """Forget every remembered lookup and reset the counters."""
+        self._lookups.clear()
+
     def best_match(self, word: str, max_distance: int | None = None) -> str | None:
         """Return the closest canonical term within threshold, or ``None``.
 
@@ -161,14 +581,26 @@ class FuzzyIndex:
         w = word.lower()
         if w in self._terms:
             return w
+        key = (w, max_distance, len(self._terms))
+        found = self._lookups.get(key, _NOT_CACHED)
+        if found is _NOT_CACHED:
+            found = self._closest(w, max_distance)
+            self._lookups.put(key, found)
+        return found
+
+    def _closest(self, w: str, max_distance: int | None) -> str | None:
         md = threshold_for(w) if max_distance is None else max_distance
         if md <= 0:
             return None
 
         best: str | None = None
         best_dist = md + 1
-        for cand in self.candidates(w, md):
-            d = bounded_levenshtein(w, cand, md)
+        if self.backend == "numpy" and len(w) <= _WORD_BITS:
+            scored = self._numpy_scored(w, md)
+        else:
+            candidates = self.candidates(w, md)
+            scored = zip(candidates, distances(w, candidates, md), strict=True)
+        for cand, d in scored:
             if d < best_dist or (
                 d == best_dist
                 and best is not None
@@ -178,22 +610,23 @@ class FuzzyIndex:
         return best if best is not None and best_dist <= md else None
 
 
-@lru_cache(maxsize=4096)
-def _cached_lookup(index_id: int, word: str, max_distance: int | None) -> str | None:
-    index = _REGISTERED_INDEXES[index_id]
-    return index.best_match(word, max_distance)
-
-
-_REGISTERED_INDEXES: dict[int, FuzzyIndex] = {}
+_REGISTERED_INDEXES: weakref.WeakValueDictionary[int, FuzzyIndex] = (
+    weakref.WeakValueDictionary()
+)
+_TOKENS = count(1)
 
 
 def register_index(index: FuzzyIndex) -> int:
-    """Register an index for cached lookups; returns its id token."""
-    token = id(index)
+    """Register an index for :func:`cached_best_match`; returns its token.
+
+    Tokens are never reused and the registry does not keep the index alive.
+    New code can call ``index.best_match`` directly: it is memoized per index.
+    """
+    token = next(_TOKENS)
     _REGISTERED_INDEXES[token] = index
     return token
 
 
 def cached_best_match(token: int, word: str, max_distance: int | None = None) -> str | None:
-    """Cached best-match lookup against a previously registered index."""
-    return _cached_lookup(token, word, max_distance)
+    """``best_match`` against a registered index (``KeyError`` once it is collected)."""
+    return _REGISTERED_INDEXES[token].best_match(word, max_distance)
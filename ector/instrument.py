@@ -0,0 +1,253 @@
+"""Opt-in per-stage timing for the extraction pipeline.
+
+Disabled by default. While disabled, :func:`stage` returns one shared no-op
+context manager, so the instrumented code pays a single function call per stage.
+Enable with ``ECTOR_INSTRUMENT=1`` or :func:`enable`.
+
+When enabled, each :func:`ector.extract_sync` call collects a record::
+
+    {
+        "stages": {"spacy": {"seconds": 0.0041, "calls": 1}, ...},
+        "counters": {"extract_cache_miss": 1, ...},
+        "seconds": 0.0052,
+        "lang": "en",
+        "chars": 42,
+    }
+
+Records are passed to every hook registered with :func:`add_hook` and folded
+into an in-process histogram per stage (time spent in that stage per call),
+read with :func:`snapshot`. Cache activity shows up as counters
+(``extract_cache_hit`` / ``_miss``, ``clause_cache_hit`` / ``_miss`` and, with
+a doc cache configured, ``doc_cache_hit`` / ``_miss``). Stages
+timed outside an ``extract_sync`` call (bulk extraction) are added to the
+histogram one invocation at a time.
+
+Stages: ``normalize_vocabulary``, ``normalize_text``, ``spacy`` (the full
+pipeline), ``tokenize`` (the blank tokenizer of the tiered and rules fast
+path), ``find_main_product_tokens``, ``extract_products_fallback``, ``enrich``
+(brand/attributes/condition), ``parse_constraint``, ``classify_intent``.
+"""
+
+from __future__ import annotations
+
+import bisect
+import contextlib
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from contextvars import ContextVar
+from typing import Any
+
+logger = logging.getLogger("ector.instrument")
+
+# Histogram bucket upper bounds, in milliseconds (last bucket is open-ended).
+BUCKET_BOUNDS_MS = (0.01, 0.05, 0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0, 500.0, 1000.0)
+
+_enabled = os.environ.get("ECTOR_INSTRUMENT", "").strip().lower() in {"1", "true", "yes", "on"}
+_NULL = contextlib.nullcontext()
+_current: ContextVar[_Record | None] = ContextVar("ector_instrument_record", default=None)
+_hooks: list[Callable[[dict], None]] = []
+_lock = threading.Lock()
+
+
+class _Histogram:
+    __slots__ = ("count", "total", "max", "buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+
+    def add(self, seconds: float) -> None:
+        ms = seconds * 1000.0
+        self.count += 1
+        self.total += ms
+        self.max = max(self.max, ms)
+        self.buckets[bisect.bisect_left(BUCKET_BOUNDS_MS, ms)] += 1
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the ``q`` quantile (max if open)."""
+        rank = q * self.count
+        seen = 0
+        for bound, n in zip(BUCKET_BOUNDS_MS, self.buckets, strict=False):
+            seen += n
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "total_ms": self.total,
+            "mean_ms": self.total / self.count if self.count else 0.0,
+            "max_ms": self.max,
+            "p50_ms": self.quantile(0.5),
+            "p99_ms": self.quantile(0.99),
+            "buckets": list(self.buckets),
+        }
+
+
+_histograms: dict[str, _Histogram] = {}
+_counters: Counter[str] = Counter()
+
+
+class _Record:
+    __slots__ = ("stages", "counters")
+
+    def __init__(self) -> None:
+        self.stages: dict[str, list] = {}
+        self.counters: Counter[str] = Counter()
+
+
+class _Stage:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc) -> None:
+        elapsed = time.perf_counter() - self.start
+        record = _current.get()
+        if record is None:
+            _observe(self.name, elapsed)
+            return
+        entry = record.stages.get(self.name)
+        if entry is None:
+            record.stages[self.name] = [elapsed, 1]
+        else:
+            entry[0] += elapsed
+            entry[1] += 1
+
+
+def _histogram(name: str) -> _Histogram:
+    # Caller holds ``_lock``.
+    hist = _histograms.get(name)
+    if hist is None:
+        hist = _histograms[name] = _Histogram()
+    return hist
+
+
+def _observe(name: str, seconds: float) -> None:
+    with _lock:
+        _histogram(name).add(seconds)
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def enable() -> None:
+    global _enabled
+    _enabled = True
+
+
+def disable() -> None:
+    global _enabled
+    _enabled = False
+
+
+def stage(name: str):
+    """Context manager timing one pipeline stage (no-op while disabled)."""
+    return _Stage(name) if _enabled else _NULL
+
+
+def count(name: str, n: int = 1) -> None:
+    """Bump a counter (e.g. a cache hit) on the current call record."""
+    if not _enabled:
+        return
+    record = _current.get()
+    if record is not None:
+        record.counters[name] += n
+    else:
+        with _lock:
+            _counters[name] += n
+
+
+class _Call:
+    __slots__ = ("lang", "chars", "record", "token", "start")
+
+    def __init__(self, lang: str, chars: int) -> None:
+        self.lang = lang
+        self.chars = chars
+
+    def __enter__(self) -> None:
+        self.record = _Record()
+        self.token = _current.set(self.record)
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc) -> None:
+        seconds = time.perf_counter() - self.start
+        _current.reset(self.token)
+        _finish(self.record, seconds, self.lang, self.chars)
+
+
+def call(lang: str, chars: int):
+    """Context manager collecting one ``extract_sync`` call's stages.
+
+    On exit the record is folded into the histograms and passed to the hooks.
+    Nested calls are absorbed by the outermost one.
+    """
+    if not _enabled or _current.get() is not None:
+        return _NULL
+    return _Call(lang, chars)
+
+
+def _finish(record: _Record, seconds: float, lang: str, chars: int) -> None:
+    report = {
+        "stages": {
+            name: {"seconds": total, "calls": calls}
+            for name, (total, calls) in record.stages.items()
+        },
+        "counters": dict(record.counters),
+        "seconds": seconds,
+        "lang": lang,
+        "chars": chars,
+    }
+    with _lock:
+        for name, (total, _) in record.stages.items():
+            _histogram(name).add(total)
+        _histogram("total").add(seconds)
+        _counters.update(record.counters)
+        _counters["calls"] += 1
+        hooks = list(_hooks)
+    for hook in hooks:
+        try:
+            hook(report)
+        except Exception:  # a broken metrics hook must not fail extraction
+            logger.exception("Instrumentation hook %r failed", hook)
+
+
+def add_hook(hook: Callable[[dict], None]) -> None:
+    """Call ``hook(record)`` after every instrumented ``extract_sync`` call."""
+    with _lock:
+        _hooks.append(hook)
+
+
+def remove_hook(hook: Callable[[dict], None]) -> None:
+    with _lock:
+        if hook in _hooks:
+            _hooks.remove(hook)
+
+
+def snapshot() -> dict[str, Any]:
+    """Aggregated per-stage histograms and counters since the last :func:`reset`."""
+    with _lock:
+        return {
+            "enabled": _enabled,
+            "bucket_bounds_ms": list(BUCKET_BOUNDS_MS),
+            "stages": {name: hist.summary() for name, hist in sorted(_histograms.items())},
+            "counters": dict(_counters),
+        }
+
+
+def reset() -> None:
+    with _lock:
+        _histograms.clear()
+        _counters.clear()
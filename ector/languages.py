@@ -10,8 +10,9 @@ See ``docs/features/04-multilingual-support.md``.
 from __future__ import annotations
 
 import logging
+import os
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from functools import cache
 
 from ector.dictionary import (
@@ -55,6 +56,19 @@ class LanguageConfig:
     copula_lemmas: frozenset[str] = field(default_factory=frozenset)
     expletives: frozenset[str] = field(default_factory=frozenset)
     price_prepositions: frozenset[str] = field(default_factory=frozenset)
+    # Larger pipelines that re-parse low-confidence requests, in order
+    # (:mod:`ector.cascade`). Empty: ``model_name`` answers everything.
+    cascade_models: tuple[str, ...] = ()
+
+    @property
+    def models(self) -> tuple[str, ...]:
+        """``model_name`` followed by the cascade models."""
+        return (self.model_name, *self.cascade_models)
+
+
+def _env_models(code: str) -> tuple[str, ...]:
+    raw = os.environ.get(f"ECTOR_CASCADE_MODELS_{code.upper()}", "")
+    return tuple(name.strip() for name in raw.split(",") if name.strip())
 
 
 def _make_config(
@@ -77,6 +91,7 @@ def _make_config(
         copula_lemmas=frozenset(copula_lemmas),
         expletives=frozenset(expletives),
         price_prepositions=frozenset(price_prepositions),
+        cascade_models=_env_models(code),
     )
 
 
@@ -119,6 +134,18 @@ def get_language(code: str | None) -> LanguageConfig:
     return registry[ENGLISH]
 
 
+def configure_cascade(code: str, models: list[str] | tuple[str, ...]) -> LanguageConfig:
+    """Set the cascade models of language ``code`` (empty: no cascade).
+
+    Overrides ``ECTOR_CASCADE_MODELS_<CODE>``; returns the updated config.
+    """
+    registry = _registry()
+    if code not in registry:
+        raise ValueError(f"unsupported language {code!r}")
+    registry[code] = replace(registry[code], cascade_models=tuple(models))
+    return registry[code]
+
+
 def supported_languages() -> tuple[str, ...]:
     """Return the tuple of supported language codes."""
     return tuple(_registry().keys())
@@ -1,33 +1,60 @@
 """spaCy model management: cached loading + safe, opt-in download.
 
-Fixes BUG-005 (model reloaded every call) via an ``lru_cache`` and BUG-006
+Fixes BUG-005 (model reloaded every call) by caching loaded pipelines and BUG-006
 (``python`` hardcoded; implicit runtime download) by using ``sys.executable`` and
 making auto-download opt-in.
 
+Pipelines are held by a :class:`ModelManager`: a model is loaded on first use
+and can be released again after ``ECTOR_MODEL_IDLE_TIMEOUT`` seconds without
+use, or (least recently used first) when the models' approximate resident
+memory exceeds ``ECTOR_MODEL_MEMORY_BUDGET_MB``. Both are off by default, so a
+loaded model stays resident as before. :func:`model_info` reports what is
+loaded.
+
+Threads that parse concurrently can each take their own pipeline from a
+:class:`ModelPool` with :func:`checkout_model` (``ECTOR_MODEL_POOL_SIZE``
+instances per model, sharing one vocab). With the default size ``0`` every
+thread shares the :func:`get_model` pipeline.
+
+``mode="rules"`` extraction needs no installed model at all: it only uses the
+rule-based tokenizer of :func:`get_blank_model`.
+
 See ``docs/features/05-model-management-and-caching.md``.
 """
 
 from __future__ import annotations
 
+import contextlib
+import functools
 import logging
 import os
+import queue
 import subprocess
 import sys
-from functools import cache
+import threading
+import time
+import weakref
+from collections.abc import Callable, Iterator
+from typing import Any
 
 import spacy
 from spacy.language import Language
 from spacy.util import is_package
+from spacy.vocab import Vocab
+
+from ector.profiles import PROFILES, configure_pipeline, resolve_profile
+from ector.snapshot import clear_snapshot_cache, load_pipeline, snapshot_path
 
 logger = logging.getLogger("ector.models")
 
 # Environment flag that opts in to automatic model download on a cache miss.
 AUTO_DOWNLOAD_ENV = "ECTOR_AUTO_DOWNLOAD"
+IDLE_TIMEOUT_ENV = "ECTOR_MODEL_IDLE_TIMEOUT"
+MEMORY_BUDGET_ENV = "ECTOR_MODEL_MEMORY_BUDGET_MB"
+POOL_SIZE_ENV = "ECTOR_MODEL_POOL_SIZE"
 
-# Pipeline components ECTOR does not use; disabled for speed. We rely on the
-# tagger (pos_), parser (dep_ + sentence boundaries), attribute_ruler, and
-# lemmatizer. Named-entity recognition is not used.
-_DISABLED_PIPES = ("ner",)
+# Which components are loaded is decided by the pipeline profile
+# (:mod:`ector.profiles`); every profile excludes NER, which ECTOR never reads.
 
 
 def _auto_download_enabled() -> bool:
@@ -47,17 +74,39 @@ def download_model(model_name: str) -> None:
     )
 
 
-@cache
-def get_model(model_name: str) -> Language:
-    """Load and cache a spaCy pipeline by model name.
+def _env_number(name: str) -> float:
+    try:
+        return max(0.0, float(os.environ.get(name, "0")))
+    except ValueError:
+        return 0.0
 
-    The first call loads the model from disk; subsequent calls for the same model
-    return the cached pipeline instantly (BUG-005 fix).
 
-    If the model is not installed:
-      - with ``ECTOR_AUTO_DOWNLOAD`` enabled, it is downloaded then loaded;
-      - otherwise a clear, actionable :class:`OSError` is raised.
-    """
+def _resident_bytes() -> int | None:
+    """Current resident set size of this process (Linux ``/proc``), else ``None``."""
+    try:
+        with open("/proc/self/statm") as handle:
+            pages = int(handle.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def model_installed(model_name: str) -> bool:
+    """Whether ``model_name`` can be loaded without downloading it."""
+    return is_package(model_name)
+
+
+def _load_model(
+    model_name: str,
+    profile: str = "accurate",
+    vocab: Vocab | None = None,
+    use_snapshot: bool = True,
+) -> Language:
+    path = snapshot_path() if use_snapshot else None
+    if path is not None:
+        nlp = load_pipeline(path, _model_key(model_name, profile), vocab)
+        if nlp is not None:
+            return nlp
     if not is_package(model_name):
         if _auto_download_enabled():
             download_model(model_name)
@@ -68,10 +117,376 @@ def get_model(model_name: str) -> Language:
                 f"or install ECTOR's model extras: pip install 'ector[models]'.\n"
                 f"Alternatively set {AUTO_DOWNLOAD_ENV}=1 to auto-download."
             )
-    # Disable unused pipeline components (NER) for speed; ignore if absent.
-    return spacy.load(model_name, exclude=list(_DISABLED_PIPES))
+    # Leave out the components the profile does not use; ignore if absent.
+    spec = PROFILES[profile]
+    kwargs = {"vocab": vocab} if vocab is not None else {}
+    return configure_pipeline(spacy.load(model_name, exclude=list(spec.exclude), **kwargs), spec)
+
+
+def _model_key(model_name: str, profile: str) -> str:
+    return model_name if profile == "accurate" else f"{model_name}:{profile}"
+
+
+class _Resident:
+    __slots__ = ("nlp", "rss_bytes", "loaded_at", "last_used", "uses")
+
+    def __init__(self, nlp: Language, rss_bytes: int | None):
+        self.nlp = nlp
+        self.rss_bytes = rss_bytes
+        self.loaded_at = self.last_used = time.monotonic()
+        self.uses = 0
+
+
+class ModelManager:
+    """Loads pipelines on first use and releases idle ones.
+
+    ``idle_timeout`` (seconds, ``0``: never) evicts a model not requested for
+    that long; ``memory_budget`` (bytes, ``0``: unbounded) evicts the least
+    recently used models while the sum of their approximate RSS exceeds it.
+    The model being requested is never evicted. Eviction is checked on every
+    :meth:`get` and by :meth:`evict_idle`, which a server can call periodically.
+
+    A model's RSS is the growth of the process RSS while it loaded, so it is an
+    approximation; memory freed by eviction may not be returned to the OS.
+    Whatever else holds a pipeline (a :class:`ModelPool`) registers with
+    :meth:`add_eviction_listener` to let go of it too.
+    """
+
+    def __init__(self, idle_timeout: float = 0.0, memory_budget: int = 0):
+        self.idle_timeout = max(0.0, idle_timeout)
+        self.memory_budget = max(0, memory_budget)
+        self._models: dict[str, _Resident] = {}
+        self._lock = threading.Lock()
+        self._load_locks: dict[str, threading.Lock] = {}
+        self._listeners: list[weakref.WeakMethod] = []
+        self.loads = 0
+        self.evictions = 0
+
+    def add_eviction_listener(self, callback: Callable[[str], None]) -> None:
+        """Call the bound method ``callback(name)`` whenever a pipeline is released.
+
+        Held weakly, so a listener's owner can still be garbage collected. It
+        runs under the manager's lock and must not call back into the manager.
+        """
+        with self._lock:
+            self._listeners = [ref for ref in self._listeners if ref() is not None]
+            self._listeners.append(weakref.WeakMethod(callback))
+
+    def _notify(self, name: str) -> None:
+        # Caller holds ``_lock``.
+        for ref in self._listeners:
+            callback = ref()
+            if callback is not None:
+                callback(name)
+
+    def get(self, model_name: str, profile: str | None = None) -> Language:
+        """Return the loaded pipeline for ``model_name``, loading it if needed.
+
+        Each pipeline profile is a separate entry, named ``model:profile``
+        (just ``model`` for ``"accurate"``).
+        """
+        profile = resolve_profile(profile)
+        key = _model_key(model_name, profile)
+        with self._lock:
+            resident = self._models.get(key)
+            if resident is None:
+                load_lock = self._load_locks.setdefault(key, threading.Lock())
+        if resident is None:
+            # Load outside ``_lock`` so other languages keep being served.
+            with load_lock:
+                resident = self._models.get(key) or self._load(key, model_name, profile)
+        with self._lock:
+            resident.last_used = time.monotonic()
+            resident.uses += 1
+            self._evict(keep=key)
+        return resident.nlp
+
+    def _load(self, key: str, model_name: str, profile: str) -> _Resident:
+        before = _resident_bytes()
+        nlp = _load_model(model_name, profile)
+        after = _resident_bytes()
+        rss = max(0, after - before) if before is not None and after is not None else None
+        resident = _Resident(nlp, rss)
+        with self._lock:
+            self._models[key] = resident
+            self.loads += 1
+        logger.info("Loaded spaCy model %s (~%s bytes)", key, rss)
+        return resident
+
+    def _evict(self, keep: str | None = None) -> None:
+        # Caller holds ``_lock``.
+        if self.idle_timeout:
+            cutoff = time.monotonic() - self.idle_timeout
+            for name in [n for n, r in self._models.items() if r.last_used < cutoff]:
+                if name != keep:
+                    self._drop(name, "idle")
+        if self.memory_budget:
+            by_age = sorted(self._models, key=lambda n: self._models[n].last_used)
+            for name in by_age:
+                if self._resident_total() <= self.memory_budget:
+                    break
+                if name != keep:
+                    self._drop(name, "memory budget")
+
+    def _resident_total(self) -> int:
+        return sum(r.rss_bytes or 0 for r in self._models.values())
+
+    def _drop(self, name: str, reason: str) -> None:
+        del self._models[name]
+        self.evictions += 1
+        self._notify(name)
+        logger.info("Evicted spaCy model %s (%s)", name, reason)
+
+    def evict_idle(self) -> None:
+        """Apply the idle timeout and memory budget now."""
+        with self._lock:
+            self._evict()
+
+    def evict(self, model_name: str) -> bool:
+        """Release one pipeline by its :meth:`loaded` name; returns whether it was loaded."""
+        with self._lock:
+            if model_name not in self._models:
+                return False
+            self._drop(model_name, "explicit")
+            return True
+
+    def configure(
+        self,
+        idle_timeout: float | None = None,
+        memory_budget: int | None = None,
+    ) -> None:
+        """Change the limits (``None`` keeps one) and apply them at once."""
+        with self._lock:
+            if idle_timeout is not None:
+                self.idle_timeout = max(0.0, idle_timeout)
+            if memory_budget is not None:
+                self.memory_budget = max(0, memory_budget)
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            for name in list(self._models):
+                del self._models[name]
+                self._notify(name)
+
+    def loaded(self) -> list[str]:
+        with self._lock:
+            return list(self._models)
+
+    def info(self) -> dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                "models": {
+                    name: {
+                        "rss_bytes": r.rss_bytes,
+                        "idle_seconds": now - r.last_used,
+                        "uses": r.uses,
+                    }
+                    for name, r in self._models.items()
+                },
+                "models_rss_bytes": self._resident_total(),
+                "process_rss_bytes": _resident_bytes(),
+                "idle_timeout": self.idle_timeout,
+                "memory_budget": self.memory_budget,
+                "loads": self.loads,
+                "evictions": self.evictions,
+            }
+
+
+_MANAGER = ModelManager(
+    idle_timeout=_env_number(IDLE_TIMEOUT_ENV),
+    memory_budget=int(_env_number(MEMORY_BUDGET_ENV) * 1024 * 1024),
+)
+
+
+def get_model(model_name: str, profile: str | None = None) -> Language:
+    """Load and cache a spaCy pipeline by model name and pipeline profile.
+
+    ``profile`` is one of :data:`ector.profiles.PROFILES` (``None``:
+    ``ECTOR_PROFILE``, else ``"accurate"``).
+
+    The first call loads the model from disk; subsequent calls for the same model
+    return the cached pipeline instantly (BUG-005 fix), unless the
+    :class:`ModelManager` released it in between.
+
+    If the model is not installed:
+      - with ``ECTOR_AUTO_DOWNLOAD`` enabled, it is downloaded then loaded;
+      - otherwise a clear, actionable :class:`OSError` is raised.
+    """
+    return _MANAGER.get(model_name, profile)
+
+
+@functools.cache
+def get_blank_model(lang_code: str) -> Language:
+    """spaCy's blank pipeline for ``lang_code``: tokenizer only, nothing to download."""
+    return spacy.blank(lang_code)
+
+
+def get_model_manager() -> ModelManager:
+    return _MANAGER
+
+
+class _PoolSlot:
+    __slots__ = ("idle", "created", "has_base", "create_lock")
+
+    def __init__(self) -> None:
+        self.idle: queue.LifoQueue[Language] = queue.LifoQueue()
+        self.created = 0
+        self.has_base = False
+        self.create_lock = threading.Lock()
+
+
+class ModelPool:
+    """Up to ``size`` pipeline instances per model, each used by one thread at a time.
+
+    Instances are created on demand: the first is the ``manager``'s pipeline
+    (:func:`get_model`), the others are loaded separately, each with its own
+    vocab, so no two threads ever write to the same string store (a vectors
+    model keeps one vectors table per instance). A thread that finds every
+    instance checked out waits for one to come back. ``size=0`` disables
+    pooling and :meth:`checkout` hands every thread the shared pipeline.
+
+    The manager's memory budget only counts the first instance, but when it
+    releases a pipeline (idle, over budget or explicit) the pool drops that
+    model's instances too; ones still checked out go when they are returned.
+    """
+
+    def __init__(self, size: int = 0, manager: ModelManager | None = None):
+        self.size = max(0, size)
+        self._manager = manager if manager is not None else _MANAGER
+        self._slots: dict[str, _PoolSlot] = {}
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self._manager.add_eviction_listener(self.discard)
+
+    @contextlib.contextmanager
+    def checkout(self, model_name: str, profile: str | None = None) -> Iterator[Language]:
+        """Borrow a pipeline for the duration of the ``with`` block."""
+        if self.size <= 0:
+            yield self._manager.get(model_name, profile)
+            return
+        profile = resolve_profile(profile)
+        key = _model_key(model_name, profile)
+        with self._lock:
+            slot = self._slots.get(key)
+            if slot is None:
+                slot = self._slots[key] = _PoolSlot()
+            self.checkouts += 1
+        nlp = self._acquire(slot, model_name, profile)
+        try:
+            yield nlp
+        finally:
+            self._release(slot, nlp)
+
+    def _acquire(self, slot: _PoolSlot, model_name: str, profile: str) -> Language:
+        waiting_since = None
+        while True:
+            try:
+                nlp = slot.idle.get_nowait()
+                break
+            except queue.Empty:
+                pass
+            with self._lock:
+                create = slot.created < self.size
+                if create:
+                    slot.created += 1
+            if create:
+                try:
+                    nlp = self._create(slot, model_name, profile)
+                except BaseException:
+                    with self._lock:
+                        slot.created -= 1
+                    raise
+                break
+            if waiting_since is None:
+                waiting_since = time.perf_counter()
+            try:
+                # Short timeout: a failed creation elsewhere frees a slot
+                # without returning an instance.
+                nlp = slot.idle.get(timeout=0.05)
+                break
+            except queue.Empty:
+                continue
+        if waiting_since is not None:
+            with self._lock:
+                self.waits += 1
+                self.wait_seconds += time.perf_counter() - waiting_since
+        return nlp
+
+    def _create(self, slot: _PoolSlot, model_name: str, profile: str) -> Language:
+        # Exactly one creator takes the manager's pipeline; the others load copies.
+        with slot.create_lock:
+            if not slot.has_base:
+                nlp = self._manager.get(model_name, profile)
+                slot.has_base = True
+                return nlp
+        return _load_model(model_name, profile)
+
+    def _release(self, slot: _PoolSlot, nlp: Language) -> None:
+        with self._lock:
+            if slot.created > self.size:  # pool shrank while it was out
+                slot.created -= 1
+                return
+        slot.idle.put(nlp)
+
+    def resize(self, size: int) -> None:
+        """Change the per-model instance limit; extra instances are dropped on return."""
+        with self._lock:
+            self.size = max(0, size)
+            for slot in self._slots.values():
+                while slot.created > self.size:
+                    try:
+                        slot.idle.get_nowait()
+                    except queue.Empty:
+                        break
+                    slot.created -= 1
+
+    def discard(self, key: str) -> None:
+        """Drop the instances of one pipeline (``model`` or ``model:profile``)."""
+        with self._lock:
+            self._slots.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._slots.clear()
+
+    def info(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "size": self.size,
+                "instances": {key: slot.created for key, slot in self._slots.items()},
+                "idle": {key: slot.idle.qsize() for key, slot in self._slots.items()},
+                "checkouts": self.checkouts,
+                "waits": self.waits,
+                "wait_seconds": self.wait_seconds,
+            }
+
+
+_POOL = ModelPool(int(_env_number(POOL_SIZE_ENV)))
+
+
+def checkout_model(model_name: str, profile: str | None = None):
+    """Context manager lending a pipeline to the calling thread (see :class:`ModelPool`)."""
+    return _POOL.checkout(model_name, profile)
+
+
+def configure_model_pool(size: int) -> None:
+    """Set the number of pipeline instances per model (``0`` shares one)."""
+    _POOL.resize(size)
+
+
+def model_info() -> dict[str, Any]:
+    """Resident models with approximate RSS and idle time, the limits and the pool."""
+    info = _MANAGER.info()
+    info["pool"] = _POOL.info()
+    return info
 
 
 def clear_model_cache() -> None:
     """Clear the cached models (useful for tests)."""
-    get_model.cache_clear()
+    _MANAGER.clear()
+    _POOL.clear()
+    clear_snapshot_cache()
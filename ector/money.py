@@ -25,12 +25,11 @@ from ector.dictionary.numbers import (
     FR_NUMBER_FILLERS,
     number_vocab,
 )
-from ector.fuzzy import FuzzyIndex, cached_best_match, register_index
+from ector.fuzzy import FuzzyIndex
 from ector.types import Currency, Price
 
 # Fuzzy index over currency words, for correcting misspellings like "dollr".
 _CURRENCY_INDEX = FuzzyIndex(list(CURRENCY_WORDS) + list(CURRENCY_MISSPELLINGS))
-_CURRENCY_TOKEN = register_index(_CURRENCY_INDEX)
 
 # "1k" / "2.5k" shorthand, but ONLY when adjacent to a currency token/symbol so
 # that resolution specs like "4k HD" are never read as money. The currency may
@@ -85,7 +84,7 @@ def normalize_currency(token: str | None) -> Currency:
     if key in CURRENCY_MISSPELLINGS:
         return CURRENCY_MAP.get(CURRENCY_MISSPELLINGS[key])
     # Fuzzy: correct a misspelled currency word to a known one.
-    match = cached_best_match(_CURRENCY_TOKEN, key)
+    match = _CURRENCY_INDEX.best_match(key)
     if match is not None:
         canonical = CURRENCY_MISSPELLINGS.get(match, match)
         if canonical in CURRENCY_MAP:
@@ -0,0 +1,119 @@
+"""Multi-core extraction: a fork-based process pool with models preloaded.
+
+One Python process tops out at one core (GIL). :class:`ParallelExtractor` loads
+the spaCy pipelines and the lazy fuzzy indexes once in the parent (:func:`warm`),
+freezes the heap, then forks workers. The workers inherit the already-built
+objects and share their memory pages copy-on-write instead of each paying for a
+private model load.
+
+Work is split into chunks of ``chunk_size`` texts; each worker runs
+:func:`ector.api.extract_many` on its chunk and results come back in input order.
+
+Example::
+
+    from ector.parallel import ParallelExtractor
+
+    with ParallelExtractor(processes=4, lang="en") as engine:
+        for result in engine.map(lines):
+            ...
+"""
+
+from __future__ import annotations
+
+import gc
+import logging
+import multiprocessing
+import os
+from collections.abc import Iterable, Iterator
+
+from ector.api import DEFAULT_BATCH_SIZE, batched, extract_many
+from ector.preload import warmup
+from ector.types import ExtractResult
+
+logger = logging.getLogger("ector.parallel")
+
+_DEFAULT_CHUNK_SIZE = 64
+
+
+def warm(langs: Iterable[str] | None = None) -> None:
+    """Load the spaCy model and build every lazy fuzzy index for ``langs``.
+
+    Called in the parent before forking so workers start with everything
+    resident. Defaults to all supported languages. Raises like
+    :func:`ector.models.get_model` when a model is missing (see
+    :func:`ector.preload.warmup` for the non-raising, reporting variant).
+    """
+    warmup(langs, strict=True)
+
+
+def _extract_chunk(task: tuple[list[str], str, int]) -> list[ExtractResult]:
+    texts, lang, batch_size = task
+    return list(extract_many(texts, lang, batch_size=batch_size))
+
+
+class ParallelExtractor:
+    """Spread extraction across ``processes`` forked workers with ordered results.
+
+    :param processes: worker count (default: ``os.cpu_count()``). ``1`` runs
+        inline in the current process, which is the scaling baseline.
+    :param lang: language of every text passed to :meth:`map`.
+    :param chunk_size: texts per task sent to a worker. Larger chunks amortize
+        IPC; smaller chunks balance load better.
+    :param batch_size: ``nlp.pipe`` batch size used inside each worker.
+    """
+
+    def __init__(
+        self,
+        processes: int | None = None,
+        lang: str = "en",
+        chunk_size: int = _DEFAULT_CHUNK_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        self.processes = max(1, processes or os.cpu_count() or 1)
+        self.lang = lang
+        self.chunk_size = chunk_size
+        self.batch_size = batch_size
+        self._pool = None
+
+    def start(self) -> ParallelExtractor:
+        """Warm models/indexes in the parent, then fork the worker pool."""
+        if self._pool is not None:
+            return self
+        if self.processes > 1 and "fork" not in multiprocessing.get_all_start_methods():
+            raise RuntimeError("ParallelExtractor requires the 'fork' start method")
+        warm([self.lang])
+        if self.processes == 1:
+            return self
+        # Move everything built so far to a permanent generation so the cyclic
+        # GC never writes to (and un-shares) those pages in the children.
+        gc.freeze()
+        logger.debug("Forking %d extraction workers", self.processes)
+        self._pool = multiprocessing.get_context("fork").Pool(self.processes)
+        return self
+
+    def map(self, texts: Iterable[str]) -> Iterator[ExtractResult]:
+        """Yield one result per text, in input order."""
+        self.start()
+        tasks = ((chunk, self.lang, self.batch_size) for chunk in batched(texts, self.chunk_size))
+        if self._pool is None:
+            chunks = map(_extract_chunk, tasks)
+        else:
+            chunks = self._pool.imap(_extract_chunk, tasks)
+        for chunk in chunks:
+            yield from chunk
+
+    def close(self) -> None:
+        """Stop the workers and release the pool."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+            gc.unfreeze()
+
+    def __enter__(self) -> ParallelExtractor:
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,137 @@
+"""Eager warm-up of everything ECTOR otherwise builds on first use.
+
+The first request in a fresh process pays for the spaCy model load (and the
+larger cascade models, if any, :mod:`ector.cascade`) and for the lazy fuzzy
+indexes (catalog, attribute, vocabulary-normalization and brand indexes, the
+per-language token stopwords). :func:`warmup` builds all of them up front and
+can replay a warm corpus through ``extract_sync`` so the result, clause and
+lookup caches start populated. It returns a report of each step and
+its duration::
+
+    >>> report = ector.warmup(["en"], corpus=["I want a laptop for 150 usd"])  # doctest: +SKIP
+    >>> report["steps"][0]
+    {'lang': 'en', 'step': 'model', 'seconds': 0.412, 'ok': True}
+
+The web app calls it at startup (``web/app.py``) and :func:`ector.parallel.warm`
+before forking workers.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+from ector.api import extract_sync
+from ector.attributes import _attr_index, _attr_set, _brand_index
+from ector.languages import get_language, supported_languages
+from ector.models import get_blank_model, get_model
+from ector.normalize import _index_for
+from ector.products import _attribute_index, _build_token_stopwords, _catalog_index
+from ector.profiles import resolve_profile
+
+CorpusItem = str | tuple[str, str] | Mapping[str, Any]
+
+
+def _language_steps(code: str, mode: str, profile: str) -> list[tuple[str, Callable[[], object]]]:
+    config = get_language(code)
+    if mode == "rules":
+        loads = [("blank_model", lambda: get_blank_model(config.code))]
+    else:
+        loads = [("model", lambda: get_model(config.model_name, profile))]
+        loads += [
+            ("cascade_model", lambda name=name: get_model(name, profile))
+            for name in config.cascade_models
+        ]
+    return [
+        *loads,
+        ("catalog_index", lambda: _catalog_index(config.code)),
+        ("attribute_index", lambda: _attribute_index(config.code)),
+        ("normalize_index", lambda: _index_for(config.code)),
+        ("attribute_words", lambda: (_attr_index(config.code), _attr_set(config.code))),
+        ("token_stopwords", lambda: _build_token_stopwords(config.code, config.triggers)),
+    ]
+
+
+def _corpus_item(item: CorpusItem, default_lang: str) -> tuple[str, str]:
+    if isinstance(item, str):
+        return item, default_lang
+    if isinstance(item, Mapping):
+        return item["text"], item.get("lang", default_lang)
+    text, lang = item
+    return text, lang
+
+
+def warmup(
+    langs: Iterable[str] | None = None,
+    corpus: Iterable[CorpusItem] | None = None,
+    *,
+    mode: str = "full",
+    profile: str | None = None,
+    strict: bool = False,
+) -> dict[str, Any]:
+    """Build every lazy model and index for ``langs``, then replay ``corpus``.
+
+    ``langs`` defaults to every supported language; an empty ``langs`` warms
+    nothing (not even the shared brand index). ``corpus`` items are texts
+    (extracted in the first of ``langs``), ``(text, lang)`` pairs or mappings
+    with ``"text"`` and ``"lang"`` keys (fixture cases, the web examples); they
+    are extracted with ``mode`` and ``profile`` so the same cache entries are
+    primed as later requests will hit.
+
+    A step that fails (typically a model that is not installed) is reported
+    with ``ok: False`` and its error, and the remaining steps still run;
+    ``strict=True`` raises instead.
+
+    Returns ``{"langs", "steps", "corpus", "seconds"}``: one
+    ``{"lang", "step", "seconds", "ok"}`` entry per step (``lang`` is ``None``
+    for shared indexes) and, with a corpus, ``{"texts", "errors", "seconds"}``.
+    """
+    started = time.perf_counter()
+    codes = [
+        get_language(code).code
+        for code in (supported_languages() if langs is None else langs)
+    ]
+    profile = resolve_profile(profile)
+    steps: list[dict[str, Any]] = []
+
+    def run(lang: str | None, name: str, build: Callable[[], object]) -> None:
+        t0 = time.perf_counter()
+        entry: dict[str, Any] = {"lang": lang, "step": name}
+        try:
+            build()
+        except OSError as exc:
+            if strict:
+                raise
+            entry.update(seconds=time.perf_counter() - t0, ok=False, error=str(exc))
+        else:
+            entry.update(seconds=time.perf_counter() - t0, ok=True)
+        steps.append(entry)
+
+    for code in codes:
+        for name, build in _language_steps(code, mode, profile):
+            run(code, name, build)
+    if codes:
+        run(None, "brand_index", _brand_index)
+
+    replay = None
+    if corpus is not None:
+        t0 = time.perf_counter()
+        texts = errors = 0
+        for item in corpus:
+            text, lang = _corpus_item(item, codes[0] if codes else "en")
+            texts += 1
+            try:
+                extract_sync(text, lang, mode=mode, profile=profile)
+            except OSError:
+                if strict:
+                    raise
+                errors += 1
+        replay = {"texts": texts, "errors": errors, "seconds": time.perf_counter() - t0}
+
+    return {
+        "langs": codes,
+        "steps": steps,
+        "corpus": replay,
+        "seconds": time.perf_counter() - started,
+    }
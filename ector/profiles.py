@@ -0,0 +1,107 @@
+"""Pipeline profiles: which spaCy components a workload loads.
+
+The extractor reads ``pos_`` (tagger + attribute_ruler, or the French
+morphologizer), ``dep_``/``head`` and sentence boundaries (parser) and a few
+lemmas. A profile trades some of that for speed:
+
+- ``"accurate"`` (default): the full pipeline minus NER, as before.
+- ``"fast"``: also drops spaCy's lemmatizer; the lemmas the rules compare are
+  looked up in :mod:`ector.dictionary.lemmas` instead.
+- ``"minimal"``: also drops the parser. Sentences come from spaCy's rule-based
+  sentencizer and, with no dependency labels, every product is found by the
+  parse-independent fallback extractor.
+- ``"span"``: ``"minimal"`` plus a span categorizer trained on the generated
+  shopping corpus (:mod:`ector.span_model`); products come from its spans
+  instead of the dependency heuristics. Needs a trained model
+  (``ECTOR_SPAN_MODEL_<LANG>``).
+
+Select one per call (``extract_sync(..., profile="fast")``) or process-wide
+with ``ECTOR_PROFILE``. Each profile is a separately loaded pipeline (see
+:func:`ector.models.get_model`); results are cached per profile.
+``scripts/bench.py --profiles`` reports the speed and fixture-corpus quality of
+each.
+
+Example:
+    >>> resolve_profile("fast")
+    'fast'
+    >>> PROFILES["minimal"].exclude
+    ('ner', 'lemmatizer', 'parser')
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+
+from spacy.language import Language
+
+from ector.dictionary.lemmas import lemma_table
+from ector.span_model import add_span_model
+
+PROFILE_ENV = "ECTOR_PROFILE"
+DEFAULT_PROFILE = "accurate"
+
+
+@dataclass(frozen=True)
+class PipelineProfile:
+    """Components to exclude at load time and rule-based stand-ins to add."""
+
+    name: str
+    exclude: tuple[str, ...]
+    lookup_lemmas: bool = False
+    sentencizer: bool = False
+    span_model: bool = False
+
+
+PROFILES: dict[str, PipelineProfile] = {
+    "accurate": PipelineProfile("accurate", ("ner",)),
+    "fast": PipelineProfile("fast", ("ner", "lemmatizer"), lookup_lemmas=True),
+    "minimal": PipelineProfile(
+        "minimal", ("ner", "lemmatizer", "parser"), lookup_lemmas=True, sentencizer=True
+    ),
+    "span": PipelineProfile(
+        "span",
+        ("ner", "lemmatizer", "parser"),
+        lookup_lemmas=True,
+        sentencizer=True,
+        span_model=True,
+    ),
+}
+
+
+def default_profile() -> str:
+    """The profile named by ``ECTOR_PROFILE``, else ``"accurate"``."""
+    return os.environ.get(PROFILE_ENV, "").strip().lower() or DEFAULT_PROFILE
+
+
+def resolve_profile(name: str | None) -> str:
+    """Validate a profile name (``None`` selects :func:`default_profile`)."""
+    if name is None:
+        name = default_profile()
+    if name not in PROFILES:
+        raise ValueError(f"profile must be one of {tuple(PROFILES)}, got {name!r}")
+    return name
+
+
+@Language.factory("ector_lookup_lemmatizer")
+def _make_lookup_lemmatizer(nlp: Language, name: str):
+    table = lemma_table(nlp.lang)
+
+    def lookup_lemmatizer(doc):
+        for token in doc:
+            low = token.lower_
+            token.lemma_ = table.get(low, low)
+        return doc
+
+    return lookup_lemmatizer
+
+
+def configure_pipeline(nlp: Language, profile: PipelineProfile) -> Language:
+    """Add the profile's rule-based components to a freshly loaded pipeline."""
+    if profile.sentencizer and "sentencizer" not in nlp.pipe_names:
+        nlp.add_pipe("sentencizer", first=True)
+    if profile.lookup_lemmas:
+        nlp.add_pipe("ector_lookup_lemmatizer", last=True)
+    if profile.span_model:
+        add_span_model(nlp)
+    return nlp
@@ -0,0 +1,95 @@
+"""Result representations: mutable dicts, frozen views, or pre-serialized JSON.
+
+:func:`ector.extract_sync` returns plain mutable dicts by default. Because the
+extraction cache must not be corrupted by callers mutating a result, every cache
+hit is deep-copied, which dominates hit latency on repeat-heavy traffic. Callers
+that only read results can opt into a copy-free mode instead:
+
+- ``"dict"`` (default): a fresh, mutable ``dict`` (deep copy on a cache hit);
+- ``"frozen"``: read-only ``MappingProxyType`` mappings and tuples, shared with
+  the cache (safe because they cannot be mutated);
+- ``"json"``: compact UTF-8 JSON ``bytes``, serialized once per cache entry.
+
+Example:
+    >>> view = freeze({"products": [{"product": "Phone"}], "intent": "buy"})
+    >>> view["products"][0]["product"]
+    'Phone'
+    >>> thaw(view)
+    {'products': [{'product': 'Phone'}], 'intent': 'buy'}
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
+RESULT_MODES = ("dict", "frozen", "json")
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list | tuple):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Inverse of :func:`freeze`: rebuild plain, mutable dicts and lists."""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+def to_json_bytes(result: Mapping) -> bytes:
+    """Serialize a (possibly frozen) result to compact UTF-8 JSON."""
+    return json.dumps(
+        thaw(result), ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def check_mode(mode: str) -> str:
+    if mode not in RESULT_MODES:
+        raise ValueError(f"result_mode must be one of {RESULT_MODES}, got {mode!r}")
+    return mode
+
+
+def render(result: dict, mode: str) -> Any:
+    """Convert a freshly built (unshared) result into ``mode``."""
+    if mode == "frozen":
+        return freeze(result)
+    if mode == "json":
+        return to_json_bytes(result)
+    return result
+
+
+class CachedResult:
+    """A cache entry that renders each representation at most once.
+
+    The mutable ``value`` is never handed out directly: ``"dict"`` callers get a
+    deep copy, while the frozen and JSON forms are built lazily and then shared.
+    """
+
+    __slots__ = ("value", "_frozen", "_json")
+
+    def __init__(self, value: dict):
+        self.value = value
+        self._frozen = None
+        self._json: bytes | None = None
+
+    def get(self, mode: str) -> Any:
+        if mode == "frozen":
+            if self._frozen is None:
+                self._frozen = freeze(self.value)
+            return self._frozen
+        if mode == "json":
+            if self._json is None:
+                self._json = to_json_bytes(self.value)
+            return self._json
+        return copy.deepcopy(self.value)
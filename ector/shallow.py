@@ -0,0 +1,193 @@
+"""Tokenizer-only extraction tier with escalation to the full parse.
+
+Most short queries ("a red phone and a laptop for 300 eur") are answered
+entirely by the regex/keyword rules plus the parse-independent fallback product
+extractor. This tier runs only the spaCy *tokenizer* on each clause, tags closed-
+class words from a small lexicon (:mod:`ector.dictionary.function_words`) and
+lets :func:`ector.products.extract_products_fallback` build the products.
+
+:func:`ambiguity` is the cheap check deciding whether that is safe. It names the
+first reason the tagger/parser could change the answer, and the caller then
+escalates the whole request to the full pipeline:
+
+- ``"unknown_word"``: a word that is neither a function word, a trigger/stop
+  word, a currency, nor a (fuzzy) catalog or attribute term;
+- ``"bare_number"``: a number not tied to a currency and not a plain quantity
+  in front of a product (model numbers, "for 250", ranges);
+- ``"trigger_without_product"``: a request trigger but no product found;
+- ``"budget_with_product"``: a budget clause that also names a product.
+
+:class:`TierStats` counts fast answers, escalations (by reason) and an estimate
+of the time saved.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from typing import Any
+
+from spacy.tokens import Doc
+
+from ector.dictionary.function_words import function_words
+from ector.languages import LanguageConfig
+from ector.money import is_currency_only, parse_price
+from ector.products import (
+    _NON_PRODUCT_LEMMAS,
+    _PHRASE_STOP_MODIFIERS,
+    _SHORTHAND_AMOUNT,
+    _build_token_stopwords,
+    _is_attribute_word,
+    _is_resolution,
+    _matches_catalog,
+)
+
+ESCALATION_REASONS = (
+    "unknown_word",
+    "bare_number",
+    "trigger_without_product",
+    "budget_with_product",
+)
+
+
+def annotate(doc: Doc, config: LanguageConfig) -> Doc:
+    """Give a tokenizer-only ``doc`` the coarse tags the fallback extractor reads.
+
+    Function words get their lexicon tag, numbers ``NUM``, punctuation
+    ``PUNCT``; everything else is an open-class ``NOUN``. Lemmas are the
+    lowercased surface form.
+    """
+    lexicon = function_words(config.code)
+    for token in doc:
+        low = token.lower_
+        token.lemma_ = low
+        if token.is_space:
+            token.pos_ = "SPACE"
+        elif token.is_punct:
+            token.pos_ = "PUNCT"
+        elif token.like_num:
+            token.pos_ = "NUM"
+        else:
+            token.pos_ = lexicon.get(low, "NOUN")
+    return doc
+
+
+def _is_known_word(low: str, config: LanguageConfig) -> bool:
+    if low in function_words(config.code):
+        return True
+    if low in _build_token_stopwords(config.code, config.triggers):
+        return True
+    if low in _NON_PRODUCT_LEMMAS or low in _PHRASE_STOP_MODIFIERS:
+        return True
+    if is_currency_only(low) or _is_resolution(low) or _SHORTHAND_AMOUNT.fullmatch(low):
+        return True
+    if parse_price(low, lang=config.code)[0] is not None:  # glued amount, "600eur"
+        return True
+    return _matches_catalog(low, config) or _is_attribute_word(low, config)
+
+
+def _is_quantity(doc: Doc, i: int, config: LanguageConfig) -> bool:
+    """A small integer directly followed by a product word ("2 phones").
+
+    Followed by an attribute ("128 gb") it is a spec the parse may attach to the
+    product name, so it does not count.
+    """
+    token = doc[i]
+    try:
+        value = float(token.text)
+    except ValueError:
+        return False
+    if not value.is_integer() or not 0 < value < 1000:
+        return False
+    if i > 0 and doc[i - 1].lower_ in config.price_prepositions:
+        return False
+    if i + 1 >= len(doc):
+        return False
+    nxt = doc[i + 1].lower_
+    return (
+        doc[i + 1].pos_ == "NOUN"
+        and not is_currency_only(nxt)
+        and not _is_attribute_word(nxt, config)
+    )
+
+
+def _is_priced_number(doc: Doc, i: int) -> bool:
+    """A number written next to a currency token ("600 eur", "$ 25")."""
+    for j in (i - 1, i + 1):
+        if 0 <= j < len(doc) and is_currency_only(doc[j].text):
+            return True
+    return False
+
+
+def ambiguity(doc: Doc, config: LanguageConfig) -> str | None:
+    """Return why an annotated clause needs the full parse, or ``None``.
+
+    Only token-level checks; the record-level ones
+    (``trigger_without_product``, ``budget_with_product``) are applied by the
+    caller once products are known.
+    """
+    for i, token in enumerate(doc):
+        if token.is_space or token.is_punct:
+            continue
+        low = token.lower_
+        if token.like_num and not _is_resolution(low):
+            if not (_is_priced_number(doc, i) or _is_quantity(doc, i, config)):
+                return "bare_number"
+            continue
+        if not _is_known_word(low, config):
+            return "unknown_word"
+    return None
+
+
+class TierStats:
+    """Thread-safe counters for the tiered extraction path.
+
+    ``estimated_saved_seconds`` is ``fast * (mean full time - mean fast time)``,
+    where the full-pipeline time is measured on escalated requests (so it is
+    ``None`` until at least one request has escalated).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.fast = 0
+            self.escalated = 0
+            self.reasons: Counter[str] = Counter()
+            self.fast_seconds = 0.0
+            self.shallow_seconds_escalated = 0.0
+            self.full_seconds = 0.0
+
+    def record_fast(self, seconds: float) -> None:
+        with self._lock:
+            self.fast += 1
+            self.fast_seconds += seconds
+
+    def record_escalation(self, reason: str, shallow_seconds: float, full_seconds: float) -> None:
+        with self._lock:
+            self.escalated += 1
+            self.reasons[reason] += 1
+            self.shallow_seconds_escalated += shallow_seconds
+            self.full_seconds += full_seconds
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            total = self.fast + self.escalated
+            saved = None
+            if self.fast and self.escalated:
+                mean_full = self.full_seconds / self.escalated
+                mean_fast = self.fast_seconds / self.fast
+                saved = self.fast * (mean_full - mean_fast)
+            return {
+                "requests": total,
+                "fast": self.fast,
+                "escalated": self.escalated,
+                "fast_ratio": self.fast / total if total else 0.0,
+                "escalation_reasons": dict(self.reasons),
+                "fast_seconds": self.fast_seconds,
+                "full_seconds": self.full_seconds,
+                "escalation_overhead_seconds": self.shallow_seconds_escalated,
+                "estimated_saved_seconds": saved,
+            }
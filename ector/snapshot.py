@@ -0,0 +1,189 @@
+"""Pre-serialized pipeline snapshots for fast cold starts.
+
+``ector snapshot build --output ector.snapshot`` loads the configured
+pipelines once (every supported language, or ``--lang``; the default profile,
+or ``--profile``) and writes them into a single file: a msgpack index (the
+versions, each pipeline's config and the offset of its ``nlp.to_bytes()``)
+followed by the pipeline bytes. Point ``ECTOR_SNAPSHOT`` at that file and
+:func:`ector.models.get_model` rebuilds pipelines from it with
+``Language.from_config(...).from_bytes(...)``, skipping package lookup and
+per-component disk reads. Only the index is kept in memory (one file at a
+time, until it changes on disk or :func:`clear_snapshot_cache` is called);
+each load reads just its own pipeline's bytes. Pipelines missing from the
+snapshot, or a snapshot written by another spaCy version, fall back to
+``spacy.load``.
+
+The fuzzy indexes are not stored: building all of them takes a few
+milliseconds, no more than unpickling them would.
+
+``scripts/bench_startup.py`` compares a cold ``import ector; extract_sync(...)``
+with and without a snapshot.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import struct
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Any
+
+import spacy
+import srsly
+from spacy import util
+from spacy.language import Language
+from spacy.vocab import Vocab
+from thinc.api import Config
+
+from ector.languages import get_language, supported_languages
+from ector.profiles import resolve_profile
+
+logger = logging.getLogger("ector.snapshot")
+
+SNAPSHOT_ENV = "ECTOR_SNAPSHOT"
+FORMAT_VERSION = 2
+# Big-endian length of the msgpack index at the start of the file.
+_INDEX_LENGTH = struct.Struct(">Q")
+
+
+def build_snapshot(
+    path: str,
+    langs: Iterable[str] | None = None,
+    profiles: Iterable[str] | None = None,
+) -> dict[str, Any]:
+    """Serialize the pipelines for ``langs`` x ``profiles`` into ``path``.
+
+    Returns the manifest (everything but the configs and offsets).
+    """
+    from ector import __version__
+    from ector.models import _load_model, _model_key  # models imports this module
+
+    pipelines: dict[str, dict[str, Any]] = {}
+    blobs: list[bytes] = []
+    offset = 0
+    for code in langs or supported_languages():
+        model_name = get_language(code).model_name
+        for profile in map(resolve_profile, profiles or [None]):
+            nlp = _load_model(model_name, profile, use_snapshot=False)
+            blob = nlp.to_bytes()
+            pipelines[_model_key(model_name, profile)] = {
+                "model": model_name,
+                "profile": profile,
+                "version": nlp.meta.get("version"),
+                "config": nlp.config.to_str(),
+                "offset": offset,
+                "length": len(blob),
+            }
+            blobs.append(blob)
+            offset += len(blob)
+    index = {
+        "format": FORMAT_VERSION,
+        "ector_version": __version__,
+        "spacy_version": spacy.__version__,
+        "pipelines": pipelines,
+    }
+    _write_snapshot(path, index, blobs)
+    return _manifest(index)
+
+
+def _write_snapshot(path: str, index: dict[str, Any], blobs: Iterable[bytes]) -> None:
+    """Write ``index`` then ``blobs`` (at the offsets the index records)."""
+    header = srsly.msgpack_dumps(index)
+    with open(path, "wb") as handle:
+        handle.write(_INDEX_LENGTH.pack(len(header)))
+        handle.write(header)
+        for blob in blobs:
+            handle.write(blob)
+
+
+def _manifest(index: dict[str, Any]) -> dict[str, Any]:
+    manifest = {
+        key: value for key, value in index.items() if key not in ("pipelines", "data_start")
+    }
+    manifest["pipelines"] = {
+        key: {"model": entry["model"], "profile": entry["profile"], "version": entry["version"]}
+        for key, entry in index["pipelines"].items()
+    }
+    return manifest
+
+
+def snapshot_path() -> str | None:
+    return os.environ.get(SNAPSHOT_ENV) or None
+
+
+def _read_index(path: str) -> dict[str, Any]:
+    """The snapshot's index: versions, configs and pipeline offsets, no bytes.
+
+    Offsets count from the end of the index (``index["data_start"]``).
+    """
+    with open(path, "rb") as handle:
+        prefix = handle.read(_INDEX_LENGTH.size)
+        if len(prefix) < _INDEX_LENGTH.size:
+            raise ValueError("truncated snapshot")
+        (length,) = _INDEX_LENGTH.unpack(prefix)
+        header = handle.read(length)
+    if len(header) < length:
+        raise ValueError("truncated snapshot")
+    index = srsly.msgpack_loads(header)
+    if not isinstance(index, dict):
+        raise ValueError("not an ector snapshot")
+    index["data_start"] = _INDEX_LENGTH.size + length
+    return index
+
+
+@lru_cache(maxsize=1)
+def _cached_index(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    # Parsed once per file version, not once per pipeline rebuilt from it.
+    return _read_index(path)
+
+
+def _read_blob(path: str, offset: int, length: int) -> bytes:
+    with open(path, "rb") as handle:
+        handle.seek(offset)
+        blob = handle.read(length)
+    if len(blob) < length:
+        raise ValueError("truncated snapshot")
+    return blob
+
+
+def clear_snapshot_cache() -> None:
+    """Drop the snapshot index kept for the next :func:`load_pipeline`."""
+    _cached_index.cache_clear()
+
+
+def load_pipeline(path: str, key: str, vocab: Vocab | None = None) -> Language | None:
+    """Rebuild pipeline ``key`` (``model`` or ``model:profile``) from a snapshot.
+
+    Returns ``None`` (after logging why) when the snapshot is unusable or
+    lacks ``key``, so the caller can fall back to ``spacy.load``.
+    """
+    try:
+        stat = os.stat(path)
+        index = _cached_index(path, stat.st_mtime_ns, stat.st_size)
+    except (OSError, ValueError) as exc:
+        logger.warning("Cannot read snapshot %s: %s", path, exc)
+        return None
+    if index.get("format") != FORMAT_VERSION or index.get("spacy_version") != spacy.__version__:
+        logger.warning(
+            "Ignoring snapshot %s: built with spaCy %s (format %s), running spaCy %s",
+            path, index.get("spacy_version"), index.get("format"), spacy.__version__,
+        )
+        return None
+    entry = index["pipelines"].get(key)
+    if entry is None:
+        return None
+    try:
+        blob = _read_blob(path, index["data_start"] + entry["offset"], entry["length"])
+    except (OSError, ValueError) as exc:
+        logger.warning("Cannot read snapshot %s: %s", path, exc)
+        return None
+    config = Config().from_str(entry["config"])
+    lang_cls = util.get_lang_class(config["nlp"]["lang"])
+    nlp = lang_cls.from_config(config, vocab=vocab if vocab is not None else True)
+    return nlp.from_bytes(blob)
+
+
+def read_manifest(path: str) -> dict[str, Any]:
+    """The snapshot's versions and pipeline list, without rebuilding anything."""
+    return _manifest(_read_index(path))
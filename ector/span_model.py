@@ -0,0 +1,158 @@
+"""Domain-trained product spans: a small span categorizer instead of the parse.
+
+The general-purpose parser often mis-tags shopping text, which the heuristics of
+:func:`ector.products.find_main_product_tokens` and
+:func:`ector.products.collect_product_phrase` then have to work around
+(RISK-005). The ``"span"`` pipeline profile (:mod:`ector.profiles`) loads the
+language's model without its parser, like ``"minimal"``, and adds a span
+categorizer trained on ECTOR's generated shopping corpus. The categorizer marks
+product phrases ("wireless smartphone") in ``doc.spans["ector_products"]``, and
+sentences take their products from those spans.
+
+Train one per language with ``scripts/train_span_model.py`` (a CPU model of
+about 2 MiB), then point ``ECTOR_SPAN_MODEL_<LANG>`` (e.g.
+``ECTOR_SPAN_MODEL_EN``) or :func:`configure_span_model` at the directory it
+writes. ``scripts/measure.py --profile span`` reports its quality on the
+fixture corpus.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable
+
+import spacy
+from spacy.language import Language
+from spacy.tokens import Doc, Span
+from spacy.util import filter_spans
+
+from ector.fuzzy import bounded_levenshtein, threshold_for
+from ector.languages import LanguageConfig
+from ector.money import is_currency_only
+from ector.products import _is_attribute_word
+
+SPAN_MODEL_ENV = "ECTOR_SPAN_MODEL"
+SPANS_KEY = "ector_products"
+SPAN_LABEL = "PRODUCT"
+# Name of the span categorizer once added to a language's pipeline.
+SPAN_COMPONENT = "ector_spancat"
+
+_CONFIGURED: dict[str, str | None] = {}
+
+
+def configure_span_model(lang: str, path: str | None) -> None:
+    """Use the trained pipeline at ``path`` for ``lang`` (``None``: back to the env)."""
+    if path is None:
+        _CONFIGURED.pop(lang, None)
+    else:
+        _CONFIGURED[lang] = path
+
+
+def span_model_path(lang: str) -> str | None:
+    """The trained span pipeline for ``lang``, from :func:`configure_span_model`
+    or ``ECTOR_SPAN_MODEL_<LANG>``; ``None`` if there is none."""
+    if lang in _CONFIGURED:
+        return _CONFIGURED[lang]
+    return os.environ.get(f"{SPAN_MODEL_ENV}_{lang.upper()}", "").strip() or None
+
+
+def add_span_model(nlp: Language) -> Language:
+    """Copy the trained span categorizer into ``nlp`` as :data:`SPAN_COMPONENT`.
+
+    Raises ``OSError`` when no span model is configured for ``nlp.lang``, as
+    for a model that is not installed.
+    """
+    path = span_model_path(nlp.lang)
+    if path is None:
+        raise OSError(
+            f"No span model configured for '{nlp.lang}'. Train one with\n"
+            f"    python scripts/train_span_model.py --lang {nlp.lang} --output DIR\n"
+            f"and set {SPAN_MODEL_ENV}_{nlp.lang.upper()}=DIR."
+        )
+    source = spacy.load(path)
+    nlp.add_pipe("spancat", name=SPAN_COMPONENT, source=source)
+    # Part of the doc-cache namespace, so retrained spans are not served stale.
+    nlp.meta["ector_span_model"] = {
+        "name": source.meta.get("name", "pipeline"),
+        "version": source.meta.get("version", "0"),
+    }
+    return nlp
+
+
+def sentence_spans(sentence: Span) -> list[Span] | None:
+    """Predicted product spans inside ``sentence``, without overlaps.
+
+    ``None`` when the pipeline has no span categorizer, so the caller falls
+    back to the dependency heuristics. Of overlapping candidates the longest
+    is kept ("wireless smartphone" over "smartphone").
+    """
+    group = sentence.doc.spans.get(SPANS_KEY)
+    if group is None:
+        return None
+    inside = [span for span in group if sentence.start <= span.start and span.end <= sentence.end]
+    return sorted(filter_spans(inside), key=lambda span: span.start)
+
+
+def span_phrase(span: Span) -> str:
+    """The raw product phrase of a span, without numbers or currency words."""
+    words = [t.text for t in span if not t.like_num and not is_currency_only(t.lower_)]
+    return " ".join(words).strip()
+
+
+def span_quantity(span: Span) -> int | None:
+    """The integer quantity just before (or opening) a span ("2" in "2 phones")."""
+    candidates = [span[0]]
+    if span.start > 0 and not span[0].is_sent_start:
+        candidates.insert(0, span.doc[span.start - 1])
+    for token in candidates:
+        if not token.like_num:
+            continue
+        try:
+            value = float(token.text)
+        except ValueError:
+            continue
+        if value.is_integer() and 0 < value < 1000:
+            return int(value)
+    return None
+
+
+def _matches_head(word: str, head: str) -> bool:
+    if word == head:
+        return True
+    limit = max(1, threshold_for(head))
+    return len(word) >= 3 and bounded_levenshtein(word, head, limit) <= limit
+
+
+def training_doc(
+    nlp: Language, text: str, heads: Iterable[str], config: LanguageConfig
+) -> Doc | None:
+    """A training doc with the product spans of a labelled corpus case.
+
+    ``text`` should already be normalized the way extraction normalizes it
+    (:func:`ector.api._prepare`); ``heads`` are the case's expected product
+    head words. Each head is matched (typos allowed) to the first free token
+    and its span extended left over attribute words ("wireless"). Returns
+    ``None`` when a head cannot be found, so the case is left out of training.
+    """
+    doc = nlp.make_doc(text)
+    used: set[int] = set()
+    spans = []
+    for head in heads:
+        head = head.lower()
+        match = next(
+            (t.i for t in doc if t.i not in used and _matches_head(t.lower_, head)), None
+        )
+        if match is None:
+            return None
+        start = match
+        while (
+            start > 0
+            and start - 1 not in used
+            and not doc[start - 1].is_punct
+            and _is_attribute_word(doc[start - 1].lower_, config)
+        ):
+            start -= 1
+        used.update(range(start, match + 1))
+        spans.append(Span(doc, start, match + 1, label=SPAN_LABEL))
+    doc.spans[SPANS_KEY] = sorted(spans, key=lambda span: span.start)
+    return doc
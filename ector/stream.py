@@ -0,0 +1,295 @@
+"""Streaming extraction for long documents (e-mail threads, RFQs).
+
+:func:`ector.extract_sync` parses its whole input as one spaCy doc, so memory
+grows with the text. :func:`extract_stream` instead:
+
+1. reads the source (a string, a text file object or an iterable of chunks)
+   incrementally and cuts it into windows of about ``window_chars`` at clause
+   boundaries;
+2. normalizes the windows and turns them into sentence records in batches of
+   ``batch_size`` (or in ``processes`` forked workers, at most two batches per
+   worker in flight), exactly as :func:`ector.extract_sync` would for the
+   same ``mode``, ``fields`` and ``profile``: clause, doc cache and model
+   cascade included;
+3. feeds the span-free sentence records through the same reconciliation as the
+   single-pass path (:func:`ector.api._assembled_items`), so a price tail or a
+   budget amount split across a window boundary is still attached;
+4. yields products (limited to ``fields``) as soon as they are final.
+
+Only a bounded number of windows is held at any time, so memory stays flat
+whatever the document length. Budget, price constraint and intent are
+available once the stream is exhausted (:meth:`DocumentStream.summary`);
+:meth:`DocumentStream.result` collects everything at once. The
+constraint and intent are evaluated per window and combined with the
+single-pass precedence rules; a keyword phrase cut by a window boundary (rare,
+since cuts fall on clause boundaries) can be missed.
+
+Example::
+
+    from ector.stream import extract_stream
+
+    with open("rfq.txt", encoding="utf-8") as handle:
+        stream = extract_stream(handle, lang="en")
+        for product in stream:
+            ...
+        summary = stream.summary()
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import re
+from collections import deque
+from collections.abc import Iterable, Iterator
+from typing import IO
+
+from ector.api import (  # internal reuse
+    _assembled_items,
+    _check_extract_mode,
+    _normalize_lang,
+    _prepare,
+    _project_product,
+    _shallow_records,
+    _text_records,
+    batched,
+)
+from ector.constraints import parse_constraint
+from ector.fields import parse_fields
+from ector.intent import classify_intent
+from ector.languages import LanguageConfig, get_language
+from ector.preload import warmup
+from ector.profiles import resolve_profile
+from ector.types import Budget, ExtractResult, PriceConstraint, Product
+
+_DEFAULT_WINDOW_CHARS = 4000
+_DEFAULT_STREAM_BATCH_SIZE = 16
+_READ_CHARS = 64 * 1024
+
+# A clause boundary in raw text: sentence/clause punctuation followed by
+# whitespace, or a line break.
+_CUT = re.compile(r"[.!?;:,](?=\s)|\n")
+
+# classify_intent precedence; "browse" only wins through an explicit override.
+_INTENT_ORDER = ("price_check", "availability", "compare", "buy")
+# parse_constraint precedence across windows.
+_CONSTRAINT_ORDER = ("between", "around", "max", "min")
+
+Source = str | IO[str] | Iterable[str]
+
+
+def _chunks(source: Source) -> Iterator[str]:
+    if isinstance(source, str):
+        for start in range(0, len(source), _READ_CHARS):
+            yield source[start:start + _READ_CHARS]
+    elif hasattr(source, "read"):
+        while chunk := source.read(_READ_CHARS):
+            yield chunk
+    else:
+        yield from source
+
+
+def iter_windows(source: Source, window_chars: int = _DEFAULT_WINDOW_CHARS) -> Iterator[str]:
+    """Cut ``source`` into windows of at most about ``window_chars`` characters.
+
+    A window ends at the last clause boundary inside the limit, else at the last
+    whitespace, else hard at the limit.
+    """
+    buffer = ""
+    for chunk in _chunks(source):
+        buffer += chunk
+        while len(buffer) > window_chars:
+            head = buffer[:window_chars]
+            cut = 0
+            for match in _CUT.finditer(head):
+                cut = match.end()
+            if cut == 0:
+                cut = head.rfind(" ") + 1 or window_chars
+            window, buffer = buffer[:cut], buffer[cut:]
+            if window.strip():
+                yield window
+    if buffer.strip():
+        yield buffer
+
+
+def _window_records(
+    task: tuple[list[str], str, int, str, frozenset[str], str],
+) -> tuple[list[str], list[list[dict]]]:
+    """Normalize one batch of windows into sentence records, as ``mode`` would."""
+    windows, lang, batch_size, mode, fields, profile = task
+    config = get_language(lang)
+    normalized = [_prepare(window, config) for window in windows]
+    if mode == "full":
+        return normalized, _text_records(normalized, config, fields, profile, batch_size)
+    record_lists = [
+        _shallow_records(text, config, fields, escalate=mode == "tiered")[0] for text in normalized
+    ]
+    escalated = [i for i, records in enumerate(record_lists) if records is None]
+    if escalated:
+        parsed = _text_records([normalized[i] for i in escalated], config, fields, profile, batch_size)
+        for i, records in zip(escalated, parsed, strict=True):
+            record_lists[i] = records
+    return normalized, record_lists
+
+
+class DocumentStream:
+    """Iterator over the products of one long document.
+
+    Iterate it (once) for products, then read :meth:`summary`; or call
+    :meth:`result` instead of iterating. Use :func:`extract_stream` to build one.
+    """
+
+    def __init__(
+        self,
+        source: Source,
+        config: LanguageConfig,
+        window_chars: int,
+        batch_size: int,
+        processes: int,
+        mode: str,
+        fields: frozenset[str],
+        profile: str,
+    ):
+        self._source = source
+        self._config = config
+        self._window_chars = window_chars
+        self._batch_size = batch_size
+        self._processes = processes
+        self._mode = mode
+        self._fields = fields
+        self._profile = profile
+        self._products: Iterator[Product] | None = None
+        self._budget: Budget | None = None
+        self._constraints: dict[str, PriceConstraint] = {}
+        self._intents: set[str] = set()
+        self._overrides = False
+        self._product_count = 0
+        self._done = False
+
+    def __iter__(self) -> Iterator[Product]:
+        if self._products is None:
+            self._products = self._run()
+        return self._products
+
+    def _record_batches(self) -> Iterator[tuple[list[str], list[list[dict]]]]:
+        batches = batched(iter_windows(self._source, self._window_chars), self._batch_size)
+        tasks = (
+            (windows, self._config.code, self._batch_size, self._mode, self._fields, self._profile)
+            for windows in batches
+        )
+        if self._processes <= 1:
+            yield from map(_window_records, tasks)
+            return
+        # Workers inherit the loaded model (none for mode="rules").
+        warmup([self._config.code], mode=self._mode, profile=self._profile, strict=True)
+        # Bounded fan-out: Pool.imap would drain the whole source up front.
+        with multiprocessing.get_context("fork").Pool(self._processes) as pool:
+            pending: deque = deque()
+            for task in tasks:
+                pending.append(pool.apply_async(_window_records, (task,)))
+                if len(pending) >= 2 * self._processes:
+                    yield pending.popleft().get()
+            while pending:
+                yield pending.popleft().get()
+
+    def _records(self) -> Iterator[dict]:
+        for normalized_windows, record_lists in self._record_batches():
+            for normalized, records in zip(normalized_windows, record_lists, strict=True):
+                self._observe_window(normalized)
+                yield from records
+
+    def _observe_window(self, normalized: str) -> None:
+        if "price_constraint" in self._fields:
+            constraint = parse_constraint(normalized)
+            if constraint is not None:
+                # Keep the first constraint of each type, as a single pass would.
+                self._constraints.setdefault(constraint["type"], constraint)
+        if "intent" not in self._fields:
+            return
+        # With has_products=False an unmatched window says "browse"; with True it
+        # says "buy". The two calls separate keyword hits from the default.
+        label = classify_intent(normalized, has_products=False)
+        if label != "browse":
+            self._intents.add(label)
+        elif classify_intent(normalized, has_products=True) == "browse":
+            self._overrides = True
+
+    def _run(self) -> Iterator[Product]:
+        for kind, value in _assembled_items(self._records(), self._config):
+            if kind == "product":
+                self._product_count += 1
+                if "product" in self._fields:
+                    yield _project_product(value, self._fields)
+            else:
+                self._budget = value
+        self._done = True
+
+    def result(self) -> ExtractResult:
+        """The whole-document result, in :func:`ector.extract_sync`'s schema.
+
+        Collects every product, so call it instead of iterating, not after.
+        """
+        if self._products is not None:
+            raise RuntimeError("stream already iterated; use summary()")
+        products = list(self)
+        result: ExtractResult = {"products": products}
+        result.update(self.summary())
+        return result
+
+    def summary(self) -> ExtractResult:
+        """Budget, price constraint and intent, once every product was yielded."""
+        if not self._done:
+            raise RuntimeError("stream was not fully consumed")
+        result: ExtractResult = {}
+        if self._budget is not None and "budget" in self._fields:
+            result["budget"] = self._budget
+        constraint = self._constraint()
+        if constraint is not None:
+            result["price_constraint"] = constraint
+        if "intent" in self._fields:
+            result["intent"] = self._intent()
+        return result
+
+    def _constraint(self) -> PriceConstraint | None:
+        for kind in _CONSTRAINT_ORDER:
+            if kind in self._constraints:
+                return self._constraints[kind]
+        return None
+
+    def _intent(self) -> str:
+        for label in _INTENT_ORDER:
+            if label in self._intents:
+                return label
+        if self._overrides:
+            return "browse"
+        return "buy" if self._product_count else "browse"
+
+
+def extract_stream(
+    source: Source,
+    lang: str = "en",
+    *,
+    window_chars: int = _DEFAULT_WINDOW_CHARS,
+    batch_size: int = _DEFAULT_STREAM_BATCH_SIZE,
+    processes: int = 1,
+    mode: str = "full",
+    fields: Iterable[str] | None = None,
+    profile: str | None = None,
+) -> DocumentStream:
+    """Extract from a long document incrementally; see the module docstring.
+
+    :param source: the text, a text file object, or an iterable of text chunks.
+    :param window_chars: target window size in characters.
+    :param batch_size: windows parsed per ``nlp.pipe`` call / worker task.
+    :param processes: forked worker processes (``1`` parses inline).
+    :param mode, fields, profile: as for :func:`ector.extract_sync`, per window.
+    """
+    if window_chars < 1 or batch_size < 1:
+        raise ValueError("window_chars and batch_size must be >= 1")
+    if processes > 1 and "fork" not in multiprocessing.get_all_start_methods():
+        raise RuntimeError("parallel streaming requires the 'fork' start method")
+    _check_extract_mode(mode)
+    config = get_language(_normalize_lang(lang))
+    return DocumentStream(
+        source, config, window_chars, batch_size, processes,
+        mode, parse_fields(fields), resolve_profile(profile),
+    )
@@ -9,6 +9,7 @@ See ``docs/features/01-product-extraction.md``.
 
 from __future__ import annotations
 
+import re
 from collections.abc import Sequence
 from functools import lru_cache
 
@@ -21,6 +22,10 @@ from functools import lru_cache
 _SEGMENTERS = ",;:"
 _SEGMENTER_SET = frozenset(_SEGMENTERS)
 
+# Whitespace following sentence-final punctuation: a clause boundary once
+# ``normalize_text`` has turned ``, ; :`` into periods.
+_CLAUSE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+
 # Articles to strip from the start of a product phrase (English + French).
 _ARTICLES = ("a ", "an ", "the ", "un ", "une ", "le ", "la ", "les ", "des ")
 
@@ -66,6 +71,21 @@ def normalize_text(text: str) -> str:
     return "".join(out)
 
 
+def split_clauses(text: str) -> list[str]:
+    """Split normalized text into clauses at sentence-final punctuation.
+
+    Only punctuation followed by whitespace splits, so decimals ("9.99") and
+    thousands separators stay inside their clause.
+
+    Examples:
+        >>> split_clauses("Hi. I'm looking for a laptop. budget 9.99 usd")
+        ['Hi.', "I'm looking for a laptop.", 'budget 9.99 usd']
+        >>> split_clauses("  ")
+        []
+    """
+    return [clause for clause in _CLAUSE_BOUNDARY.split(text.strip()) if clause]
+
+
 @lru_cache(maxsize=32)
 def _normalize_fillers(fillers: tuple[str, ...]) -> tuple[str, ...]:
     """Canonical, deterministic filler ordering with fast reuse across calls."""
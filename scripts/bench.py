@@ -1,12 +1,28 @@
 """Micro-benchmark for ECTOR: throughput and latency percentiles.
 
-Usage: .venv/bin/python scripts/bench.py [--n 5000]
+Usage: .venv/bin/python scripts/bench.py [--n 5000] [--batch 256] [--processes 8]
+
+``--batch`` adds a bulk comparison on unique fixture texts: a per-call
+``extract_sync`` loop against ``extract_many`` (spaCy ``nlp.pipe``).
+``--processes N`` reports ``ParallelExtractor`` scaling from 1 to N cores.
+``--result-modes`` compares cache-hit latency of the dict/frozen/json modes.
+``--fields`` reports the extra cost of each field over a name-only extraction.
+``--profiles`` reports speed and fixture-corpus quality per pipeline profile.
 """
 import argparse
+import json
 import statistics
 import time
 
-from ector import extract_sync
+from ector import extract_many, extract_sync
+from ector.fields import ALL_FIELDS, PRODUCT_FIELDS
+from ector.parallel import ParallelExtractor
+from ector.profiles import PROFILES
+from ector.results import RESULT_MODES
+from ector.span_model import span_model_path
+from tests.fixtures.harness import evaluate, load_dataset
+
+DATASET = "tests/fixtures/dataset.jsonl"
 
 SAMPLES = [
     ("I'm looking for a wireless gaming mouse and a keyboard, budget 150 usd", "en"),
@@ -23,6 +39,17 @@ SAMPLES = [
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--n", type=int, default=4000)
+    ap.add_argument("--batch", type=int, default=0,
+                    help="also compare per-call vs extract_many with this batch size")
+    ap.add_argument("--processes", type=int, default=0,
+                    help="also report ParallelExtractor scaling from 1 to N processes")
+    ap.add_argument("--chunk-size", type=int, default=64)
+    ap.add_argument("--result-modes", action="store_true",
+                    help="also compare cache-hit cost of each result_mode")
+    ap.add_argument("--fields", action="store_true",
+                    help="also report the per-field cost of fields= selection")
+    ap.add_argument("--profiles", action="store_true",
+                    help="also report speed and fixture quality of each pipeline profile")
     args = ap.parse_args()
 
     # warm up models + caches
@@ -51,6 +78,131 @@ def main():
     print(f"p99:         {p(0.99):.3f} ms")
     print(f"max:         {latencies[-1]:.3f} ms")
 
+    if args.batch:
+        bench_batch(args.n, args.batch)
+    if args.processes:
+        bench_scaling(args.n, args.processes, args.chunk_size)
+    if args.result_modes:
+        bench_result_modes(args.n)
+    if args.fields:
+        bench_fields(args.n)
+    if args.profiles:
+        bench_profiles(args.n)
+
+
+def _unique_texts(n, lang="en"):
+    """First ``n`` distinct fixture texts of ``lang`` (cache misses, like logs)."""
+    texts, seen = [], set()
+    with open(DATASET, encoding="utf-8") as handle:
+        for line in handle:
+            case = json.loads(line)
+            if case["lang"] == lang and case["text"] not in seen:
+                seen.add(case["text"])
+                texts.append(case["text"])
+                if len(texts) >= n:
+                    break
+    return texts
+
+
+def bench_batch(n, batch_size):
+    texts = _unique_texts(n)
+    t0 = time.perf_counter()
+    serial = [extract_sync(text, "en") for text in texts]
+    loop_dt = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    batched = list(extract_many(texts, "en", batch_size=batch_size))
+    batch_dt = time.perf_counter() - t0
+
+    print(f"--- bulk: {len(texts)} unique texts, batch_size={batch_size} ---")
+    print(f"per-call:    {len(texts) / loop_dt:.0f} texts/sec")
+    print(f"extract_many:{len(texts) / batch_dt:.0f} texts/sec  ({loop_dt / batch_dt:.2f}x)")
+    print(f"identical:   {serial == batched}")
+
+
+def bench_scaling(n, max_processes, chunk_size):
+    texts = _unique_texts(n)
+    counts = sorted({1, max_processes, *(2 ** k for k in range(1, 8) if 2 ** k < max_processes)})
+    print(f"--- scaling: {len(texts)} unique texts, chunk_size={chunk_size} ---")
+    base = None
+    for procs in counts:
+        with ParallelExtractor(processes=procs, lang="en", chunk_size=chunk_size) as engine:
+            t0 = time.perf_counter()
+            done = sum(1 for _ in engine.map(texts))
+            dt = time.perf_counter() - t0
+        rate = done / dt
+        base = base or rate
+        print(f"{procs:>3} proc:    {rate:.0f} texts/sec  ({rate / base:.2f}x)")
+
+
+def bench_result_modes(n):
+    """Cache-hit latency per result_mode (SAMPLES are all cached after warmup)."""
+    print(f"--- cache hits: {n} calls per result_mode ---")
+    base = None
+    for mode in RESULT_MODES:
+        for text, lang in SAMPLES:
+            extract_sync(text, lang, result_mode=mode)
+        t0 = time.perf_counter()
+        for i in range(n):
+            text, lang = SAMPLES[i % len(SAMPLES)]
+            extract_sync(text, lang, result_mode=mode)
+        per_call = (time.perf_counter() - t0) / n * 1e6
+        base = base or per_call
+        print(f"{mode:<7}      {per_call:.1f} us/call  ({base / per_call:.2f}x vs dict)")
+
+
+def bench_fields(n):
+    """Per-text cost of each field on top of ``products.product`` (cache bypassed)."""
+    texts = _unique_texts(n)
+
+    def per_text(fields, repeat=3):
+        best = float("inf")
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            for _ in extract_many(texts, "en", fields=fields):
+                pass
+            best = min(best, time.perf_counter() - t0)
+        return best / len(texts) * 1e6
+
+    per_text(None, repeat=1)  # warm the token-level fuzzy caches
+    base = per_text(["products.product"])
+    print(f"--- fields: {len(texts)} unique texts ---")
+    print(f"{'products.product':<24}{base:>9.1f} us/text  (baseline)")
+    for field in sorted(ALL_FIELDS - {"product"}):
+        name = f"products.{field}" if field in PRODUCT_FIELDS else field
+        cost = per_text(["products.product", name])
+        print(f"{'+ ' + name:<24}{cost:>9.1f} us/text  ({cost - base:+.1f})")
+    full = per_text(None)
+    print(f"{'all fields':<24}{full:>9.1f} us/text  ({full - base:+.1f})")
+
+
+def bench_profiles(n):
+    """Uncached throughput and fixture-corpus quality of each pipeline profile."""
+    texts = _unique_texts(n)
+    cases = load_dataset(DATASET)[:n]
+    print(f"--- profiles: {len(texts)} unique texts, {len(cases)} fixture cases ---")
+    print(f"{'profile':<10}{'texts/sec':>10}{'recall':>9}{'precis.':>9}"
+          f"{'price':>8}{'curr.':>8}{'budget':>8}")
+    langs = {case["lang"] for case in cases}
+    for profile in PROFILES:
+        missing = sorted(lang for lang in langs if span_model_path(lang) is None)
+        if PROFILES[profile].span_model and missing:
+            print(f"{profile:<10}  skipped: no span model for {', '.join(missing)} "
+                  f"(scripts/train_span_model.py)")
+            continue
+        list(extract_many(texts[:50], "en", profile=profile))  # load + warm
+        t0 = time.perf_counter()
+        for _ in extract_many(texts, "en", profile=profile):
+            pass
+        rate = len(texts) / (time.perf_counter() - t0)
+        m = evaluate(cases, collect_failures=0, profile=profile)
+        print(f"{profile:<10}{rate:>10.0f}"
+              f"{m.rate(m.product_items_captured, m.product_items_expected):>8.2f}%"
+              f"{m.rate(m.product_items_correct, m.product_items_extracted):>8.2f}%"
+              f"{m.rate(m.price_ok, m.price_cases):>7.2f}%"
+              f"{m.rate(m.currency_ok, m.currency_cases):>7.2f}%"
+              f"{m.rate(m.budget_ok, m.budget_cases):>7.2f}%")
+
 
 if __name__ == "__main__":
     main()
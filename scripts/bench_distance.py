@@ -0,0 +1,68 @@
+"""Bounded edit-distance kernels: dynamic-programming rows against bit vectors.
+
+Usage: .venv/bin/python scripts/bench_distance.py [--words 400] [--batch 50]
+
+Each of ``--words`` catalog and brand words is scored, with its
+``threshold_for`` distance, against a batch of candidates as
+``FuzzyIndex.best_match`` scores a bucket: a fifth are typos of it (1 to 2
+edits via ``tests/fixtures/typos.py``) and the rest other words, mostly over
+the bound. Reports mean microseconds per pair for the row kernel
+(``_bounded_rows``, the previous ``bounded_levenshtein``), the bit-parallel
+``bounded_levenshtein`` and the batch ``distances`` (one call per word), and
+checks that all three agree, sentinel included.
+"""
+import argparse
+import random
+import time
+
+from ector.attributes import BRANDS
+from ector.dictionary.catalog import catalog_terms_for
+from ector.fuzzy import _bounded_rows, bounded_levenshtein, distances, threshold_for
+from tests.fixtures.typos import typo_word
+
+
+def _rows(a, b, max_distance):
+    # The previous kernel, with the shortcuts it took before the rows.
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    return _bounded_rows(a, b, max_distance)
+
+
+def batches(words, count, size, seed=0):
+    rng = random.Random(seed)
+    out = []
+    for word in rng.choices(words, k=count):
+        typos = [typo_word(word, rng, edits=rng.randint(1, 2)) for _ in range(size // 5)]
+        out.append((word, max(1, threshold_for(word)), typos + rng.choices(words, k=size - len(typos))))
+    return out
+
+
+def _timed(fn, groups):
+    t0 = time.perf_counter()
+    answers = [fn(word, md, candidates) for word, md, candidates in groups]
+    pairs = sum(len(candidates) for _, _, candidates in groups)
+    return (time.perf_counter() - t0) / pairs * 1e6, answers
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--words", type=int, default=400)
+    ap.add_argument("--batch", type=int, default=50)
+    args = ap.parse_args()
+
+    words = sorted({w for w in (*catalog_terms_for("en"), *BRANDS) if w.isalpha() and len(w) >= 3})
+    groups = batches(words, args.words, args.batch)
+    rows_us, rows = _timed(lambda w, md, cs: [_rows(w, c, md) for c in cs], groups)
+    bits_us, bits = _timed(lambda w, md, cs: [bounded_levenshtein(w, c, md) for c in cs], groups)
+    batch_us, batch = _timed(lambda w, md, cs: distances(w, cs, md), groups)
+    within = sum(d <= md for (_, md, _), ds in zip(groups, rows, strict=True) for d in ds)
+    pairs = args.words * args.batch
+    print(f"{pairs} pairs ({within / pairs:.0%} within the bound)")
+    print(f"rows  {rows_us:6.2f} us/pair")
+    print(f"bits  {bits_us:6.2f} us/pair")
+    print(f"batch {batch_us:6.2f} us/pair")
+    print(f"agrees {rows == bits == batch}")
+
+
+if __name__ == "__main__":
+    main()
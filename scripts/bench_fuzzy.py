@@ -0,0 +1,106 @@
+"""Fuzzy lookup latency against vocabulary size, per ``FuzzyIndex`` backend.
+
+Usage: .venv/bin/python scripts/bench_fuzzy.py [--sizes 1000 10000 100000 300000]
+                                               [--queries 2000] [--backend ...]
+                                               [--vocab random|catalog]
+
+Builds a synthetic catalog of each size, then times ``best_match`` on typo'd catalog terms (hits, 1 to 2 edits via
+``tests/fixtures/typos.py``) and on random words (mostly misses), with the
+default ``threshold_for`` distance. Reports build time, the memory the index
+holds (``tracemalloc``, on a second build) and mean microseconds per lookup, and checks that every
+backend returns the same answers as ``"buckets"``.
+
+``--vocab random`` (default) draws words of 4 to 14 random letters, the worst
+case for prefix sharing; ``--vocab catalog`` appends model-number-like suffixes
+to the bundled catalog terms and brands ("galaxy" -> "galaxys23x"), closer to a
+merchant catalog.
+"""
+import argparse
+import gc
+import random
+import string
+import time
+import tracemalloc
+
+from ector.attributes import BRANDS
+from ector.dictionary.catalog import catalog_terms_for
+from ector.fuzzy import FUZZY_BACKENDS, FuzzyIndex
+from tests.fixtures.typos import typo_word
+
+
+def _word(rng):
+    return "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 14)))
+
+
+def _catalog_word(rng, stems):
+    suffix = rng.choices(string.ascii_lowercase + string.digits, k=rng.randint(0, 6))
+    return rng.choice(stems) + "".join(suffix)
+
+
+def vocabulary(size, seed=0, kind="random"):
+    rng = random.Random(seed)
+    stems = sorted(
+        {w for w in (*catalog_terms_for("en"), *BRANDS) if w.isalpha() and len(w) >= 3}
+    )
+    terms = set()
+    while len(terms) < size:
+        terms.add(_word(rng) if kind == "random" else _catalog_word(rng, stems))
+    return sorted(terms)
+
+
+def queries(terms, count, seed=1):
+    rng = random.Random(seed)
+    hits = [typo_word(rng.choice(terms), rng, edits=rng.randint(1, 2)) for _ in range(count // 2)]
+    misses = [_word(rng) for _ in range(count - len(hits))]
+    return hits, misses
+
+
+def _lookups(index, words):
+    """(mean microseconds per lookup, answers)."""
+    t0 = time.perf_counter()
+    answers = [index.best_match(word) for word in words]
+    return (time.perf_counter() - t0) / len(words) * 1e6, answers
+
+
+def _held_bytes(terms, backend):
+    # A separate build: lookups on an index built under tracemalloc run slower.
+    tracemalloc.start()
+    index = FuzzyIndex(terms, backend=backend)
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del index
+    return held
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000, 300000])
+    ap.add_argument("--queries", type=int, default=2000)
+    ap.add_argument("--backend", nargs="+", choices=FUZZY_BACKENDS, default=list(FUZZY_BACKENDS))
+    ap.add_argument("--vocab", choices=["random", "catalog"], default="random")
+    args = ap.parse_args()
+
+    print(f"{'terms':>8} {'backend':<10} {'build s':>8} {'MiB':>8} "
+          f"{'hit us':>9} {'miss us':>9}  agrees")
+    for size in args.sizes:
+        terms = vocabulary(size, kind=args.vocab)
+        hits, misses = queries(terms, args.queries)
+        reference = None
+        for backend in args.backend:
+            t0 = time.perf_counter()
+            index = FuzzyIndex(terms, backend=backend)
+            build = time.perf_counter() - t0
+            gc.collect()  # not charged to the first lookups
+            hit_us, hit_answers = _lookups(index, hits)
+            miss_us, miss_answers = _lookups(index, misses)
+            answers = hit_answers + miss_answers
+            if reference is None:
+                reference = answers
+            del index
+            held = _held_bytes(terms, backend)
+            print(f"{size:>8} {backend:<10} {build:>8.2f} {held / 2**20:>8.1f} "
+                  f"{hit_us:>9.1f} {miss_us:>9.1f}  {answers == reference}")
+
+
+if __name__ == "__main__":
+    main()
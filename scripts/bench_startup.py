@@ -0,0 +1,75 @@
+"""Cold-start benchmark: fresh interpreter -> ``import ector`` -> first result.
+
+Usage: .venv/bin/python scripts/bench_startup.py [--runs 5] [--snapshot PATH] [--lang en]
+
+Each run is a new process, so nothing is shared between runs (the OS page
+cache still is; run once before timing if the disk is cold). Without
+``--snapshot`` a snapshot of ``--lang`` is built into a temporary file first.
+Reports the median wall time of the import and of the first ``extract_sync``,
+with ``spacy.load`` and with ``ECTOR_SNAPSHOT`` set.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+PROBE = """
+import json, time
+t0 = time.perf_counter()
+import ector
+t1 = time.perf_counter()
+ector.extract_sync("I want a laptop for 150 usd", {lang!r})
+t2 = time.perf_counter()
+print(json.dumps({{"import": t1 - t0, "first_extract": t2 - t1}}))
+"""
+
+
+def _run(lang, snapshot):
+    env = dict(os.environ)
+    env.pop("ECTOR_SNAPSHOT", None)
+    if snapshot:
+        env["ECTOR_SNAPSHOT"] = snapshot
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE.format(lang=lang)],
+        env=env, check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def _report(label, lang, snapshot, runs):
+    samples = [_run(lang, snapshot) for _ in range(runs)]
+    imp = statistics.median(s["import"] for s in samples)
+    first = statistics.median(s["first_extract"] for s in samples)
+    print(f"{label:<10}import {imp * 1000:8.0f} ms   first extract {first * 1000:8.0f} ms"
+          f"   total {(imp + first) * 1000:8.0f} ms")
+    return imp + first
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--lang", default="en")
+    ap.add_argument("--snapshot", help="existing snapshot (default: build a temporary one)")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshot = args.snapshot
+        if snapshot is None:
+            snapshot = os.path.join(tmp, "ector.snapshot")
+            subprocess.run(
+                [sys.executable, "-m", "ector", "snapshot", "build",
+                 "--output", snapshot, "--lang", args.lang],
+                check=True, capture_output=True,
+            )
+        _run(args.lang, None)  # warm the OS page cache
+        print(f"--- cold start, median of {args.runs} runs, lang={args.lang} ---")
+        base = _report("spacy.load", args.lang, None, args.runs)
+        snap = _report("snapshot", args.lang, snapshot, args.runs)
+        print(f"speedup:   {base / snap:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
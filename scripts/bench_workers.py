@@ -0,0 +1,135 @@
+"""Per-worker memory of the web app: preload-and-fork vs ``uvicorn --workers``.
+
+Usage: .venv/bin/python scripts/bench_workers.py [--workers 1 2 4 8] [--requests 200]
+                                                 [--server preload uvicorn]
+
+For each server and worker count, starts the app on a free port, sends
+``--requests`` extraction requests so every worker has parsed something, then
+reads ``/proc/<pid>/smaps_rollup`` of each worker: USS (private pages, freed if
+the worker exits) and PSS (private pages plus its share of shared pages). The
+preloading master (``python -m web.serve``) is reported separately. Linux only.
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+BODY = json.dumps({"text": "I want two refurbished laptops, budget 700 usd", "lang": "en"})
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _command(server, port, workers):
+    if server == "preload":
+        return [sys.executable, "-m", "web.serve", "--port", str(port),
+                "--workers", str(workers), "--log-level", "warning"]
+    return [sys.executable, "-m", "uvicorn", "web.app:app", "--port", str(port),
+            "--workers", str(workers), "--log-level", "warning"]
+
+
+def _children(pid):
+    found = []
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                stat = f.read()
+            with open(f"/proc/{entry}/cmdline", "rb") as f:
+                cmdline = f.read()
+        except OSError:
+            continue
+        # Fields after the parenthesized command name: state, ppid, ...
+        if int(stat.rpartition(")")[2].split()[1]) == pid and b"resource_tracker" not in cmdline:
+            found.append(int(entry))
+    return found
+
+
+def _memory(pid):
+    """(uss, pss) in bytes, from smaps_rollup."""
+    fields = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            name, _, rest = line.partition(":")
+            parts = rest.split()
+            if len(parts) == 2 and parts[1] == "kB":
+                fields[name] = int(parts[0]) * 1024
+    return fields["Private_Clean"] + fields["Private_Dirty"], fields["Pss"]
+
+
+def _post(url):
+    req = urllib.request.Request(url, BODY.encode(), {"Content-Type": "application/json"})
+    urllib.request.urlopen(req, timeout=30).read()
+
+
+def _wait_ready(proc, base, workers, timeout=120.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"server exited with status {proc.returncode}")
+        try:
+            urllib.request.urlopen(base + "/api/health", timeout=5).read()
+        except OSError:
+            time.sleep(0.2)
+            continue
+        if workers == 1 or len(_children(proc.pid)) >= workers:
+            return
+        time.sleep(0.2)
+    raise RuntimeError("server did not become ready")
+
+
+def measure(server, workers, requests):
+    port = _free_port()
+    base = f"http://127.0.0.1:{port}"
+    proc = subprocess.Popen(_command(server, port, workers))
+    try:
+        _wait_ready(proc, base, workers)
+        with ThreadPoolExecutor(max_workers=2 * workers) as pool:
+            list(pool.map(_post, [base + "/api/extract"] * requests))
+        time.sleep(1.0)
+        pids = _children(proc.pid)
+        # ``uvicorn --workers 1`` serves from the launching process itself.
+        master = proc.pid if pids else None
+        samples = [_memory(pid) for pid in pids or [proc.pid]]
+        master_pss = _memory(master)[1] if master else 0
+    finally:
+        proc.terminate()
+        proc.wait(timeout=30)
+    return {
+        "uss": statistics.mean(uss for uss, _ in samples),
+        "pss": statistics.mean(pss for _, pss in samples),
+        "total_pss": sum(pss for _, pss in samples) + master_pss,
+        "master_pss": master_pss,
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    ap.add_argument("--requests", type=int, default=200)
+    ap.add_argument("--server", nargs="+", choices=["preload", "uvicorn"],
+                    default=["preload", "uvicorn"])
+    args = ap.parse_args()
+
+    mib = 1024 * 1024
+    print(f"{'server':<8} {'workers':>7} {'USS/worker':>11} {'PSS/worker':>11} "
+          f"{'master PSS':>11} {'total PSS':>10}  (MiB)")
+    for server in args.server:
+        for workers in args.workers:
+            m = measure(server, workers, args.requests)
+            print(f"{server:<8} {workers:>7} {m['uss'] / mib:>11.1f} {m['pss'] / mib:>11.1f} "
+                  f"{m['master_pss'] / mib:>11.1f} {m['total_pss'] / mib:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
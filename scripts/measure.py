@@ -2,10 +2,21 @@
 
 Usage:
     .venv/bin/python scripts/measure.py [path] [--failures N] [--category cat]
+                                        [--doc-cache DIR] [--mode full|tiered|rules]
+                                        [--profile accurate|fast|minimal|span]
+
+``--doc-cache DIR`` (or ``ECTOR_DOC_CACHE_DIR``) keeps the parsed docs on disk:
+the first run fills it, later runs with the same model only re-run the rules.
+``--mode rules`` measures the model-free engine (the gap to ``full`` is its
+quality cost). ``--profile span`` measures the trained span model
+(``scripts/train_span_model.py``, ``ECTOR_SPAN_MODEL_<LANG>``).
 """
 import argparse
 import time
 
+from ector.api import EXTRACT_MODES
+from ector.doc_cache import configure_doc_cache
+from ector.profiles import PROFILES
 from tests.fixtures.harness import evaluate, load_dataset
 
 
@@ -14,11 +25,17 @@ def main():
     ap.add_argument("path", nargs="?", default="tests/fixtures/dataset.jsonl")
     ap.add_argument("--failures", type=int, default=0)
     ap.add_argument("--kind", choices=["product", "price", "currency", "budget"], default=None)
+    ap.add_argument("--doc-cache", metavar="DIR", help="on-disk parsed-doc cache directory")
+    ap.add_argument("--mode", choices=EXTRACT_MODES, default="full")
+    ap.add_argument("--profile", choices=list(PROFILES), default=None)
     args = ap.parse_args()
+    if args.doc_cache:
+        configure_doc_cache(args.doc_cache)
 
     cases = load_dataset(args.path)
     t0 = time.perf_counter()
-    m = evaluate(cases, collect_failures=max(args.failures, 0))
+    m = evaluate(cases, collect_failures=max(args.failures, 0), mode=args.mode,
+                 profile=args.profile)
     dt = time.perf_counter() - t0
     print(m.summary())
     print(f"--- {len(cases)} cases in {dt:.1f}s = {len(cases)/dt:.0f} cases/sec ---")
@@ -0,0 +1,125 @@
+"""Train the compact product-span model of the ``"span"`` pipeline profile.
+
+Usage:
+    .venv/bin/python scripts/train_span_model.py --lang en --output models/span-en
+        [--count 8000] [--seed 7] [--epochs 12] [--width 64] [--version 0.1.0]
+
+Generates a labelled shopping corpus with ``tests/fixtures/generator.py`` (with a
+different seed from the committed ``dataset.jsonl``, so ``scripts/measure.py``
+still scores unseen cases). Each text is normalized the way extraction does,
+and the expected product heads are aligned to spans with
+:func:`ector.span_model.training_doc`. A spaCy span categorizer is then trained
+on CPU: a small hash-embedding CNN over NORM/PREFIX/SUFFIX/SHAPE, with no
+static vectors and no tagger or parser features. The epoch with the best span
+F-score on a held-out tenth is saved to ``--output``. Then:
+
+    ECTOR_SPAN_MODEL_EN=models/span-en .venv/bin/python scripts/measure.py --profile span
+
+Bump ``--version`` when retraining: it is part of the parsed-doc cache namespace.
+"""
+import argparse
+import os
+import random
+import time
+
+import spacy
+from spacy.training import Example
+from spacy.util import compounding, minibatch
+
+from ector.api import _prepare
+from ector.languages import get_language
+from ector.span_model import SPAN_LABEL, SPANS_KEY, training_doc
+from tests.fixtures.generator import generate
+
+
+def spancat_config(width):
+    return {
+        "spans_key": SPANS_KEY,
+        "threshold": 0.5,
+        "max_positive": 1,
+        "suggester": {"@misc": "spacy.ngram_suggester.v1", "sizes": [1, 2, 3]},
+        "model": {
+            "@architectures": "spacy.SpanCategorizer.v1",
+            "reducer": {"@layers": "spacy.mean_max_reducer.v1", "hidden_size": width},
+            "scorer": {"@layers": "spacy.LinearLogistic.v1"},
+            "tok2vec": {
+                "@architectures": "spacy.HashEmbedCNN.v2",
+                "pretrained_vectors": None,
+                "width": width,
+                "depth": 2,
+                "embed_size": 2000,
+                "window_size": 1,
+                "maxout_pieces": 3,
+                "subword_features": True,
+            },
+        },
+    }
+
+
+def build_examples(nlp, lang, count, seed):
+    config = get_language(lang)
+    examples, skipped = [], 0
+    for case in generate(count, seed):
+        if case["lang"] != lang:
+            continue
+        doc = training_doc(nlp, _prepare(case["text"], config), case["expected_products"], config)
+        if doc is None:
+            skipped += 1
+            continue
+        examples.append(Example(nlp.make_doc(doc.text), doc))
+    return examples, skipped
+
+
+def _size(path):
+    return sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, names in os.walk(path)
+        for name in names
+    )
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--lang", default="en")
+    ap.add_argument("--output", required=True)
+    ap.add_argument("--count", type=int, default=8000, help="generated cases (all languages)")
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--epochs", type=int, default=12)
+    ap.add_argument("--width", type=int, default=64)
+    ap.add_argument("--version", default="0.1.0")
+    args = ap.parse_args()
+
+    spacy.util.fix_random_seed(args.seed)
+    nlp = spacy.blank(args.lang)
+    spancat = nlp.add_pipe("spancat", config=spancat_config(args.width))
+    spancat.add_label(SPAN_LABEL)
+    nlp.meta.update(name=f"ector_products_{args.lang}", version=args.version)
+
+    examples, skipped = build_examples(nlp, args.lang, args.count, args.seed)
+    random.Random(args.seed).shuffle(examples)
+    cut = max(1, len(examples) // 10)
+    dev, train = examples[:cut], examples[cut:]
+    print(f"{len(train)} train / {len(dev)} dev docs ({skipped} cases not aligned)")
+
+    optimizer = nlp.initialize(lambda: train)
+    best = -1.0
+    for epoch in range(1, args.epochs + 1):
+        t0 = time.perf_counter()
+        random.shuffle(train)
+        losses = {}
+        for batch in minibatch(train, size=compounding(4.0, 32.0, 1.001)):
+            nlp.update(batch, drop=0.1, sgd=optimizer, losses=losses)
+        scores = nlp.evaluate(dev)
+        f = scores[f"spans_{SPANS_KEY}_f"]
+        print(f"epoch {epoch:>2}  loss {losses['spancat']:8.2f}  "
+              f"P {scores[f'spans_{SPANS_KEY}_p']:.3f}  R {scores[f'spans_{SPANS_KEY}_r']:.3f}  "
+              f"F {f:.3f}  ({time.perf_counter() - t0:.1f}s)")
+        if f > best:
+            best = f
+            with nlp.use_params(optimizer.averages):
+                nlp.to_disk(args.output)
+    print(f"best F {best:.3f}; saved to {args.output} ({_size(args.output) / 1024:.0f} KiB)")
+
+
+if __name__ == "__main__":
+    main()
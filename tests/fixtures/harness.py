@@ -18,7 +18,7 @@ import json
 from dataclasses import dataclass, field
 
 from ector import extract_sync
-from ector.fuzzy import bounded_levenshtein, threshold_for
+from ector.fuzzy import distances, threshold_for
 
 
 def _head(name: str) -> str:
@@ -32,14 +32,10 @@ def product_captured(expected_head: str, extracted_names: list[str]) -> bool:
         low = name.lower()
         if eh in low or low in eh:
             return True
-        h = _head(name)
         md = max(1, threshold_for(eh))
-        if bounded_levenshtein(eh, h, md) <= md:
+        # the head, then every token of the extracted phrase
+        if any(d <= md for d in distances(eh, [_head(name), *low.split()], md)):
             return True
-        # also compare against every token of the extracted phrase
-        for tok in low.split():
-            if bounded_levenshtein(eh, tok, md) <= md:
-                return True
     return False
 
 
@@ -89,11 +85,12 @@ class Metrics:
         return "\n".join(lines)
 
 
-def evaluate(cases: list[dict], collect_failures: int = 50) -> Metrics:
+def evaluate(cases: list[dict], collect_failures: int = 50, **extract_kwargs) -> Metrics:
+    """Score ``extract_sync(text, lang, **extract_kwargs)`` over ``cases``."""
     m = Metrics()
     for case in cases:
         m.total += 1
-        result = extract_sync(case["text"], case["lang"])
+        result = extract_sync(case["text"], case["lang"], **extract_kwargs)
         products = result.get("products", [])
         names = [p.get("product", "") for p in products]
         prices = [p.get("price") for p in products if p.get("price") is not None]
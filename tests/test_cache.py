@@ -0,0 +1,78 @@
+"""Tests for ector.cache."""
+
+import unittest
+from unittest import mock
+
+from ector.cache import LRUCache, estimate_size
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_hit_miss_counters(self):
+        cache = LRUCache(2)
+        self.assertIsNone(cache.get("a"))
+        cache.put("a", 1)
+        self.assertEqual(cache.get("a"), 1)
+        info = cache.info()
+        self.assertEqual((info["hits"], info["misses"], info["size"]), (1, 1, 1))
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertEqual(cache.info()["evictions"], 1)
+
+    def test_resize_and_clear(self):
+        cache = LRUCache(3)
+        for key in "abc":
+            cache.put(key, key)
+        cache.resize(1)
+        self.assertEqual(len(cache), 1)
+        self.assertIn("c", cache)
+        cache.clear()
+        self.assertEqual(cache.info(), {"hits": 0, "misses": 0, "hit_ratio": 0.0,
+                                        "evictions": 0, "expirations": 0,
+                                        "size": 0, "maxsize": 1, "bytes": 0,
+                                        "maxbytes": 0, "ttl": 0.0})
+
+    def test_zero_size_disables(self):
+        cache = LRUCache(0)
+        cache.put("a", 1)
+        self.assertEqual(len(cache), 0)
+
+    def test_byte_bound_evicts_by_estimated_size(self):
+        cache = LRUCache(100, maxbytes=100, sizeof=lambda key, value: value)
+        cache.put("a", 40)
+        cache.put("b", 40)
+        cache.put("c", 40)
+        self.assertNotIn("a", cache)
+        self.assertEqual(cache.info()["bytes"], 80)
+        cache.put("huge", 500)  # larger than the whole budget: not stored
+        self.assertNotIn("huge", cache)
+        cache.put("b", 10)  # replacing an entry releases its old size
+        self.assertEqual(cache.info()["bytes"], 50)
+        cache.resize(maxbytes=20)
+        self.assertEqual((len(cache), cache.info()["bytes"]), (1, 10))
+
+    def test_ttl_expires_entries(self):
+        cache = LRUCache(4, ttl=10)
+        with mock.patch("ector.cache.time.monotonic", return_value=100.0):
+            cache.put("a", 1)
+        with mock.patch("ector.cache.time.monotonic", return_value=105.0):
+            self.assertEqual(cache.get("a"), 1)
+        with mock.patch("ector.cache.time.monotonic", return_value=111.0):
+            self.assertIsNone(cache.get("a"))
+        info = cache.info()
+        self.assertEqual((info["expirations"], info["size"], info["bytes"]), (1, 0, 0))
+
+    def test_estimate_size_is_deep(self):
+        flat = estimate_size({"product": "x"})
+        nested = estimate_size({"product": "x", "attributes": ["red", "128gb"]})
+        self.assertGreater(nested, flat)
+
+
+if __name__ == "__main__":
+    unittest.main()
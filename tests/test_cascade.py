@@ -0,0 +1,144 @@
+"""Tests for ector.cascade (larger models for low-confidence requests)."""
+
+import unittest
+from unittest import mock
+
+import spacy
+from spacy.language import Language
+
+import ector.api as api
+import ector.models as models
+from ector import extract_many, extract_sync
+from ector.cascade import CascadeStats, low_confidence
+from ector.languages import configure_cascade, get_language
+from ector.shallow import annotate
+from ector.stream import extract_stream
+
+
+@Language.component("test_cascade_blind")
+def _blind(doc):
+    for token in doc:
+        token.pos_ = "PUNCT"
+        token.lemma_ = token.lower_
+    return doc
+
+
+@Language.component("test_cascade_tagger")
+def _tagger(doc):
+    return annotate(doc, get_language(doc.lang_))
+
+
+def _load(name, **kwargs):
+    nlp = spacy.blank(name[:2])
+    nlp.add_pipe("sentencizer")
+    nlp.add_pipe("test_cascade_tagger" if name.endswith("_md") else "test_cascade_blind")
+    return nlp
+
+
+def _record(has_trigger=False, products=(), fallback_disagrees=False, has_products=None):
+    return {"has_trigger": has_trigger, "products": list(products),
+            "has_products": bool(products) if has_products is None else has_products,
+            "fallback_disagrees": fallback_disagrees}
+
+
+class TestLowConfidence(unittest.TestCase):
+    def test_signals(self):
+        self.assertEqual(low_confidence([_record(has_trigger=True)]), "trigger_without_product")
+        self.assertEqual(
+            low_confidence([_record(products=[{"product": "Phone"}], fallback_disagrees=True)]),
+            "fallback_disagrees",
+        )
+        self.assertIsNone(low_confidence([_record(True, [{"product": "Phone"}]), _record()]))
+        # ``fields`` left the products out, but the sentence has one.
+        self.assertIsNone(low_confidence([_record(has_trigger=True, has_products=True)]))
+
+    def test_stats(self):
+        stats = CascadeStats()
+        stats.record_check(None)
+        stats.record_check("trigger_without_product")
+        stats.record_stage("en_core_web_md", parsed=1, resolved=1, seconds=0.5)
+        snap = stats.snapshot()
+        self.assertEqual(snap["cascade_rate"], 0.5)
+        self.assertEqual(snap["reasons"], {"trigger_without_product": 1})
+        self.assertEqual(snap["models"]["en_core_web_md"]["resolved"], 1)
+        self.assertEqual(snap["mean_cost_per_cascaded"], 0.5)
+
+
+class TestCascade(unittest.TestCase):
+    def setUp(self):
+        for patcher in (
+            mock.patch("ector.models.is_package", return_value=True),
+            mock.patch("ector.models.spacy.load", side_effect=_load),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        models.clear_model_cache()
+        self.addCleanup(models.clear_model_cache)
+        api.clear_extract_cache()
+        self.addCleanup(api.clear_extract_cache)
+        api.reset_cascade_stats()
+        self.addCleanup(configure_cascade, "en", ())
+
+    def test_low_confidence_requests_reach_the_larger_model(self):
+        self.assertEqual(extract_sync("I want a laptop")["products"], [])
+        configure_cascade("en", ["en_core_web_md"])
+        api.clear_extract_cache()
+        result = extract_sync("I want a laptop")
+        self.assertEqual(result["products"][0]["product"].lower(), "laptop")
+        stats = api.cascade_stats()
+        self.assertEqual((stats["checked"], stats["cascaded"]), (1, 1))
+        self.assertEqual(stats["reasons"], {"trigger_without_product": 1})
+        self.assertEqual(stats["models"]["en_core_web_md"]["resolved"], 1)
+        self.assertGreater(stats["cascade_seconds"], 0)
+
+    def test_configuring_the_cascade_bypasses_cached_results(self):
+        clause_maxsize = api.clause_cache_info()["maxsize"]
+        api.resize_clause_cache(16)
+        self.addCleanup(api.resize_clause_cache, clause_maxsize)
+        self.assertEqual(extract_sync("I want a laptop")["products"], [])
+        self.assertEqual(list(extract_many(["I want a laptop"], batch_size=1))[0]["products"], [])
+        configure_cascade("en", ["en_core_web_md"])
+        self.assertEqual(extract_sync("I want a laptop")["products"][0]["product"].lower(), "laptop")
+        self.assertEqual(
+            list(extract_many(["I want a laptop"], batch_size=1))[0]["products"][0]["product"].lower(),
+            "laptop",
+        )
+
+    def test_confident_requests_stay_on_the_default_model(self):
+        configure_cascade("en", ["en_core_web_md"])
+        extract_sync("hello there")
+        stats = api.cascade_stats()
+        self.assertEqual((stats["checked"], stats["cascaded"]), (1, 0))
+        self.assertNotIn("en_core_web_md", models.model_info()["models"])
+
+    def test_fields_without_products_do_not_cascade_found_products(self):
+        configure_cascade("en", ["en_core_web_md"])
+        with mock.patch("ector.models.spacy.load", side_effect=lambda name, **kw: _load("en_core_web_md")):
+            models.clear_model_cache()
+            result = extract_sync("I want a laptop under 300 usd", fields=["budget"])
+        self.assertEqual(result["products"], [])
+        stats = api.cascade_stats()
+        self.assertEqual((stats["checked"], stats["cascaded"]), (1, 0))
+        self.assertNotIn("en_core_web_md", models.model_info()["models"])
+
+    def test_fields_without_products_still_cascade_missed_products(self):
+        configure_cascade("en", ["en_core_web_md"])
+        extract_sync("I want a laptop", fields=["budget"])
+        self.assertEqual(api.cascade_stats()["reasons"], {"trigger_without_product": 1})
+
+    def test_stream_windows_cascade(self):
+        configure_cascade("en", ["en_core_web_md"])
+        result = extract_stream("I want a laptop").result()
+        self.assertEqual(result, extract_sync("I want a laptop"))
+        self.assertEqual(result["products"][0]["product"].lower(), "laptop")
+        self.assertEqual(api.cascade_stats()["cascaded"], 2)
+
+    def test_batch_variant(self):
+        configure_cascade("en", ["en_core_web_md"])
+        texts = ["I want a laptop", "hello there", "I need a phone"]
+        self.assertEqual(list(extract_many(texts)), [extract_sync(text) for text in texts])
+        self.assertEqual(api.cascade_stats()["cascaded"], 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,9 +3,10 @@
 import io
 import json
 import unittest
-from contextlib import redirect_stdout
+from contextlib import redirect_stderr, redirect_stdout
 from unittest import mock
 
+from ector import instrument
 from ector.cli import main
 
 
@@ -36,6 +37,78 @@ class TestCli(unittest.TestCase):
         self.assertNotIn("\n  ", out)  # no pretty indentation
         json.loads(out)  # still valid JSON
 
+    def test_rules_mode_needs_no_model(self):
+        with mock.patch("ector.models.ModelManager.get", side_effect=OSError("no model")):
+            code, out = self._run(["--mode", "rules", "I want a laptop for 150 usd"])
+        self.assertEqual(code, 0)
+        self.assertEqual(json.loads(out)["products"][0]["price"], 150.0)
+
+    def test_profile_is_passed_through(self):
+        with mock.patch("ector.cli.extract_sync", return_value={"products": []}) as extract:
+            self._run(["--profile", "minimal", "a phone"])
+        self.assertEqual(extract.call_args.kwargs["profile"], "minimal")
+        with mock.patch("ector.cli.extract_stream") as stream:
+            stream.return_value.__iter__.return_value = iter(())
+            stream.return_value.summary.return_value = {}
+            self._run(["--stream", "--profile", "fast", "a phone"])
+        self.assertEqual(stream.call_args.kwargs["profile"], "fast")
+        with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            main(["--profile", "turbo", "a phone"])
+
+    def test_timings_go_to_stderr(self):
+        err = io.StringIO()
+        with redirect_stderr(err):
+            code, out = self._run(["--timings", "I need a tablet for 90 usd."])
+        self.assertEqual(code, 0)
+        json.loads(out)  # stdout stays pure JSON
+        self.assertIn("normalize_vocabulary", err.getvalue())
+        self.assertIn("total", err.getvalue())
+
+    def test_fields_limit_the_output(self):
+        with mock.patch("ector.models.ModelManager.get", side_effect=OSError("no model")):
+            code, out = self._run([
+                "--mode", "rules", "--fields", "products.product,budget",
+                "I want a laptop for 150 usd. My budget is 300 usd",
+            ])
+        self.assertEqual(code, 0)
+        self.assertEqual(json.loads(out), {
+            "products": [{"product": "Laptop"}],
+            "budget": {"price": 300.0, "currency": "usd"},
+        })
+
+    def test_stream_honours_mode_and_fields(self):
+        with mock.patch("ector.models.ModelManager.get", side_effect=OSError("no model")):
+            code, out = self._run([
+                "--stream", "--mode", "rules", "--fields", "products.product,budget",
+                "I want a laptop for 150 usd. My budget is 300 usd",
+            ])
+        self.assertEqual(code, 0)
+        self.assertEqual([json.loads(line) for line in out.splitlines()], [
+            {"product": "Laptop"},
+            {"budget": {"price": 300.0, "currency": "usd"}},
+        ])
+
+    def test_timings_leave_instrumentation_as_found(self):
+        self.addCleanup(instrument.enable if instrument.enabled() else instrument.disable)
+        for initially in (False, True):
+            (instrument.enable if initially else instrument.disable)()
+            with redirect_stderr(io.StringIO()), \
+                    mock.patch("ector.models.ModelManager.get", side_effect=OSError("no model")):
+                self._run(["--timings", "--mode", "rules", "a phone for 90 usd"])
+                self._run(["--timings", "a phone for 90 usd"])  # fails: no model
+            self.assertIs(instrument.enabled(), initially)
+
+    def test_unknown_field_is_a_usage_error(self):
+        with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            main(["--fields", "products.colour", "a phone"])
+
+    def test_snapshot_build(self):
+        with mock.patch("ector.cli.build_snapshot", return_value={"pipelines": {}}) as build:
+            code, out = self._run(["snapshot", "build", "--output", "out.snapshot", "--lang", "en"])
+        self.assertEqual(code, 0)
+        build.assert_called_once_with("out.snapshot", ["en"], None)
+        self.assertEqual(json.loads(out), {"pipelines": {}})
+
     def test_no_input_errors(self):
         # No arg, no file, and a tty stdin -> argparse error -> SystemExit(2).
         with mock.patch("sys.stdin") as stdin:
@@ -0,0 +1,109 @@
+"""Tests for ector.doc_cache (on-disk parsed-doc cache)."""
+
+import contextlib
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import spacy
+from spacy.language import Language
+
+from ector import api
+from ector.doc_cache import DocCache, configure_doc_cache, get_doc_cache
+from ector.languages import get_language
+
+_PARSED = []
+
+
+@Language.component("test_doc_cache_tagger")
+def _tagger(doc):
+    _PARSED.append(doc.text)
+    for token in doc:
+        token.pos_ = "NUM" if token.like_num else "NOUN"
+    return doc
+
+
+def _pipeline(version="3.8.0"):
+    nlp = spacy.blank("en")
+    nlp.meta["name"] = "core_web_sm"
+    nlp.meta["version"] = version
+    nlp.add_pipe("sentencizer")
+    nlp.add_pipe("test_doc_cache_tagger")
+    return nlp
+
+
+class TestDocCache(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = tmp.name
+        self.nlp = _pipeline()
+
+    def test_docs_round_trip_through_shards(self):
+        cache = DocCache(self.dir, shard_size=2)
+        for text in ("a laptop for 150 usd. thanks", "two phones", "a desk"):
+            cache.put(self.nlp, "accurate", self.nlp(text))
+        self.assertEqual(cache.info()["pending"], 1)
+        cache.flush()
+        namespace = os.path.join(self.dir, "en_core_web_sm-3.8.0-accurate")
+        self.assertEqual(len(os.listdir(namespace)), 2)
+
+        reopened = DocCache(self.dir)
+        doc = reopened.get(self.nlp, "accurate", "a laptop for 150 usd. thanks")
+        self.assertEqual([t.pos_ for t in doc][:4], ["NOUN", "NOUN", "NOUN", "NUM"])
+        self.assertEqual(len(list(doc.sents)), 2)
+        self.assertIsNotNone(reopened.get(self.nlp, "accurate", "a desk"))
+        self.assertIsNone(reopened.get(self.nlp, "accurate", "a chair"))
+        self.assertEqual(reopened.info(), {"hits": 2, "misses": 1, "docs": 3, "pending": 0})
+
+    def test_model_version_and_profile_are_part_of_the_key(self):
+        cache = DocCache(self.dir)
+        cache.put(self.nlp, "accurate", self.nlp("a desk"))
+        cache.flush()
+        reopened = DocCache(self.dir)
+        self.assertIsNone(reopened.get(self.nlp, "fast", "a desk"))
+        self.assertIsNone(reopened.get(_pipeline("3.8.1"), "accurate", "a desk"))
+        self.assertIsNotNone(reopened.get(self.nlp, "accurate", "a desk"))
+
+
+class TestParseWithDocCache(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.addCleanup(configure_doc_cache, None)
+        nlp = _pipeline()
+
+        @contextlib.contextmanager
+        def checkout(model_name, profile=None):
+            yield nlp
+
+        patcher = mock.patch("ector.api.checkout_model", checkout)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        configure_doc_cache(tmp.name)
+        self.dir = tmp.name
+        self.config = get_language("en")
+        _PARSED.clear()
+
+    def test_hits_skip_the_model_call(self):
+        texts = ["a laptop for 150 usd", "two phones", "a desk"]
+        api._parse(texts[:2], self.config)
+        self.assertEqual(_PARSED, texts[:2])
+        # A later run (new process) only parses what it has not seen.
+        configure_doc_cache(self.dir)
+        _PARSED.clear()
+        docs = api._parse(texts, self.config)
+        self.assertEqual(_PARSED, ["a desk"])
+        self.assertEqual([doc.text for doc in docs], texts)
+        self.assertEqual(get_doc_cache().info()["hits"], 2)
+
+    def test_disabled_parses_every_time(self):
+        configure_doc_cache(None)
+        api._parse(["a desk"], self.config)
+        api._parse(["a desk"], self.config)
+        self.assertEqual(_PARSED, ["a desk", "a desk"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+"""Tests for the bounded executor behind the ``extract`` coroutine."""
+
+import asyncio
+import threading
+import unittest
+
+from ector import extract
+from ector.executor import ExtractExecutor, configure_executor, executor_stats, get_executor
+
+
+class TestExtractExecutor(unittest.TestCase):
+    def tearDown(self):
+        get_executor().shutdown()
+
+    def test_event_loop_not_blocked(self):
+        executor = ExtractExecutor("thread", max_workers=1)
+        started, gate = threading.Event(), threading.Event()
+
+        def parked():
+            started.set()
+            return gate.wait(5)  # False if nothing opened the gate
+
+        async def main():
+            job = asyncio.create_task(executor.run(parked))
+            while not started.is_set():
+                await asyncio.sleep(0.001)
+            # Only a free loop can run this callback while the job is parked.
+            asyncio.get_running_loop().call_soon(gate.set)
+            return await job
+
+        self.assertTrue(asyncio.run(main()))
+        executor.shutdown()
+
+    def test_concurrency_bound_and_queue_depth(self):
+        executor = ExtractExecutor("thread", max_workers=4, max_concurrency=2)
+        gate = threading.Event()
+        seen = {}
+
+        async def main():
+            tasks = [asyncio.create_task(executor.run(gate.wait, 5)) for _ in range(5)]
+            await asyncio.sleep(0.05)
+            seen.update(executor.stats())
+            gate.set()
+            await asyncio.gather(*tasks)
+
+        asyncio.run(main())
+        executor.shutdown()
+        self.assertEqual(seen["in_flight"], 2)
+        self.assertEqual(seen["running"], 2)
+        self.assertEqual(seen["waiting"], 3)
+        final = executor.stats()
+        self.assertEqual((final["in_flight"], final["waiting"], final["completed"]), (0, 0, 5))
+
+    def test_cancel_while_queued(self):
+        executor = ExtractExecutor("thread", max_workers=1, max_concurrency=1)
+        gate = threading.Event()
+        calls = []
+
+        async def main():
+            first = asyncio.create_task(executor.run(gate.wait, 5))
+            queued = asyncio.create_task(executor.run(calls.append, "ran"))
+            await asyncio.sleep(0.05)
+            queued.cancel()
+            gate.set()
+            await first
+            with self.assertRaises(asyncio.CancelledError):
+                await queued
+
+        asyncio.run(main())
+        executor.shutdown()
+        self.assertEqual(calls, [])
+        self.assertEqual(executor.stats()["waiting"], 0)
+
+    def test_process_kind(self):
+        executor = ExtractExecutor("process", max_workers=1)
+        self.assertEqual(asyncio.run(executor.run(pow, 2, 10)), 1024)
+        executor.shutdown()
+
+    def test_invalid_kind(self):
+        with self.assertRaises(ValueError):
+            ExtractExecutor("fiber")
+
+    def test_configure_default(self):
+        executor = configure_executor("thread", max_workers=2, max_concurrency=3)
+        self.assertIs(get_executor(), executor)
+        stats = executor_stats()
+        self.assertEqual((stats["max_workers"], stats["max_concurrency"]), (2, 3))
+
+    def test_extract_runs_on_executor(self):
+        configure_executor("thread", max_workers=1)
+        result = asyncio.run(extract(""))
+        self.assertEqual(result, {"products": [], "intent": "browse"})
+        self.assertEqual(executor_stats()["completed"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
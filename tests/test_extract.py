@@ -1,7 +1,14 @@
 import asyncio
+import copy
+import os
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 
-from ector import extract
+import ector.api as api
+from ector import aextract_many, extract, extract_many, extract_sync
+from ector.models import configure_model_pool, model_info
+from tests.fixtures.harness import load_dataset
 
 
 def run_async(coro):
@@ -156,5 +163,219 @@ class TestExtractProductRequests(unittest.TestCase):
         self.assertNotIn("budget", result)
 
 
+class TestExtractMany(unittest.TestCase):
+    TEXTS = [
+        "I want a smartphone for 200 USD.",
+        "",
+        "I'm looking for a big TV. I also need a gaming console. My budget is 1200 USD.",
+        "   ",
+        "I only have 150 eur.",
+        "I want a phone for 250",
+    ]
+
+    def test_matches_extract_sync_item_for_item(self):
+        expected = [extract_sync(text) for text in self.TEXTS]
+        for batch_size in (1, 2, 64):
+            got = list(extract_many(self.TEXTS, batch_size=batch_size))
+            self.assertEqual(got, expected, batch_size)
+
+    def test_async_iterator_variant(self):
+        async def collect():
+            return [result async for result in aextract_many(self.TEXTS, batch_size=4)]
+
+        self.assertEqual(run_async(collect()), [extract_sync(t) for t in self.TEXTS])
+
+    def test_rejects_bad_arguments_at_the_call(self):
+        # Raised before any result is requested, not on first iteration.
+        with self.assertRaises(ValueError):
+            extract_many(["a phone"], batch_size=0)
+        with self.assertRaises(ValueError):
+            aextract_many(["a phone"], batch_size=0)
+        with self.assertRaises(ValueError):
+            extract_many(["a phone"], mode="fast")
+
+
+class TestThreadedExtraction(unittest.TestCase):
+    """Stress: many threads sharing a model pool must match serial extraction."""
+
+    def setUp(self):
+        # Restore the sizes found, which ECTOR_* settings may have changed.
+        self.addCleanup(configure_model_pool, model_info()["pool"]["size"])
+        self.addCleanup(api.resize_extract_cache, api.extract_cache_info()["maxsize"])
+        api.resize_extract_cache(0)  # every call parses
+        configure_model_pool(3)
+        dataset = os.path.join(os.path.dirname(__file__), "fixtures", "dataset.jsonl")
+        cases = load_dataset(dataset)[:300]
+        self.jobs = [(case["text"], case["lang"]) for case in cases]
+
+    def test_threads_match_serial(self):
+        expected = [extract_sync(text, lang) for text, lang in self.jobs]
+        with ThreadPoolExecutor(max_workers=12) as pool:
+            for _ in range(3):
+                got = list(pool.map(lambda job: extract_sync(*job), self.jobs))
+                self.assertEqual(got, expected)
+        self.assertGreater(model_info()["pool"]["checkouts"], 0)
+
+
+class TestClauseCache(unittest.TestCase):
+    def setUp(self):
+        self.maxsize = api.clause_cache_info()["maxsize"]
+        api.resize_clause_cache(256)
+        api._CLAUSE_CACHE.clear()
+
+    def tearDown(self):
+        api.resize_clause_cache(self.maxsize)
+
+    def test_shared_clauses_hit_across_requests(self):
+        first = extract_sync("hi, I need a charger")
+        misses = api.clause_cache_info()["misses"]
+        second = extract_sync("hello, I need a charger")
+        info = api.clause_cache_info()
+        self.assertEqual(info["misses"], misses + 1)  # only "hello." is new
+        self.assertGreaterEqual(info["hits"], 1)
+        self.assertEqual(first["products"], second["products"])
+
+    def test_cached_records_are_not_mutated(self):
+        maxsize = api.extract_cache_info()["maxsize"]
+        api.resize_extract_cache(0)  # every call goes through the clause cache
+        self.addCleanup(api.resize_extract_cache, maxsize)
+        text = "I want a laptop. only 300 usd"
+        first = extract_sync(text)
+        expected = copy.deepcopy(first)
+        first["products"][0]["product"] = "changed"
+        first["products"].append({"product": "Extra"})
+        hits = api.clause_cache_info()["hits"]
+        self.assertEqual(extract_sync(text), expected)
+        self.assertGreater(api.clause_cache_info()["hits"], hits)
+        self.assertEqual(list(extract_many([text, text])), [expected] * 2)
+
+
+class TestFieldSelection(unittest.TestCase):
+    TEXT = "I want a refurbished black Samsung phone under 300 usd. My budget is 400 usd."
+
+    def test_result_is_projection_of_full_result(self):
+        full = extract_sync(self.TEXT)
+        result = extract_sync(self.TEXT, fields=["products.product", "budget"])
+        self.assertEqual(
+            result,
+            {
+                "products": [{"product": p["product"]} for p in full["products"]],
+                "budget": full["budget"],
+            },
+        )
+
+    def test_enrichment_is_skipped(self):
+        with mock.patch.object(api, "detect_brand") as brand, \
+                mock.patch.object(api, "parse_constraint") as constraint:
+            extract_sync(self.TEXT + " (fields test)", fields=["products.attributes"])
+        brand.assert_not_called()
+        constraint.assert_not_called()
+
+    def test_empty_input_honours_fields(self):
+        self.assertEqual(extract_sync("  ", fields=["budget"]), {"products": []})
+
+
+class TestExtractCache(unittest.TestCase):
+    RESULT = {"products": [{"product": "Phone"}], "intent": "buy"}
+
+    def setUp(self):
+        info = api.extract_cache_info()
+        self.addCleanup(api.resize_extract_cache, info["maxsize"],
+                        maxbytes=info["maxbytes"], ttl=info["ttl"])
+        api.clear_extract_cache()
+        patcher = mock.patch.object(api, "_extract_from_normalized", return_value=self.RESULT)
+        self.compute = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_repeat_is_served_from_cache(self):
+        for _ in range(3):
+            self.assertEqual(extract_sync("a phone"), self.RESULT)
+        self.assertEqual(self.compute.call_count, 1)
+        info = api.extract_cache_info()
+        self.assertEqual((info["hits"], info["misses"], info["size"]), (2, 1, 1))
+        self.assertGreater(info["bytes"], 0)
+
+    def test_rules_mode_shares_one_entry_across_profiles(self):
+        results = [extract_sync("a phone", mode="rules", profile=p) for p in ("accurate", "minimal")]
+        self.assertEqual(results[0], results[1])
+        info = api.extract_cache_info()
+        self.assertEqual((info["hits"], info["misses"], info["size"]), (1, 1, 1))
+
+    def test_resize_and_clear_at_runtime(self):
+        extract_sync("a phone")
+        api.resize_extract_cache(maxbytes=1)  # every entry is larger
+        self.assertEqual(api.extract_cache_info()["size"], 0)
+        extract_sync("a phone")
+        self.assertEqual(self.compute.call_count, 2)
+        api.resize_extract_cache(0)
+        extract_sync("a phone")
+        self.assertEqual(api.extract_cache_info()["size"], 0)
+        api.resize_extract_cache(16, maxbytes=0)
+        extract_sync("a phone")
+        api.clear_extract_cache()
+        self.assertEqual(api.extract_cache_info()["size"], 0)
+
+
+class TestTieredMode(unittest.TestCase):
+    def setUp(self):
+        api.clear_extract_cache()  # cache hits bypass both tiers
+        api.reset_tier_stats()
+
+    def test_matches_full_mode_and_counts_tiers(self):
+        for text in ("I want a red phone and a laptop for 300 eur", "I want a phone for 250"):
+            self.assertEqual(extract_sync(text, mode="tiered"), extract_sync(text))
+        stats = api.tier_stats()
+        self.assertEqual((stats["fast"], stats["escalated"]), (1, 1))
+        self.assertEqual(stats["escalation_reasons"], {"bare_number": 1})
+
+    def test_batch_variant(self):
+        texts = TestExtractMany.TEXTS
+        self.assertEqual(
+            list(extract_many(texts, mode="tiered")),
+            [extract_sync(text, mode="tiered") for text in texts],
+        )
+
+    def test_fast_tier_needs_no_model_whatever_the_fields(self):
+        with mock.patch("ector.models.ModelManager.get", side_effect=OSError("no model")):
+            for fields in (None, ["budget"], ["price_constraint"]):
+                extract_sync("I want a phone", mode="tiered", fields=fields)
+        stats = api.tier_stats()
+        self.assertEqual((stats["fast"], stats["escalated"]), (3, 0))
+
+    def test_rejects_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            extract_sync("a phone", mode="fastest")
+
+
+class TestRulesMode(unittest.TestCase):
+    def setUp(self):
+        api.clear_extract_cache()
+
+    def test_runs_without_a_model(self):
+        with mock.patch("ector.models.ModelManager.get", side_effect=OSError("no model")):
+            result = extract_sync("I want a phone and a laptop for 300 eur", mode="rules")
+            french = extract_sync("je veux un ordinateur pour 500 euros", "fr", mode="rules")
+        self.assertEqual(
+            [(p["product"], p.get("price")) for p in result["products"]],
+            [("Phone", 300.0), ("Laptop", 300.0)],
+        )
+        self.assertEqual(french["products"][0]["currency"], "eur")
+
+    def test_never_escalates(self):
+        api.reset_tier_stats()
+        with mock.patch("ector.models.ModelManager.get", side_effect=OSError("no model")):
+            result = extract_sync("I want a phone for 250", mode="rules")
+        self.assertEqual(result["products"][0]["product"], "Phone")
+        self.assertEqual(api.tier_stats()["escalated"], 0)
+
+    def test_batch_variant(self):
+        texts = TestExtractMany.TEXTS
+        with mock.patch("ector.models.ModelManager.get", side_effect=OSError("no model")):
+            self.assertEqual(
+                list(extract_many(texts, mode="rules")),
+                [extract_sync(text, mode="rules") for text in texts],
+            )
+
+
 if __name__ == "__main__":
     unittest.main()
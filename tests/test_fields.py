@@ -0,0 +1,44 @@
+"""Tests for ector.fields (field selection)."""
+
+import unittest
+
+from ector.api import extract_sync
+from ector.fields import ALL_FIELDS, PRODUCT_FIELDS, parse_fields, wants_products
+
+
+class TestParseFields(unittest.TestCase):
+    def test_none_selects_everything(self):
+        self.assertEqual(parse_fields(None), ALL_FIELDS)
+
+    def test_product_subfield_implies_name(self):
+        self.assertEqual(parse_fields(["products.brand"]), {"product", "brand"})
+
+    def test_comma_separated_string(self):
+        self.assertEqual(
+            parse_fields("products, budget ,intent"), PRODUCT_FIELDS | {"budget", "intent"}
+        )
+
+    def test_parsed_selection_parses_to_itself(self):
+        for raw in (None, ["products.brand"], ["budget", "intent"], ["products"], ["price"]):
+            once = parse_fields(raw)
+            self.assertEqual(parse_fields(once), once)
+        self.assertEqual(parse_fields(["brand"]), {"product", "brand"})
+
+    def test_unknown_field_rejected(self):
+        for bad in (["colour"], ["products.colour"], ["products."]):
+            with self.assertRaises(ValueError):
+                parse_fields(bad)
+
+    def test_extract_sync_takes_all_fields(self):
+        self.assertEqual(
+            extract_sync("a phone", mode="rules", fields=ALL_FIELDS),
+            extract_sync("a phone", mode="rules"),
+        )
+
+    def test_intent_needs_products(self):
+        self.assertTrue(wants_products(parse_fields(["intent"])))
+        self.assertFalse(wants_products(parse_fields(["budget", "price_constraint"])))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,21 @@
 """Unit tests for ector.fuzzy."""
 
+import gc
+import os
+import random
 import unittest
+from unittest import mock
 
 from ector.fuzzy import (
+    _REGISTERED_INDEXES,
+    FUZZY_BACKENDS,
+    NUMPY_MIN_TERMS,
     FuzzyIndex,
+    _bounded_rows,
+    _trie_walk,
     bounded_levenshtein,
     cached_best_match,
+    distances,
     register_index,
     threshold_for,
 )
@@ -22,6 +32,26 @@ class TestBoundedLevenshtein(unittest.TestCase):
     def test_length_gap_shortcut(self):
         self.assertEqual(bounded_levenshtein("a", "abcdef", 2), 3)
 
+    def test_bit_parallel_matches_the_rows(self):
+        rng = random.Random(5)
+        for _ in range(3000):
+            a = "".join(rng.choice("abc") for _ in range(rng.randint(1, 9)))
+            b = "".join(rng.choice("abc") for _ in range(rng.randint(1, 9)))
+            md = abs(len(a) - len(b)) + rng.randint(0, 3)
+            self.assertEqual(bounded_levenshtein(a, b, md), _bounded_rows(a, b, md), (a, b, md))
+        for a, b in (("ab" * 32, "ba" * 32), ("ab" * 32 + "c", "ab" * 32 + "dc")):
+            self.assertEqual(bounded_levenshtein(a, b, 3), _bounded_rows(a, b, 3))
+
+    def test_batch_distances(self):
+        candidates = ["laptop", "labtop", "latpop", "lap", "", "laptops", "x" * 70]
+        for word in ("laptop", "", "y" * 70):
+            for md in (0, 1, 2):
+                self.assertEqual(
+                    distances(word, candidates, md),
+                    [bounded_levenshtein(word, cand, md) for cand in candidates],
+                )
+        self.assertEqual(distances("laptop", candidates, 2)[:4], [0, 1, 1, 3])
+
 
 class TestThreshold(unittest.TestCase):
     def test_scaling(self):
@@ -59,6 +89,114 @@ class TestFuzzyIndex(unittest.TestCase):
         self.assertEqual(cached_best_match(token, "dollr"), "dollar")
         self.assertEqual(cached_best_match(token, "dollr"), "dollar")  # cache hit
 
+    def test_lookup_memo_keeps_misses_and_sees_added_terms(self):
+        index = FuzzyIndex(["dollar", "euro"], cache_size=8)
+        self.assertEqual(index.best_match("dollr"), "dollar")
+        self.assertEqual(index.best_match("DOLLR"), "dollar")
+        self.assertIsNone(index.best_match("tablte"))
+        self.assertIsNone(index.best_match("tablte"))
+        self.assertEqual(index.best_match("euro"), "euro")  # exact: not memoized
+        info = index.cache_info()
+        self.assertEqual((info["hits"], info["misses"], info["size"]), (2, 2, 2))
+        index.add("tablet")
+        self.assertEqual(index.best_match("tablte"), "tablet")
+        index.resize_cache(0)
+        self.assertEqual(index.best_match("dollr"), "dollar")
+        self.assertEqual(index.cache_info()["size"], 0)
+        with mock.patch.dict(os.environ, {"ECTOR_FUZZY_CACHE_SIZE": "0"}):
+            self.assertEqual(FuzzyIndex(["euro"]).cache_info()["maxsize"], 0)
+
+    def test_registry_does_not_outlive_or_reuse_collected_indexes(self):
+        index = FuzzyIndex(["dollar"])
+        token = register_index(index)
+        del index
+        gc.collect()
+        self.assertNotIn(token, _REGISTERED_INDEXES)
+        self.assertNotEqual(register_index(self.index), token)
+        with self.assertRaises(KeyError):
+            cached_best_match(token, "dollr")
+
+
+class TestBackends(unittest.TestCase):
+    def test_same_answers_as_bucket_scan(self):
+        rng = random.Random(3)
+        vocab = {
+            "".join(rng.choice("abcdeilnorst") for _ in range(rng.randint(2, 14)))
+            for _ in range(400)
+        }
+        words = [
+            "".join(rng.choice("abcdeilnorst") for _ in range(rng.randint(1, 15)))
+            for _ in range(300)
+        ]
+        reference = FuzzyIndex(vocab, backend="buckets")
+        for backend in FUZZY_BACKENDS:
+            index = FuzzyIndex(vocab, backend=backend)
+            for word in words:
+                for md in (None, 1, 2, 3):
+                    self.assertEqual(
+                        index.best_match(word, md), reference.best_match(word, md),
+                        (backend, word, md),
+                    )
+
+    def test_symspell_ties_and_first_letter_typos(self):
+        index = FuzzyIndex(["dollar", "dollars", "euro", "euros", "laptop", "iphone"],
+                           backend="symspell")
+        # distance 1 from both: the shorter term wins
+        self.assertEqual(index.best_match("dollarz"), "dollar")
+        self.assertEqual(index.best_match("dollr"), "dollar")
+        self.assertEqual(index.best_match("kaptop"), "laptop")
+        # A first-letter typo that also changes the length is out of reach,
+        # as with the bucket scan.
+        self.assertIsNone(index.best_match("klaptop"))
+        index.add("Tablet")
+        self.assertEqual(index.best_match("tablett"), "tablet")
+
+    def test_trie_walk_skips_far_prefixes_and_keeps_order(self):
+        terms = sorted(["laptop", "lapdog", "zebras", "kaptop", "latpop"])
+        found = list(_trie_walk(terms, "laptop", 1))
+        self.assertEqual(found, [(1, "kaptop"), (0, "laptop"), (1, "latpop")])
+        self.assertEqual(
+            list(_trie_walk(terms, "lpatop", 2)), [(2, "kaptop"), (1, "laptop"), (2, "latpop")]
+        )
+        index = FuzzyIndex(terms + ["laptops"], backend="trie")
+        index.add("Laptob")
+        self.assertEqual(sorted(index.candidates("laptoq", 1)), ["laptob", "laptop"])
+        self.assertEqual(index.best_match("laptoq", 1), "laptob")
+
+    def test_numpy_matrices_score_like_the_rows(self):
+        rng = random.Random(4)
+        vocab = {"".join(rng.choice("abcdelnor") for _ in range(rng.randint(3, 8))) for _ in range(600)}
+        reference = FuzzyIndex(vocab, backend="buckets")
+        # Every slice through the vectorized kernel, however small.
+        with mock.patch("ector.fuzzy._NUMPY_MIN_ROWS", 0):
+            index = FuzzyIndex(vocab, backend="numpy")
+            for added in ("Abcden", "rolled", "x" * 70):
+                index.add(added)
+                reference.add(added)
+            for word in [*rng.sample(sorted(vocab), 100), "abcdez", "rolle", "x" * 69]:
+                word = word[:-1] + rng.choice("abcz") if len(word) < 60 else word
+                for md in (None, 1, 2, 3):
+                    self.assertEqual(
+                        index.best_match(word, md), reference.best_match(word, md), (word, md)
+                    )
+
+    def test_backend_selection(self):
+        with mock.patch.dict(os.environ, {"ECTOR_FUZZY_BACKEND": "symspell"}):
+            self.assertEqual(FuzzyIndex(["euro"]).backend, "symspell")
+        large = [f"term{i}" for i in range(NUMPY_MIN_TERMS)]
+        with mock.patch.dict(os.environ, {"ECTOR_FUZZY_BACKEND": ""}):
+            self.assertEqual(FuzzyIndex(["euro"]).backend, "buckets")
+            self.assertEqual(FuzzyIndex(large).backend, "numpy")
+            self.assertEqual(FuzzyIndex(large, backend="trie").backend, "trie")
+            with mock.patch("ector.fuzzy.np", None):
+                self.assertEqual(FuzzyIndex(large).backend, "buckets")
+                with self.assertRaises(ImportError):
+                    FuzzyIndex(["euro"], backend="numpy")
+        with mock.patch.dict(os.environ, {"ECTOR_FUZZY_BACKEND": "buckets"}):
+            self.assertEqual(FuzzyIndex(large).backend, "buckets")
+        with self.assertRaises(ValueError):
+            FuzzyIndex(["euro"], backend="bktree")
+
 
 if __name__ == "__main__":
     unittest.main()
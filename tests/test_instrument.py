@@ -0,0 +1,62 @@
+"""Tests for ector.instrument (per-stage timing)."""
+
+import unittest
+
+from ector import instrument
+
+
+class TestInstrument(unittest.TestCase):
+    def setUp(self):
+        instrument.reset()
+        instrument.enable()
+
+    def tearDown(self):
+        instrument.disable()
+        instrument.reset()
+
+    def test_disabled_is_a_no_op(self):
+        instrument.disable()
+        self.assertIs(instrument.stage("spacy"), instrument.stage("enrich"))
+        with instrument.call("en", 3), instrument.stage("spacy"):
+            instrument.count("extract_cache_hit")
+        self.assertEqual(instrument.snapshot()["stages"], {})
+
+    def test_call_record_reaches_hooks_and_histogram(self):
+        records = []
+        instrument.add_hook(records.append)
+        try:
+            with instrument.call("en", 12):
+                for _ in range(2):
+                    with instrument.stage("enrich"):
+                        pass
+                instrument.count("extract_cache_hit")
+        finally:
+            instrument.remove_hook(records.append)
+        [record] = records
+        self.assertEqual(record["stages"]["enrich"]["calls"], 2)
+        self.assertEqual(record["counters"]["extract_cache_hit"], 1)
+        self.assertEqual((record["lang"], record["chars"]), ("en", 12))
+        snap = instrument.snapshot()
+        self.assertEqual(snap["stages"]["enrich"]["count"], 1)  # one call
+        self.assertEqual(snap["stages"]["total"]["count"], 1)
+        self.assertEqual(snap["counters"]["calls"], 1)
+
+    def test_failing_hook_does_not_propagate(self):
+        def broken(record):
+            raise RuntimeError("boom")
+
+        instrument.add_hook(broken)
+        try:
+            with self.assertLogs("ector.instrument", "ERROR"), instrument.call("en", 1):
+                pass
+        finally:
+            instrument.remove_hook(broken)
+
+    def test_stage_outside_a_call_is_observed_directly(self):
+        with instrument.stage("spacy"):
+            pass
+        self.assertEqual(instrument.snapshot()["stages"]["spacy"]["count"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,10 @@
 """Tests for ector.models caching and download policy."""
 
+import gc
+import threading
+import time
 import unittest
+import weakref
 from unittest import mock
 
 import ector.models as models
@@ -52,5 +56,134 @@ class TestModelCaching(unittest.TestCase):
         self.assertIn("download", args)
 
 
+class TestModelManager(unittest.TestCase):
+    def setUp(self):
+        patches = [
+            mock.patch("ector.models.is_package", return_value=True),
+            mock.patch("ector.models.spacy.load", side_effect=lambda name, **kw: object()),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_idle_model_is_evicted_on_next_use(self):
+        manager = models.ModelManager(idle_timeout=60)
+        with mock.patch("ector.models.time.monotonic", return_value=0.0):
+            manager.get("en_core_web_sm")
+            manager.get("fr_core_news_sm")
+        with mock.patch("ector.models.time.monotonic", return_value=30.0):
+            manager.get("en_core_web_sm")
+        with mock.patch("ector.models.time.monotonic", return_value=70.0):
+            manager.evict_idle()
+        self.assertEqual(manager.loaded(), ["en_core_web_sm"])
+        self.assertEqual(manager.info()["evictions"], 1)
+
+    def test_memory_budget_evicts_least_recently_used(self):
+        manager = models.ModelManager(memory_budget=150)
+        rss = iter([0, 100, 100, 200])  # each load grows RSS by 100 bytes
+        with mock.patch("ector.models._resident_bytes", side_effect=lambda: next(rss)):
+            first = manager.get("en_core_web_sm")
+            manager.get("fr_core_news_sm")
+        self.assertEqual(manager.loaded(), ["fr_core_news_sm"])
+        info = manager.info()
+        self.assertEqual(info["models"]["fr_core_news_sm"]["rss_bytes"], 100)
+        self.assertEqual(info["models_rss_bytes"], 100)
+        with mock.patch("ector.models._resident_bytes", return_value=None):
+            self.assertIsNot(manager.get("en_core_web_sm"), first)  # reloaded
+        self.assertEqual(manager.loads, 3)
+
+    def test_explicit_evict_and_configure(self):
+        manager = models.ModelManager()
+        manager.get("en_core_web_sm")
+        self.assertTrue(manager.evict("en_core_web_sm"))
+        self.assertFalse(manager.evict("en_core_web_sm"))
+        manager.configure(idle_timeout=5, memory_budget=1 << 30)
+        self.assertEqual((manager.idle_timeout, manager.memory_budget), (5, 1 << 30))
+
+
+class TestModelPool(unittest.TestCase):
+    def setUp(self):
+        models.clear_model_cache()
+        self.addCleanup(models.clear_model_cache)
+        patches = [
+            mock.patch("ector.models.is_package", return_value=True),
+            mock.patch("ector.models.spacy.load", side_effect=self._load),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.vocabs = []
+
+    def _load(self, name, exclude=(), vocab=None):
+        nlp = mock.Mock()
+        nlp.vocab = vocab if vocab is not None else object()
+        self.vocabs.append(nlp.vocab)
+        return nlp
+
+    def test_size_zero_shares_the_cached_pipeline(self):
+        pool = models.ModelPool(0)
+        with pool.checkout("en_core_web_sm") as first, pool.checkout("en_core_web_sm") as second:
+            self.assertIs(first, second)
+        self.assertIs(first, models.get_model("en_core_web_sm"))
+
+    def test_instances_have_own_vocab_and_are_never_lent_twice(self):
+        pool = models.ModelPool(3)
+        in_use, overlaps, lock = set(), [], threading.Lock()
+
+        def worker():
+            for _ in range(20):
+                with pool.checkout("en_core_web_sm") as nlp:
+                    with lock:
+                        if id(nlp) in in_use:
+                            overlaps.append(nlp)
+                        in_use.add(id(nlp))
+                    time.sleep(0.001)
+                    with lock:
+                        in_use.discard(id(nlp))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(overlaps, [])
+        info = pool.info()
+        self.assertEqual(info["instances"], {"en_core_web_sm": 3})
+        self.assertEqual(info["checkouts"], 160)
+        self.assertGreater(info["waits"], 0)
+        self.assertEqual(len(set(map(id, self.vocabs))), 3)
+
+    def test_failed_load_does_not_block_waiters(self):
+        pool = models.ModelPool(1)
+        with mock.patch("ector.models.is_package", return_value=False), \
+                mock.patch.dict("os.environ", {models.AUTO_DOWNLOAD_ENV: ""}), \
+                self.assertRaises(OSError):
+            with pool.checkout("en_core_web_sm"):
+                pass
+        with pool.checkout("en_core_web_sm") as nlp:
+            self.assertIsNotNone(nlp)
+
+    def test_evicting_a_model_releases_its_pool(self):
+        manager = models.ModelManager()
+        pool = models.ModelPool(2, manager)
+        with pool.checkout("en_core_web_sm") as base, pool.checkout("en_core_web_sm") as copy:
+            self.assertIs(base, manager.get("en_core_web_sm"))
+        refs = [weakref.ref(base), weakref.ref(copy)]
+        del base, copy
+        self.assertEqual(pool.info()["instances"], {"en_core_web_sm": 2})
+        manager.evict("en_core_web_sm")
+        self.assertEqual(pool.info()["instances"], {})
+        gc.collect()
+        self.assertEqual([ref() for ref in refs], [None, None])
+        with pool.checkout("en_core_web_sm") as nlp:
+            self.assertIs(nlp, manager.get("en_core_web_sm"))  # the reloaded pipeline
+
+    def test_shrinking_drops_instances(self):
+        pool = models.ModelPool(2)
+        with pool.checkout("en_core_web_sm"), pool.checkout("en_core_web_sm"):
+            pool.resize(1)
+        self.assertEqual(pool.info()["instances"], {"en_core_web_sm": 1})
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,54 @@
+"""Tests for the fork-based parallel extraction engine."""
+
+import multiprocessing
+import unittest
+from unittest import mock
+
+from ector import extract_sync
+from ector.parallel import ParallelExtractor
+
+
+def _echo_many(texts, lang, batch_size):
+    return [{"products": [], "text": text, "lang": lang} for text in texts]
+
+
+@unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(), "needs fork")
+class TestParallelExtractor(unittest.TestCase):
+    def test_results_keep_input_order(self):
+        texts = [f"text {i}" for i in range(50)]
+        with mock.patch("ector.parallel.warm"), mock.patch(
+            "ector.parallel.extract_many", side_effect=_echo_many
+        ):
+            with ParallelExtractor(processes=3, lang="fr", chunk_size=4) as engine:
+                got = list(engine.map(texts))
+        self.assertEqual([r["text"] for r in got], texts)
+        self.assertTrue(all(r["lang"] == "fr" for r in got))
+
+    def test_single_process_runs_inline(self):
+        with mock.patch("ector.parallel.warm"), mock.patch(
+            "ector.parallel.extract_many", side_effect=_echo_many
+        ):
+            engine = ParallelExtractor(processes=1, chunk_size=2)
+            got = list(engine.map(["a", "b", "c"]))
+            engine.close()
+        self.assertIsNone(engine._pool)
+        self.assertEqual([r["text"] for r in got], ["a", "b", "c"])
+
+    def test_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            ParallelExtractor(chunk_size=0)
+
+    def test_matches_serial_extraction(self):
+        texts = [
+            "I want a smartphone for 200 USD.",
+            "",
+            "I only have 150 eur.",
+            "I'm looking for a big TV. I also need a gaming console.",
+        ] * 3
+        with ParallelExtractor(processes=2, chunk_size=2) as engine:
+            got = list(engine.map(texts))
+        self.assertEqual(got, [extract_sync(t) for t in texts])
+
+
+if __name__ == "__main__":
+    unittest.main()
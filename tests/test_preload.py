@@ -0,0 +1,71 @@
+"""Tests for ector.preload (eager warm-up report)."""
+
+import unittest
+from unittest import mock
+
+import spacy
+
+import ector
+import ector.api as api
+import ector.models as models
+
+
+def _blank(name, **kwargs):
+    nlp = spacy.blank(name[:2])
+    nlp.add_pipe("sentencizer")
+    return nlp
+
+
+class TestWarmup(unittest.TestCase):
+    def setUp(self):
+        models.clear_model_cache()
+        self.addCleanup(models.clear_model_cache)
+        api.clear_extract_cache()
+        self.addCleanup(api.clear_extract_cache)
+
+    def test_empty_langs_warm_nothing(self):
+        with mock.patch("ector.models.spacy.load") as load:
+            report = ector.warmup(set())
+        load.assert_not_called()
+        self.assertEqual((report["langs"], report["steps"]), ([], []))
+        self.assertEqual(models.model_info()["models"], {})
+
+    def test_reports_every_step_and_replays_the_corpus(self):
+        corpus = ["I want a laptop", ("je veux un vélo", "fr"), {"text": "a phone", "lang": "en"}]
+        with mock.patch("ector.models.is_package", return_value=True), \
+                mock.patch("ector.models.spacy.load", side_effect=_blank):
+            report = ector.warmup(["en", "fr"], corpus=corpus)
+        self.assertEqual(report["langs"], ["en", "fr"])
+        steps = [(step["lang"], step["step"]) for step in report["steps"]]
+        self.assertEqual(steps[:6], [
+            ("en", "model"), ("en", "catalog_index"), ("en", "attribute_index"),
+            ("en", "normalize_index"), ("en", "attribute_words"), ("en", "token_stopwords"),
+        ])
+        self.assertEqual(steps[-1], (None, "brand_index"))
+        self.assertTrue(all(step["ok"] and step["seconds"] >= 0 for step in report["steps"]))
+        self.assertEqual(report["corpus"]["texts"], 3)
+        self.assertEqual(report["corpus"]["errors"], 0)
+        self.assertIn("en_core_web_sm", models.model_info()["models"])
+        self.assertEqual(api.extract_cache_info()["size"], 3)
+
+    def test_missing_model_is_reported_unless_strict(self):
+        with mock.patch("ector.models.is_package", return_value=False):
+            report = ector.warmup(["en"], corpus=["I want a laptop"])
+            model = report["steps"][0]
+            self.assertEqual((model["step"], model["ok"]), ("model", False))
+            self.assertIn("en_core_web_sm", model["error"])
+            self.assertTrue(all(step["ok"] for step in report["steps"][1:]))
+            self.assertEqual(report["corpus"]["errors"], 1)
+            with self.assertRaises(OSError):
+                ector.warmup(["en"], strict=True)
+
+    def test_rules_mode_needs_no_model(self):
+        with mock.patch("ector.models.ModelManager.get", side_effect=OSError("no model")):
+            report = ector.warmup(["en"], corpus=["a phone"], mode="rules")
+        self.assertEqual(report["steps"][0]["step"], "blank_model")
+        self.assertTrue(all(step["ok"] for step in report["steps"]))
+        self.assertEqual(report["corpus"]["errors"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+"""Tests for ector.profiles (pipeline profiles)."""
+
+import os
+import unittest
+from unittest import mock
+
+import spacy
+
+import ector.models as models
+from ector import extract_sync
+from ector.profiles import PROFILES, configure_pipeline, resolve_profile
+
+
+class TestResolveProfile(unittest.TestCase):
+    def test_env_selects_default(self):
+        with mock.patch.dict(os.environ, {"ECTOR_PROFILE": "fast"}):
+            self.assertEqual(resolve_profile(None), "fast")
+        with mock.patch.dict(os.environ, {"ECTOR_PROFILE": ""}):
+            self.assertEqual(resolve_profile(None), "accurate")
+
+    def test_unknown_profile_rejected(self):
+        with self.assertRaises(ValueError):
+            resolve_profile("turbo")
+        with self.assertRaises(ValueError):
+            extract_sync("a phone", profile="turbo")
+
+
+class TestConfigurePipeline(unittest.TestCase):
+    def test_minimal_adds_rule_based_stand_ins(self):
+        nlp = configure_pipeline(spacy.blank("en"), PROFILES["minimal"])
+        self.assertEqual(nlp.pipe_names, ["sentencizer", "ector_lookup_lemmatizer"])
+        doc = nlp("The price is 20 usd. Phones are cheap")
+        self.assertEqual(len(list(doc.sents)), 2)
+        self.assertEqual([t.lemma_ for t in doc][:3], ["the", "price", "be"])
+
+    def test_french_lemma_table(self):
+        nlp = configure_pipeline(spacy.blank("fr"), PROFILES["fast"])
+        self.assertEqual(nlp("il coûte")[1].lemma_, "coûter")
+
+    def test_accurate_adds_nothing(self):
+        nlp = configure_pipeline(spacy.blank("en"), PROFILES["accurate"])
+        self.assertEqual(nlp.pipe_names, [])
+
+
+class TestProfileLoading(unittest.TestCase):
+    def setUp(self):
+        models.clear_model_cache()
+        self.addCleanup(models.clear_model_cache)
+
+    def test_each_profile_is_loaded_separately(self):
+        with mock.patch("ector.models.is_package", return_value=True), mock.patch(
+            "ector.models.spacy.load", side_effect=lambda name, **kw: spacy.blank("en")
+        ) as load:
+            accurate = models.get_model("en_core_web_sm")
+            minimal = models.get_model("en_core_web_sm", "minimal")
+            self.assertIs(models.get_model("en_core_web_sm", "minimal"), minimal)
+        self.assertIsNot(accurate, minimal)
+        excludes = [call.kwargs["exclude"] for call in load.call_args_list]
+        self.assertEqual(excludes, [["ner"], ["ner", "lemmatizer", "parser"]])
+        self.assertEqual(
+            models.get_model_manager().loaded(),
+            ["en_core_web_sm", "en_core_web_sm:minimal"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
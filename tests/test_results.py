@@ -0,0 +1,69 @@
+"""Tests for the copy-free result representations."""
+
+import json
+import unittest
+from types import MappingProxyType
+
+from ector import extract_sync
+from ector.results import CachedResult, freeze, render, thaw, to_json_bytes
+
+SAMPLE = {
+    "products": [{"product": "Phone", "attributes": ["red"], "price": 9.5}],
+    "budget": {"price": 300.0, "currency": "eur"},
+    "intent": "buy",
+}
+
+
+class TestFreeze(unittest.TestCase):
+    def test_frozen_is_read_only(self):
+        view = freeze(SAMPLE)
+        self.assertIsInstance(view, MappingProxyType)
+        self.assertIsInstance(view["products"], tuple)
+        with self.assertRaises(TypeError):
+            view["intent"] = "browse"
+        with self.assertRaises(TypeError):
+            view["products"][0]["product"] = "Tablet"
+
+    def test_thaw_round_trip(self):
+        self.assertEqual(thaw(freeze(SAMPLE)), SAMPLE)
+
+    def test_json_bytes(self):
+        self.assertEqual(json.loads(to_json_bytes(freeze(SAMPLE))), SAMPLE)
+        self.assertIn("é".encode(), to_json_bytes({"products": [{"product": "Vélo"}]}))
+
+
+class TestCachedResult(unittest.TestCase):
+    def test_dict_mode_copies(self):
+        entry = CachedResult(thaw(SAMPLE))
+        first = entry.get("dict")
+        first["products"].clear()
+        self.assertEqual(entry.get("dict"), SAMPLE)
+
+    def test_frozen_and_json_are_rendered_once(self):
+        entry = CachedResult(thaw(SAMPLE))
+        self.assertIs(entry.get("frozen"), entry.get("frozen"))
+        self.assertIs(entry.get("json"), entry.get("json"))
+
+    def test_render_dict_passthrough(self):
+        value = thaw(SAMPLE)
+        self.assertIs(render(value, "dict"), value)
+
+
+class TestExtractResultMode(unittest.TestCase):
+    def test_empty_input_modes(self):
+        self.assertEqual(extract_sync("", result_mode="json"), b'{"products":[],"intent":"browse"}')
+        self.assertEqual(thaw(extract_sync(" ", result_mode="frozen")), extract_sync(" "))
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            extract_sync("a phone", result_mode="yaml")
+
+    def test_modes_agree(self):
+        text = "I want a smartphone for 200 USD. my budget is 500 usd"
+        as_dict = extract_sync(text)
+        self.assertEqual(thaw(extract_sync(text, result_mode="frozen")), as_dict)
+        self.assertEqual(json.loads(extract_sync(text, result_mode="json")), as_dict)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+"""Tests for ector.shallow (tokenizer-only tier); no trained model needed."""
+
+import unittest
+
+import spacy
+
+from ector.languages import get_language
+from ector.products import extract_products_fallback
+from ector.shallow import TierStats, ambiguity, annotate
+
+
+class TestShallowTier(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.config = get_language("en")
+        cls.nlp = spacy.blank("en")
+
+    def doc(self, text):
+        return annotate(self.nlp.make_doc(text), self.config)
+
+    def test_annotate_tags_function_words(self):
+        doc = self.doc("I want a phone for 200 usd")
+        self.assertEqual([t.pos_ for t in doc], ["PRON", "NOUN", "DET", "NOUN", "ADP", "NUM", "NOUN"])
+        self.assertEqual(doc[0].lemma_, "i")
+
+    def test_fallback_runs_on_annotated_doc(self):
+        doc = self.doc("I want a red phone and a laptop for 300 eur")
+        names = [item["name"] for item in extract_products_fallback(doc, self.config)]
+        self.assertEqual(names, ["red phone", "laptop"])
+
+    def test_unambiguous_clause(self):
+        self.assertIsNone(ambiguity(self.doc("I need 2 laptops and a mouse for 40 usd"), self.config))
+
+    def test_escalation_reasons(self):
+        self.assertEqual(ambiguity(self.doc("I want a phone for 250"), self.config), "bare_number")
+        self.assertEqual(ambiguity(self.doc("iphone 13 please"), self.config), "bare_number")
+        self.assertEqual(ambiguity(self.doc("I want a zorblax"), self.config), "unknown_word")
+
+
+class TestTierStats(unittest.TestCase):
+    def test_estimates_saved_time(self):
+        stats = TierStats()
+        self.assertIsNone(stats.snapshot()["estimated_saved_seconds"])
+        stats.record_fast(0.001)
+        stats.record_fast(0.001)
+        stats.record_escalation("unknown_word", 0.001, 0.010)
+        snap = stats.snapshot()
+        self.assertEqual((snap["fast"], snap["escalated"]), (2, 1))
+        self.assertEqual(snap["escalation_reasons"], {"unknown_word": 1})
+        self.assertAlmostEqual(snap["estimated_saved_seconds"], 0.018)
+        stats.reset()
+        self.assertEqual(stats.snapshot()["requests"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
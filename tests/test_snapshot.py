@@ -0,0 +1,88 @@
+"""Tests for ector.snapshot (pre-serialized pipelines)."""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import spacy
+
+import ector.models as models
+import ector.snapshot as snapshot
+from ector.snapshot import SNAPSHOT_ENV, build_snapshot, load_pipeline, read_manifest
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        models.clear_model_cache()
+        self.addCleanup(models.clear_model_cache)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "ector.snapshot")
+        patcher = mock.patch("ector.models.is_package", return_value=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _build(self, **kwargs):
+        with mock.patch(
+            "ector.models.spacy.load", side_effect=lambda name, **kw: spacy.blank(name[:2])
+        ):
+            return build_snapshot(self.path, **kwargs)
+
+    def test_pipelines_are_rebuilt_without_spacy_load(self):
+        manifest = self._build(langs=["en", "fr"], profiles=["accurate", "minimal"])
+        self.assertEqual(
+            sorted(manifest["pipelines"]),
+            ["en_core_web_sm", "en_core_web_sm:minimal",
+             "fr_core_news_sm", "fr_core_news_sm:minimal"],
+        )
+        self.assertEqual(read_manifest(self.path), manifest)
+        with mock.patch.dict(os.environ, {SNAPSHOT_ENV: self.path}), \
+                mock.patch("ector.models.spacy.load") as load:
+            nlp = models.get_model("en_core_web_sm", "minimal")
+            french = models.get_model("fr_core_news_sm")
+        load.assert_not_called()
+        self.assertEqual(nlp.pipe_names, ["sentencizer", "ector_lookup_lemmatizer"])
+        self.assertEqual(nlp("it is")[1].lemma_, "be")
+        self.assertEqual(french.lang, "fr")
+
+    def test_index_is_parsed_once_per_file_version(self):
+        self._build(langs=["en"], profiles=["accurate", "minimal"])
+        with mock.patch.dict(os.environ, {SNAPSHOT_ENV: self.path}), \
+                mock.patch("ector.snapshot._read_index", wraps=snapshot._read_index) as read:
+            models.get_model("en_core_web_sm")
+            models.get_model("en_core_web_sm", "minimal")
+            self.assertEqual(read.call_count, 1)
+            self._build(langs=["en"])
+            self.assertIsNotNone(load_pipeline(self.path, "en_core_web_sm"))
+        self.assertEqual(read.call_count, 2)
+
+    def test_loads_keep_no_pipeline_bytes(self):
+        self._build(langs=["en"], profiles=["accurate", "minimal"])
+        with mock.patch("ector.snapshot._read_blob", wraps=snapshot._read_blob) as read:
+            load_pipeline(self.path, "en_core_web_sm")
+            load_pipeline(self.path, "en_core_web_sm:minimal")
+        stat = os.stat(self.path)
+        index = snapshot._cached_index(self.path, stat.st_mtime_ns, stat.st_size)
+        # Each load read only its own pipeline, and the cached index holds no bytes.
+        self.assertEqual(
+            [call.args[2] for call in read.call_args_list],
+            [index["pipelines"][key]["length"] for key in ("en_core_web_sm", "en_core_web_sm:minimal")],
+        )
+        self.assertFalse(any(
+            isinstance(value, bytes)
+            for entry in index["pipelines"].values() for value in entry.values()
+        ))
+
+    def test_missing_pipeline_or_other_spacy_version_falls_back(self):
+        with mock.patch.object(spacy, "__version__", "0.0.1"):
+            self._build(langs=["en"])
+        sentinel = object()
+        with mock.patch.dict(os.environ, {SNAPSHOT_ENV: self.path}), \
+                mock.patch("ector.models.spacy.load", return_value=sentinel), \
+                self.assertLogs("ector.snapshot", "WARNING"):
+            self.assertIs(models.get_model("en_core_web_sm"), sentinel)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+"""Tests for ector.span_model (the "span" profile's trained product spans)."""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import spacy
+from spacy.tokens import Span
+
+import ector.api as api
+import ector.models as models
+from ector.doc_cache import _namespace
+from ector.languages import get_language
+from ector.span_model import (
+    SPAN_COMPONENT,
+    SPAN_LABEL,
+    SPANS_KEY,
+    configure_span_model,
+    sentence_spans,
+    span_model_path,
+    span_quantity,
+    training_doc,
+)
+
+
+def _sentences():
+    nlp = spacy.blank("en")
+    nlp.add_pipe("sentencizer")
+    return nlp
+
+
+class TestTrainingDoc(unittest.TestCase):
+    def test_heads_aligned_with_typos_and_attributes(self):
+        nlp = spacy.blank("en")
+        doc = training_doc(
+            nlp, "i want a wireless smartphne and a laptop", ["smartphone", "laptop"],
+            get_language("en"),
+        )
+        spans = [(span.text, span.label_) for span in doc.spans[SPANS_KEY]]
+        self.assertEqual(spans, [("wireless smartphne", SPAN_LABEL), ("laptop", SPAN_LABEL)])
+
+    def test_unaligned_case_is_skipped(self):
+        nlp = spacy.blank("en")
+        self.assertIsNone(training_doc(nlp, "i want a bike", ["laptop"], get_language("en")))
+
+
+class TestSentenceSpans(unittest.TestCase):
+    def test_no_span_model_means_none(self):
+        doc = _sentences()("I want a laptop")
+        self.assertIsNone(sentence_spans(next(doc.sents)))
+
+    def test_longest_of_overlapping_spans_per_sentence(self):
+        doc = _sentences()("I want 2 wireless phones. And a laptop")
+        doc.spans[SPANS_KEY] = [
+            Span(doc, 3, 5, SPAN_LABEL), Span(doc, 4, 5, SPAN_LABEL), Span(doc, 8, 9, SPAN_LABEL),
+        ]
+        first, second = doc.sents
+        self.assertEqual([span.text for span in sentence_spans(first)], ["wireless phones"])
+        self.assertEqual([span.text for span in sentence_spans(second)], ["laptop"])
+        self.assertEqual(span_quantity(sentence_spans(first)[0]), 2)
+        self.assertIsNone(span_quantity(sentence_spans(second)[0]))
+
+    def test_products_come_from_the_spans(self):
+        doc = _sentences()("I want 2 wireless phones and a laptop")
+        doc.spans[SPANS_KEY] = [Span(doc, 3, 5, SPAN_LABEL), Span(doc, 7, 8, SPAN_LABEL)]
+        (record,) = api._doc_records(doc, get_language("en"))
+        self.assertEqual(record["products"], [
+            {"product": "Wireless phones", "quantity": 2, "attributes": ["wireless"]},
+            {"product": "Laptop"},
+        ])
+
+
+class TestSpanProfile(unittest.TestCase):
+    def setUp(self):
+        models.clear_model_cache()
+        self.addCleanup(models.clear_model_cache)
+        self.addCleanup(configure_span_model, "en", None)
+
+    def _trained(self, directory):
+        nlp = spacy.blank("en")
+        nlp.add_pipe("spancat", config={"spans_key": SPANS_KEY}).add_label(SPAN_LABEL)
+        nlp.initialize()
+        nlp.meta.update(name="ector_products_en", version="0.1.0")
+        nlp.to_disk(directory)
+
+    def test_loads_the_span_categorizer_without_the_parser(self):
+        real_load = spacy.load
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "span-en")
+            self._trained(path)
+            configure_span_model("en", path)
+            with mock.patch("ector.models.is_package", return_value=True), mock.patch(
+                "ector.models.spacy.load",
+                side_effect=lambda name, **kw: real_load(name) if name == path else spacy.blank("en"),
+            ) as load:
+                nlp = models.get_model("en_core_web_sm", "span")
+                api.extract_sync("I want a laptop", profile="span")
+        self.assertEqual(load.call_args_list[0].kwargs["exclude"], ["ner", "lemmatizer", "parser"])
+        self.assertEqual(nlp.pipe_names, ["sentencizer", "ector_lookup_lemmatizer", SPAN_COMPONENT])
+        self.assertIn(SPANS_KEY, nlp("I want a laptop").spans)
+        self.assertTrue(_namespace(nlp, "span").endswith("-span-ector_products_en-0.1.0"))
+
+    def test_missing_span_model_is_an_os_error(self):
+        with mock.patch.dict(os.environ, {"ECTOR_SPAN_MODEL_EN": ""}):
+            self.assertIsNone(span_model_path("en"))
+            with mock.patch("ector.models.is_package", return_value=True), mock.patch(
+                "ector.models.spacy.load", side_effect=lambda name, **kw: spacy.blank("en")
+            ), self.assertRaisesRegex(OSError, "ECTOR_SPAN_MODEL_EN"):
+                models.get_model("en_core_web_sm", "span")
+        with mock.patch.dict(os.environ, {"ECTOR_SPAN_MODEL_EN": "/models/span-en"}):
+            self.assertEqual(span_model_path("en"), "/models/span-en")
+
+
+if __name__ == "__main__":
+    unittest.main()
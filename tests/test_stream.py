@@ -0,0 +1,94 @@
+"""Tests for ector.stream (long-document streaming)."""
+
+import io
+import unittest
+from unittest import mock
+
+from ector.api import _assembled_items, extract_sync
+from ector.languages import get_language
+from ector.stream import extract_stream, iter_windows
+
+
+def _record(text, price=None, currency=None, products=(), trigger=False, budget=False):
+    return {
+        "text": text,
+        "price": price,
+        "currency": currency,
+        "has_trigger": trigger,
+        "has_product_tokens": bool(products),
+        "is_budget": budget,
+        "products": [{"product": name} for name in products],
+    }
+
+
+class TestWindows(unittest.TestCase):
+    def test_cuts_at_clause_boundaries(self):
+        text = "I need a phone. and a laptop, 300 usd\nthanks"
+        windows = list(iter_windows(text, window_chars=20))
+        self.assertEqual("".join(windows), text)
+        self.assertTrue(all(len(w) <= 20 for w in windows))
+        self.assertEqual(windows[0], "I need a phone.")
+
+    def test_accepts_file_objects_and_chunk_iterables(self):
+        text = "a phone. " * 50
+        expected = list(iter_windows(text, 64))
+        self.assertEqual(list(iter_windows(io.StringIO(text), 64)), expected)
+        self.assertEqual(list(iter_windows(iter(text.split(" ")), 64)), list(
+            iter_windows(text.replace(" ", ""), 64)
+        ))
+
+    def test_hard_cut_without_boundary(self):
+        self.assertEqual(list(iter_windows("x" * 10, 4)), ["xxxx", "xxxx", "xx"])
+
+
+class TestStreamingAssembly(unittest.TestCase):
+    def test_price_tail_lends_across_records_lazily(self):
+        config = get_language("en")
+        records = iter([
+            _record("I want a laptop", products=["Laptop"], trigger=True),
+            _record("300 usd", price=300.0, currency="usd"),
+            _record("my budget is", budget=True),
+            _record("900 eur", price=900.0, currency="eur"),
+        ])
+        items = list(_assembled_items(records, config))
+        self.assertEqual(items, [
+            ("product", {"product": "Laptop", "price": 300.0, "currency": "usd"}),
+            ("budget", {"price": 900.0, "currency": "eur"}),
+        ])
+
+    def test_rejects_bad_window_size(self):
+        with self.assertRaises(ValueError):
+            extract_stream("a phone", window_chars=0)
+
+    def test_rejects_bad_mode_or_fields(self):
+        with self.assertRaises(ValueError):
+            extract_stream("a phone", mode="fast")
+        with self.assertRaises(ValueError):
+            extract_stream("a phone", fields=["colour"])
+
+
+class TestExtractStream(unittest.TestCase):
+    TEXT = (
+        "Hello, I'm looking for a gaming laptop. I also need a wireless mouse, "
+        "40 usd. My budget is 1500 USD. Thanks!"
+    )
+
+    def test_matches_single_pass_on_short_text(self):
+        self.assertEqual(extract_stream(self.TEXT).result(), extract_sync(self.TEXT))
+
+    def test_rules_mode_and_fields_match_single_pass_without_a_model(self):
+        fields = ["products.product", "budget"]
+        with mock.patch("ector.models.ModelManager.get", side_effect=OSError("no model")):
+            streamed = extract_stream(self.TEXT, mode="rules", fields=fields)
+            self.assertEqual(streamed.result(), extract_sync(self.TEXT, mode="rules", fields=fields))
+        self.assertEqual(streamed.summary(), {"budget": {"price": 1500.0, "currency": "usd"}})
+
+    def test_small_windows_keep_products_and_budget(self):
+        stream = extract_stream(self.TEXT, window_chars=30)
+        products = list(stream)
+        self.assertEqual(len(products), len(extract_sync(self.TEXT)["products"]))
+        self.assertEqual(stream.summary()["budget"]["price"], 1500.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
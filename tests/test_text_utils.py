@@ -2,7 +2,7 @@
 
 import unittest
 
-from ector.text_utils import clean_phrase, normalize_text
+from ector.text_utils import clean_phrase, normalize_text, split_clauses
 
 
 class TestNormalizeText(unittest.TestCase):
@@ -51,5 +51,17 @@ class TestCleanPhrase(unittest.TestCase):
         self.assertEqual(clean_phrase("", []), "")
 
 
+class TestSplitClauses(unittest.TestCase):
+    def test_splits_normalized_clauses(self):
+        text = normalize_text("hi, I need a charger; budget 9.99 usd")
+        self.assertEqual(split_clauses(text), ["hi.", "I need a charger.", "budget 9.99 usd"])
+
+    def test_keeps_numbers_intact(self):
+        self.assertEqual(split_clauses("I want it for 2,000 usd"), ["I want it for 2,000 usd"])
+
+    def test_blank(self):
+        self.assertEqual(split_clauses(""), [])
+
+
 if __name__ == "__main__":
     unittest.main()
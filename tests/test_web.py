@@ -4,7 +4,14 @@ Skipped automatically if FastAPI is not installed (it lives in the optional
 ``web`` extra).
 """
 
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
 import unittest
+import urllib.request
 
 try:
     from fastapi.testclient import TestClient
@@ -30,6 +37,30 @@ class TestWebApp(unittest.TestCase):
         self.assertIn("en", body["languages"])
         self.assertIn("github.com", body["repo"])
         self.assertGreater(body["max_chars"], 0)
+        self.assertIn("hit_ratio", body["cache"]["extract"])
+        self.assertIn("bytes", body["cache"]["extract"])
+        self.assertIn("models_rss_bytes", body["models"])
+
+    def test_stats(self):
+        r = self.client.get("/api/stats")
+        self.assertEqual(r.status_code, 200)
+        body = r.json()
+        self.assertIn("stages", body["instrument"])
+        self.assertIn("fast", body["tiers"])
+        self.assertIn("warmup", body)  # None until the startup hook has run
+
+    def test_extract_rejects_unknown_field(self):
+        r = self.client.post("/api/extract", json={"text": "a phone", "fields": ["colour"]})
+        self.assertEqual(r.status_code, 422)
+
+    def test_extract_accepts_fields(self):
+        r = self.client.post("/api/extract", json={"text": " ", "fields": ["products.product"]})
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(r.json(), {"products": []})
+
+    def test_stream_rejects_unknown_field(self):
+        r = self.client.post("/api/extract/stream", json={"text": "a phone", "fields": ["colour"]})
+        self.assertEqual(r.status_code, 422)
 
     def test_examples(self):
         r = self.client.get("/api/examples")
@@ -86,5 +117,32 @@ class TestWebApp(unittest.TestCase):
         self.assertEqual(r.status_code, 200)
 
 
+@unittest.skipUnless(_HAVE_WEB and hasattr(os, "fork"), "web extra or os.fork unavailable")
+class TestPreforkServer(unittest.TestCase):
+    def test_forked_workers_serve_and_stop_on_sigterm(self):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "web.serve", "--port", str(port), "--workers", "2",
+             "--log-level", "error"],
+            env={**os.environ, "ECTOR_WARM_LANGS": "en"},
+            stderr=subprocess.DEVNULL,
+        )
+        self.addCleanup(proc.kill)
+        deadline = time.monotonic() + 60
+        while True:
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/api/health") as r:
+                    self.assertEqual(r.status, 200)
+                break
+            except OSError:
+                self.assertIsNone(proc.poll())
+                self.assertLess(time.monotonic(), deadline)
+                time.sleep(0.2)
+        proc.send_signal(signal.SIGTERM)
+        self.assertEqual(proc.wait(timeout=30), 0)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -4,11 +4,15 @@ import doctest
 
 import pytest
 
+import ector.fields
 import ector.money
 import ector.products
+import ector.profiles
+import ector.results
 import ector.text_utils
 
-_MODULES = [ector.money, ector.text_utils, ector.products]
+_MODULES = [ector.money, ector.text_utils, ector.products, ector.results, ector.fields,
+            ector.profiles]
 
 
 @pytest.mark.parametrize("module", _MODULES, ids=lambda m: m.__name__)
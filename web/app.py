@@ -14,17 +14,23 @@ ECTOR itself has no web dependencies; FastAPI/uvicorn live in the optional
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
 import os
 
+import srsly
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
 
-from ector import __version__, extract_sync
+from ector import __version__, extract_sync, instrument, warmup
+from ector.api import cascade_stats, clause_cache_info, extract_cache_info, tier_stats
+from ector.fields import parse_fields
 from ector.languages import get_language, supported_languages
-from ector.models import get_model
+from ector.models import get_model, get_model_manager, model_info, model_installed
+from ector.stream import extract_stream
 
 _STATIC_DIR = os.path.join(os.path.dirname(__file__), "static")
 
@@ -33,8 +39,16 @@ REPO_URL = "https://github.com/Sanix-Darker/ector"
 
 # Reject absurdly large payloads to keep the demo responsive.
 MAX_TEXT_CHARS = 5000
+# Long documents go through the streaming endpoint instead.
+MAX_DOCUMENT_CHARS = 1_000_000
 _SUPPORTED_LANGS = frozenset(supported_languages())
 _MODEL_READY: dict[str, bool] = {code: False for code in _SUPPORTED_LANGS}
+# Languages loaded at startup (comma-separated, default all); the others are
+# loaded on first request.
+_WARM_LANGS = frozenset(
+    code.strip().lower()
+    for code in os.environ.get("ECTOR_WARM_LANGS", ",".join(_SUPPORTED_LANGS)).split(",")
+) & _SUPPORTED_LANGS
 _logger = logging.getLogger(__name__)
 
 
@@ -56,21 +70,53 @@ def _resolve_lang(raw_lang: str | None) -> str:
     return candidate if candidate in _SUPPORTED_LANGS else "en"
 
 
+def _warm_corpus() -> list[dict]:
+    """The UI examples plus ``ECTOR_WARM_CORPUS`` (JSONL of ``{text, lang}``)."""
+    corpus = list(EXAMPLES)
+    path = os.environ.get("ECTOR_WARM_CORPUS")
+    if path:
+        corpus.extend(srsly.read_jsonl(path))
+    return [item for item in corpus if item.get("lang", "en") in _WARM_LANGS]
+
+
 @app.on_event("startup")
 def _warm_models() -> None:
-    for code in _SUPPORTED_LANGS:
-        try:
-            get_model(get_language(code).model_name)
-        except OSError as exc:
-            _logger.warning("Model warmup failed for %s: %s", code, exc)
-            _MODEL_READY[code] = False
-        else:
-            _MODEL_READY[code] = True
+    # ``python -m web.serve`` already warmed up in the master before forking.
+    if getattr(app.state, "warmup", None) is not None:
+        return
+    report = warmup(_WARM_LANGS, corpus=_warm_corpus())
+    for step in report["steps"]:
+        if step["step"] == "model":
+            _MODEL_READY[step["lang"]] = step["ok"]
+            if not step["ok"]:
+                _logger.warning("Model warmup failed for %s: %s", step["lang"], step["error"])
+    for code in _SUPPORTED_LANGS - _WARM_LANGS:
+        _MODEL_READY[code] = model_installed(get_language(code).model_name)
+    _logger.info("Warmed up in %.2fs", report["seconds"])
+    app.state.warmup = report
+
+
+async def _sweep_idle_models(interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        get_model_manager().evict_idle()
+
+
+@app.on_event("startup")
+async def _start_model_sweeper() -> None:
+    # Idle models are otherwise only released when another model is requested.
+    timeout = get_model_manager().idle_timeout
+    if timeout:
+        app.state.model_sweeper = asyncio.create_task(_sweep_idle_models(max(1.0, timeout / 2)))
 
 
 class ExtractRequest(BaseModel):
     text: str = Field(default="", description="Free-form shopping request.")
     lang: str = Field(default="en", description="Language code (en|fr).")
+    fields: list[str] | None = Field(
+        default=None,
+        description="Fields to compute, e.g. [\"products.product\", \"budget\"] (default: all).",
+    )
 
 
 class TokenizeRequest(BaseModel):
@@ -164,6 +210,20 @@ def health() -> dict:
         "models_loaded": all(_MODEL_READY.values()),
         "repo": REPO_URL,
         "max_chars": MAX_TEXT_CHARS,
+        "max_document_chars": MAX_DOCUMENT_CHARS,
+        "cache": {"extract": extract_cache_info(), "clause": clause_cache_info()},
+        "models": model_info(),
+    }
+
+
+@app.get("/api/stats")
+def stats() -> dict:
+    """Stage timings (``ECTOR_INSTRUMENT=1``), tier and cascade usage, startup warm-up."""
+    return {
+        "instrument": instrument.snapshot(),
+        "tiers": tier_stats(),
+        "cascade": cascade_stats(),
+        "warmup": getattr(app.state, "warmup", None),
     }
 
 
@@ -177,12 +237,42 @@ def extract_endpoint(req: ExtractRequest) -> JSONResponse:
     lang = _resolve_lang(req.lang)
     text = (req.text or "")[:MAX_TEXT_CHARS]
     try:
-        result = extract_sync(text, lang)
+        fields = parse_fields(req.fields)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    try:
+        result = extract_sync(text, lang, fields=fields)
     except OSError as exc:
         raise HTTPException(status_code=503, detail=str(exc)) from exc
     return JSONResponse(result)
 
 
+@app.post("/api/extract/stream")
+def extract_stream_endpoint(req: ExtractRequest) -> StreamingResponse:
+    """Long-document extraction as NDJSON: one product per line, then a summary.
+
+    Products are sent as soon as they are final (see :mod:`ector.stream`).
+    """
+    lang = _resolve_lang(req.lang)
+    text = (req.text or "")[:MAX_DOCUMENT_CHARS]
+    try:
+        fields = parse_fields(req.fields)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    try:
+        get_model(get_language(lang).model_name)
+    except OSError as exc:
+        raise HTTPException(status_code=503, detail=str(exc)) from exc
+    stream = extract_stream(text, lang, fields=fields)
+
+    def lines():
+        for product in stream:
+            yield json.dumps(product, ensure_ascii=False) + "\n"
+        yield json.dumps(stream.summary(), ensure_ascii=False) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 @app.post("/api/tokenize")
 def tokenize_endpoint(req: TokenizeRequest) -> dict:
     """Return word and spaCy-token counts for the given text.
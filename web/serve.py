@@ -0,0 +1,146 @@
+"""Preforking server: load the models once, then fork uvicorn workers.
+
+``uvicorn --workers N`` starts every worker as a fresh interpreter, so each one
+loads its own copy of the spaCy pipelines and fuzzy indexes. This entry point
+does the gunicorn ``--preload`` dance instead: the master process imports the
+app and runs its startup warm-up (:func:`ector.warmup`: the models and indexes
+of ``ECTOR_WARM_LANGS`` plus the warm corpus). Only then does it freeze the
+heap (``gc.freeze``) and fork ``--workers`` uvicorn servers sharing the
+listening socket. The workers inherit the loaded objects and share their pages
+copy-on-write, so an extra worker costs its private memory, not a model.
+
+Run:
+    python -m web.serve --host 127.0.0.1 --port 8000 --workers 4
+
+``HOST``, ``PORT`` and ``WORKERS`` provide the defaults, as for the uvicorn
+command line in ``deploy/``. The master restarts workers that die and stops
+them all on SIGTERM/SIGINT. ``scripts/bench_workers.py`` reports per-worker
+USS/PSS for this server and for ``uvicorn --workers``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import logging
+import os
+import signal
+import socket
+import time
+
+import uvicorn
+
+logger = logging.getLogger("ector.serve")
+
+# Exit status of a worker whose app failed to start; restarting it would loop.
+_BOOT_ERROR = 3
+_MIN_WORKER_LIFETIME = 1.0
+
+
+def preload() -> None:
+    """Import the app and run its startup warm-up in this process.
+
+    The workers inherit the warm-up report and skip their own.
+    """
+    from web.app import _warm_models
+
+    _warm_models()
+
+
+def bind_socket(host: str, port: int, backlog: int = 2048) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+class PreforkServer:
+    """Fork ``workers`` uvicorn servers on ``sock`` and keep them running."""
+
+    def __init__(self, sock: socket.socket, workers: int, log_level: str = "info"):
+        self.sock = sock
+        self.workers = max(1, workers)
+        self.log_level = log_level
+        self.children: dict[int, float] = {}  # pid -> start time
+        self._stopping = False
+
+    def _spawn(self) -> None:
+        pid = os.fork()
+        if pid:
+            self.children[pid] = time.monotonic()
+            return
+        status = 1
+        try:
+            for sig in (signal.SIGTERM, signal.SIGINT):
+                signal.signal(sig, signal.SIG_DFL)
+            from web.app import app
+
+            config = uvicorn.Config(app, log_level=self.log_level)
+            server = uvicorn.Server(config)
+            server.run(sockets=[self.sock])
+            status = 0 if server.started else _BOOT_ERROR
+        finally:
+            os._exit(status)
+
+    def _stop(self, signum, frame) -> None:
+        self._stopping = True
+        for pid in self.children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def run(self) -> None:
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+        for _ in range(self.workers):
+            self._spawn()
+        logger.info("Forked %d workers: %s", self.workers, sorted(self.children))
+        while self.children:
+            pid, status = os.wait()
+            started = self.children.pop(pid, None)
+            if started is None or self._stopping:
+                continue
+            if os.waitstatus_to_exitcode(status) == _BOOT_ERROR:
+                logger.error("Worker %d failed to boot; shutting down", pid)
+                self._stop(signal.SIGTERM, None)
+                continue
+            logger.warning("Worker %d exited (status %d); restarting", pid, status)
+            if time.monotonic() - started < _MIN_WORKER_LIFETIME:
+                time.sleep(_MIN_WORKER_LIFETIME)
+            self._spawn()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m web.serve",
+        description="Serve the ECTOR web app from workers forked after loading the models.",
+    )
+    parser.add_argument("--host", default=os.environ.get("HOST", "127.0.0.1"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", "8000")))
+    parser.add_argument("--workers", type=int, default=int(os.environ.get("WORKERS", "1")))
+    parser.add_argument("--log-level", default="info")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=args.log_level.upper(), format="%(levelname)s:     %(message)s")
+    sock = bind_socket(args.host, args.port)
+    started = time.perf_counter()
+    preload()
+    # Move the preloaded objects out of the cyclic GC's reach so collections in
+    # the workers do not write to (and un-share) their pages.
+    gc.freeze()
+    logger.info(
+        "Preloaded in %.2fs; serving on %s:%d",
+        time.perf_counter() - started, args.host, sock.getsockname()[1],
+    )
+    PreforkServer(sock, args.workers, args.log_level).run()
+
+
+if __name__ == "__main__":
+    main()